@@ -0,0 +1,304 @@
+"""Generates indirect assignments without the Tk window, for scheduled jobs and scripts.
+
+Examples:
+    python cli.py --shift 04-00-00 --role "Problem Solve=2" --role "Audit=1"
+    python cli.py --date 01-02-2025 --all-shifts --preset refurb.txt --format csv --output assignments.csv
+    python cli.py --batch jobs.json --processes 4 --format json --output report.json
+    python cli.py --all-shifts --preset refurb.txt --export jsonl
+
+A batch file is a JSON list of jobs such as
+    {"site": "SMF9", "date": "01-02-2025", "shifts": ["04-00-00"], "headcounts": {"Audit": 1}}
+where date, shifts ("all" for every saved shift) and headcounts fall back to the command-line options. Jobs are
+grouped by site and each site runs in its own worker process with its own browser profile (or cached rosters),
+rotation history (history/<SITE>-assignments.csv) and timings log (logs/timings-<SITE>.jsonl).
+The browser scraper always opens the roster page in SITE_URL, so a batch covering several sites needs
+KOALITY_ROSTER_BACKEND=http, which asks the roster endpoint for each job's site.
+"""
+import os
+import io
+import csv
+import sys
+import json
+import getpass
+import argparse
+import contextlib
+import multiprocessing
+import datetime as dt
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+import utils
+from main import create_business_logic
+
+PROMPT_LOCK = None  # set in batch worker processes so only one site prompts on the terminal at a time
+
+
+class ConsoleSession:
+    """Stands in for DisplayManager when scraping: holds the driver and prompts for credentials on the terminal."""
+
+    def __init__(self, site, date, shift=None):
+        self.driver = None
+        self.site = site
+        self.date = date
+        self.shift = shift
+
+    def midway_pin(self):
+        """Retrieves midway pin from MIDWAY_PIN or the terminal"""
+        pin = os.getenv("MIDWAY_PIN")
+        if not pin:
+            with PROMPT_LOCK or contextlib.nullcontext():
+                pin = getpass.getpass(f"Midway PIN ({self.site}): ")
+        if not pin:
+            return TypeError
+        return pin
+
+    def security_key(self):
+        """Retrieves one-time password from user's security key via the terminal"""
+        with PROMPT_LOCK or contextlib.nullcontext():
+            return getpass.getpass(f"Press your Security Key ({self.site}): ")
+
+    def report_progress(self, message):
+        """Prints scrape progress to stderr so it stays out of the results."""
+        print(message, file=sys.stderr)
+
+    def close(self):
+        """Quits the driver if one was started."""
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Generate Koality indirect assignments without the GUI.")
+    parser.add_argument("--site", help="site ID (default: the saved site)")
+    parser.add_argument("--date", help="shift date as MM-DD-YYYY (default: tomorrow)")
+    parser.add_argument("--shift", action="append", default=[], help="shift start as HH-MM-00 (repeatable)")
+    parser.add_argument("--all-shifts", action="store_true", help="generate every saved shift")
+    parser.add_argument("--role", action="append", default=[], metavar="ROLE=COUNT",
+                        help="headcount for a role (repeatable)")
+    parser.add_argument("--preset", help="file of ROLE=COUNT lines or a JSON object of role headcounts")
+    parser.add_argument("--format", choices=("text", "json", "csv"), default="text")
+    parser.add_argument("--output", help="file to write results to (default: stdout)")
+    parser.add_argument("--force-refresh", action="store_true", help="ignore cached rosters")
+    parser.add_argument("--workers", type=int, default=4, help="shifts to fetch in parallel")
+    parser.add_argument("--batch", help="JSON file of (site, date, shifts, headcounts) jobs to run together")
+    parser.add_argument("--profile", action="store_true",
+                        help="run under cProfile and save the stats to logs/profiles")
+    parser.add_argument("--export", choices=("csv", "jsonl"),
+                        help="also append results and scraped rosters to the files in exports/")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1,
+                        help="sites to run in parallel in a batch (default: CPU count)")
+    return parser.parse_args(argv)
+
+
+def parse_date(text):
+    """Parses MM-DD-YYYY, defaulting to tomorrow like the main menu."""
+    if not text:
+        tomorrow = dt.datetime.now() + dt.timedelta(days=1)
+        return dt.datetime(tomorrow.year, tomorrow.month, tomorrow.day)
+    return dt.datetime.strptime(text, "%m-%d-%Y")
+
+
+def parse_headcounts(lines):
+    """Parses ROLE=COUNT entries into {role: count}."""
+    headcounts = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        role, _, count = line.rpartition("=")
+        if not role or int(count) < 0:
+            raise ValueError(f"Invalid role headcount: {line!r}")
+        headcounts[role.strip()] = int(count)
+    return headcounts
+
+
+def load_headcounts(args):
+    """Combines the preset file (if any) with --role entries, which take precedence."""
+    headcounts = {}
+    if args.preset:
+        with open(args.preset, "r") as file:
+            text = file.read()
+        if text.lstrip().startswith("{"):
+            headcounts.update({role: int(count) for role, count in json.loads(text).items()})
+        else:
+            headcounts.update(parse_headcounts(text.split("\n")))
+    headcounts.update(parse_headcounts(args.role))
+    return headcounts
+
+
+def generate(business_logic, session, shifts, headcounts, force_refresh=False, workers=4):
+    """Fetches each shift's roster and assigns indirects. Returns one result dict per shift."""
+    pairs = [(session.date, shift) for shift in shifts]
+    rosters = business_logic.get_rosters(session, pairs, workers, force_refresh=force_refresh, site=session.site)
+
+    results = []
+    for date, shift in pairs:
+        roster = rosters.get((date, shift))
+        result = {"site": session.site, "date": date.strftime("%m-%d-%Y"), "shift": shift,
+                  "roster_found": bool(roster), "assignments": [], "shortfalls": []}
+        if roster:
+            assignment_result = business_logic.assign(headcounts, roster, date, shift, site=session.site)
+            result["assignments"] = [{"role": role, "login": login} for role, login in assignment_result.pairs()]
+            result["shortfalls"] = list(assignment_result.shortfalls)
+        results.append(result)
+    return results
+
+
+def load_jobs(path, args):
+    """Reads a batch file, filling in each job's missing date, shifts and headcounts from the command line. Shifts
+    of None mean every saved shift."""
+    with open(path, "r") as file:
+        entries = json.load(file)
+
+    default_headcounts = load_headcounts(args)
+    jobs = []
+    for entry in entries:
+        shifts = entry.get("shifts", entry.get("shift", args.shift or "all"))
+        if shifts == "all":
+            shifts = None
+        elif isinstance(shifts, str):
+            shifts = [shifts]
+
+        headcounts = entry.get("headcounts", default_headcounts)
+        if isinstance(headcounts, list):
+            headcounts = parse_headcounts(headcounts)
+
+        jobs.append({"site": entry["site"].strip().upper(),
+                     "date": parse_date(entry.get("date", args.date)),
+                     "shifts": shifts,
+                     "headcounts": {role: int(count) for role, count in headcounts.items()}})
+    return jobs
+
+
+def group_jobs(jobs):
+    """Groups (index, job) pairs by site so each site logs in once."""
+    groups = {}
+    for index, job in enumerate(jobs):
+        groups.setdefault(job["site"], []).append((index, job))
+    return list(groups.values())
+
+
+def init_batch_worker(prompt_lock):
+    global PROMPT_LOCK
+    PROMPT_LOCK = prompt_lock
+
+
+def run_site_jobs(jobs, force_refresh=False, workers=4, export_format=None):
+    """Batch worker process: runs one site's jobs with one browser session. Returns (index, results) pairs."""
+    pathfinder = utils.FilePath()
+    temp_path, base_path = pathfinder.get_paths()
+    business_logic = create_business_logic(pathfinder, base_path, export_format=export_format,
+                                           worker=jobs[0][1]["site"])
+
+    session = ConsoleSession(jobs[0][1]["site"], None)
+    output = []
+    try:
+        for index, job in jobs:
+            session.date = job["date"]
+            shifts = job["shifts"] or [shift for shift in business_logic.get_shifts().split("\n") if shift]
+            output.append((index, generate(business_logic, session, shifts, job["headcounts"], force_refresh,
+                                           workers)))
+    finally:
+        session.close()
+    return output
+
+
+def run_batch(jobs, processes, force_refresh=False, workers=4, export_format=None):
+    """Runs the jobs one site per worker process and returns every result in job order."""
+    groups = group_jobs(jobs)
+    ordered = [[] for _ in jobs]
+    with ProcessPoolExecutor(max_workers=max(1, min(processes, len(groups))), initializer=init_batch_worker,
+                             initargs=(multiprocessing.Lock(),)) as executor:
+        for output in executor.map(run_site_jobs, groups, repeat(force_refresh), repeat(workers),
+                                   repeat(export_format)):
+            for index, results in output:
+                ordered[index] = results
+    return [result for results in ordered for result in results]
+
+
+def render(results, output_format):
+    """Renders results as text, JSON or CSV."""
+    if output_format == "json":
+        return json.dumps(results, indent=2) + "\n"
+
+    if output_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(["site", "date", "shift", "role", "login", "status"])
+        for result in results:
+            prefix = [result["site"], result["date"], result["shift"]]
+            if not result["roster_found"]:
+                writer.writerow(prefix + ["", "", "roster unavailable"])
+            for assignment in result["assignments"]:
+                writer.writerow(prefix + [assignment["role"], assignment["login"], "assigned"])
+            for role in result["shortfalls"]:
+                writer.writerow(prefix + [role, "", "not enough eligible AAs"])
+        return buffer.getvalue()
+
+    blocks = []
+    for result in results:
+        lines = [f"{result['site']} {result['date']} {result['shift']}"]
+        if not result["roster_found"]:
+            lines.append("Could not retrieve the roster for this shift.")
+        lines += [f"Not enough eligible AAs to fill {role}." for role in result["shortfalls"]]
+        if result["shortfalls"]:
+            lines.append("")
+        lines += [f"{assignment['role']}: {assignment['login']}" for assignment in result["assignments"]]
+        blocks.append("\n".join(lines) + "\n")
+    return "\n".join(blocks)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    pathfinder = utils.FilePath()
+    temp_path, base_path = pathfinder.get_paths()
+    pathfinder.app_init(temp_path, base_path)
+
+    if args.batch:
+        jobs = load_jobs(args.batch, args)
+        if not all(any(job["headcounts"].values()) for job in jobs):
+            sys.exit("Every batch job needs at least one role headcount greater than 0.")
+        if len({job["site"] for job in jobs}) > 1 and os.getenv("KOALITY_ROSTER_BACKEND") != "http":
+            sys.exit("The browser scraper only reads the site in SITE_URL. Set KOALITY_ROSTER_BACKEND=http to run a "
+                     "batch covering several sites.")
+        results = run_batch(jobs, args.processes, args.force_refresh, args.workers, args.export)
+        return write_output(render(results, args.format), args.output, results)
+
+    business_logic = create_business_logic(pathfinder, base_path, profile=args.profile, export_format=args.export)
+
+    headcounts = load_headcounts(args)
+    if not any(headcounts.values()):
+        sys.exit("Please give at least one role headcount greater than 0 (--role or --preset).")
+
+    shifts = args.shift or []
+    if args.all_shifts:
+        shifts += [shift for shift in business_logic.get_shifts().split("\n") if shift and shift not in shifts]
+    if not shifts:
+        sys.exit("Please give at least one --shift or use --all-shifts.")
+
+    site = (args.site or business_logic.get_site()).strip().upper()
+    session = ConsoleSession(site, parse_date(args.date))
+    try:
+        with business_logic.generate_run():
+            results = generate(business_logic, session, shifts, headcounts, args.force_refresh, args.workers)
+    finally:
+        session.close()
+
+    return write_output(render(results, args.format), args.output, results)
+
+
+def write_output(output, path, results):
+    """Writes rendered results to a file or stdout. Returns the exit code: 1 if any roster couldn't be fetched."""
+    if path:
+        with open(path, "w", newline="") as file:
+            file.write(output)
+    else:
+        sys.stdout.write(output)
+
+    return 0 if all(result["roster_found"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
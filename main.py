@@ -1,3 +1,5 @@
+import os
+import sys
 import utils
 import managers
 
@@ -14,18 +16,76 @@ def main():
                   "smile_logo": smile_logo,
                   "koala_logo": koala_logo}
 
-    assignment_manager = managers.AssignmentManager(pathfinder)
-    permissions_manager = managers.PermissionsManager(pathfinder)
-    customization_manager = managers.CustomizationManager(pathfinder)
-    schedule_finder = utils.ScheduleFinder()
+    business_logic = create_business_logic(pathfinder, base_path, profile="--profile" in sys.argv[1:])
 
-    business_logic = utils.ScheduleBusinessLogic(assignment_manager,
-                                                 permissions_manager,
-                                                 customization_manager,
-                                                 schedule_finder,
-                                                 pathfinder)
+    managers.DisplayManager(paths_dict, business_logic).run()
 
-    managers.DisplayManager(paths_dict, business_logic)
+
+def create_business_logic(pathfinder, base_path, profile=False, export_format=None, worker=None):
+    """Wires the managers and schedule finder together. Shared by the GUI and the command-line entry point.
+
+    Step timings go to logs/timings.jsonl. With profile (or KOALITY_PROFILE set), each Generate is also run under
+    cProfile and dumped to logs/profiles. With export_format (or KOALITY_EXPORT set to "csv" or "jsonl"), every
+    assignment result and scraped roster is appended to the files in exports/; otherwise results are only exported
+    on request, as CSV. Batch workers running side by side pass their site as worker and get their own browser
+    profile, rotation history and timings log, since Chrome won't open a profile another browser has locked and the
+    history compaction and log rotation aren't safe across processes."""
+    suffix = f"-{worker.strip().upper()}" if worker else ""
+    logs_dir = pathfinder.get_data_dir(base_path, "logs")
+    utils.instrumentation.recorder.configure(os.path.join(logs_dir, f"timings{suffix}.jsonl"))
+    profile_dir = os.path.join(logs_dir, "profiles") if profile or os.getenv("KOALITY_PROFILE") else None
+
+    config_store = utils.ConfigStore(pathfinder, base_path)
+    eligibility_index = create_eligibility_index(pathfinder, base_path)
+    history_name = f"{worker.strip().upper()}-assignments.csv" if worker else "assignments.csv"
+    rotation_history = utils.RotationHistory(os.path.join(pathfinder.get_data_dir(base_path, "history"),
+                                                          history_name))
+    assignment_manager = managers.AssignmentManager(pathfinder, engine="matching",
+                                                    eligibility_index=eligibility_index,
+                                                    rotation_history=rotation_history)
+    permissions_manager = managers.PermissionsManager(pathfinder, eligibility_index=eligibility_index,
+                                                      config_store=config_store)
+    customization_manager = managers.CustomizationManager(pathfinder, config_store=config_store)
+
+    export_format = export_format or os.getenv("KOALITY_EXPORT")
+    exporter = utils.Exporter(pathfinder.get_data_dir(base_path, "exports"), export_format or "csv")
+    roster_exporter = exporter if export_format else None
+    schedule_finder = utils.LazyScheduleFinder(lambda: create_schedule_finder(pathfinder, base_path,
+                                                                              roster_exporter,
+                                                                              f"chrome_profile{suffix}"))
+
+    return utils.ScheduleBusinessLogic(assignment_manager,
+                                       permissions_manager,
+                                       customization_manager,
+                                       schedule_finder,
+                                       pathfinder,
+                                       utils.RosterCache(pathfinder.get_data_dir(base_path, "cache")),
+                                       rotation_history,
+                                       profile_dir,
+                                       exporter,
+                                       auto_export=bool(export_format))
+
+
+def create_eligibility_index(pathfinder, base_path):
+    """Builds the permissions backend picked by KOALITY_PERMISSIONS_BACKEND: the txt files by default, or a SQLite
+    database (seeded from the txt files) when set to "sqlite"."""
+    if os.getenv("KOALITY_PERMISSIONS_BACKEND") == "sqlite":
+        return utils.PermissionsDatabase.open(pathfinder, base_path)
+    return utils.EligibilityIndex(pathfinder)
+
+
+def create_schedule_finder(pathfinder, base_path, exporter=None, profile_name="chrome_profile"):
+    """Builds the schedule finder picked by KOALITY_ROSTER_BACKEND. Called on the first scrape. Scraped rosters are
+    streamed to the exporter when one is given, and a browser kept open between scrapes is probed every minute. The
+    roster table is read incrementally so grids that only render the rows in view come back whole."""
+    session_file = os.path.join(pathfinder.get_data_dir(base_path, "session"), "cookies.json")
+    session_store = utils.SessionStore(session_file)
+    schedule_finder = utils.ScheduleFinder(profile_dir=pathfinder.get_data_dir(base_path, profile_name),
+                                           session_store=session_store, exporter=exporter,
+                                           watchdog_interval=60, incremental=True)
+    if os.getenv("KOALITY_ROSTER_BACKEND") == "http":
+        schedule_finder = utils.HttpScheduleFinder(schedule_finder, session_store, exporter=exporter)
+    return schedule_finder
 
 
 if __name__ == "__main__":
@@ -1,6 +1,13 @@
 from .assignment_manager import AssignmentManager
 from .permissions_manager import PermissionsManager
 from .customization_manager import CustomizationManager
-from .display_manager import DisplayManager
 
 __all__ = ["AssignmentManager", "PermissionsManager", "CustomizationManager", "DisplayManager"]
+
+
+def __getattr__(name):
+    # DisplayManager pulls in tkinter, so it is only imported when the GUI actually asks for it
+    if name == "DisplayManager":
+        from .display_manager import DisplayManager
+        return DisplayManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,37 +1,100 @@
 import random
+import datetime as dt
+from utils.instrumentation import timed
 from utils.interfaces import AssignmentManagerInterface, FilePathInterface
+from utils.role_matcher import RoleMatcher
+from utils.assignment_result import AssignmentResult
 
 
 class AssignmentManager(AssignmentManagerInterface):
-    def __init__(self, pathfinder: FilePathInterface):
+    def __init__(self, pathfinder: FilePathInterface, engine="greedy", eligibility_index=None,
+                 rotation_history=None):
         self.pathfinder = pathfinder
+        self.engine = engine
+        self.eligibility_index = eligibility_index
+        self.rotation_history = rotation_history
+        self.matcher = RoleMatcher()
+
+    def assign_indirects(self, nums_dict, scheduled_associates, base_path, date=None):
+        """Assigns indirect roles based on user's inputs on main menu. Returns the (result_string,
+        not_enough_string) text of assign."""
+        return self.assign(nums_dict, scheduled_associates, base_path, date).text()
+
+    @timed
+    def assign(self, nums_dict, scheduled_associates, base_path, date=None):
+        """Assigns indirect roles and returns an AssignmentResult. With a rotation history, associates who did a
+        role least recently before the shift's date are picked first."""
+        date = date or dt.date.today()
+        if self.engine == "matching":
+            return self.assign_matching(nums_dict, scheduled_associates, base_path, date)
 
-    def assign_indirects(self, nums_dict, scheduled_associates, base_path):
-        """Assigns indirect roles based on user's inputs on main menu."""
         nums_list = self.get_nonzero_keys(nums_dict)
         random.shuffle(nums_list)
 
-        result_string = ""
-        not_enough_string = ""
+        result = AssignmentResult()
         chosen_associates = set()
+        slot = 0
 
+        for key in nums_list:
+            trained_associates = self.rank_by_history(key, self.get_trained_associates(key, base_path), date)
+            trained_associates.reverse()  # associates are popped from the end
+            chosen = self.assign_roles_to_associates(key, nums_dict[key], trained_associates, scheduled_associates,
+                                                     chosen_associates)
+
+            for n, choice in enumerate(chosen):
+                result.add(key, choice, slot + n)
+            if len(chosen) < nums_dict[key]:
+                result.shortfalls[key] = nums_dict[key] - len(chosen)
+            slot += nums_dict[key]
+
+        return result
+
+    def assign_matching(self, nums_dict, scheduled_associates, base_path, date=None):
+        """Assigns indirect roles with a maximum matching so no role is left short while a full assignment exists."""
+        nums_list = self.get_nonzero_keys(nums_dict)
+        random.shuffle(nums_list)
+
+        scheduled_associates = set(scheduled_associates)
+        eligible = {}
         for key in nums_list:
             trained_associates = self.get_trained_associates(key, base_path)
-            result, not_enough = self.assign_roles_to_associates(key, nums_dict[key],
-                                                                 trained_associates, scheduled_associates,
-                                                                 chosen_associates)
+            eligible[key] = self.rank_by_history(key, [associate for associate in dict.fromkeys(trained_associates)
+                                                       if associate in scheduled_associates], date)
+
+        slots = [key for key in nums_list for _ in range(nums_dict[key])]
+        matching = self.matcher.match(slots, eligible, ranked=self.rotation_history is not None)
+
+        result = AssignmentResult()
+        filled = dict.fromkeys(nums_list, 0)
+        for slot, associate in sorted(matching.items()):
+            result.add(slots[slot], associate, slot)
+            filled[slots[slot]] += 1
+        for key in nums_list:
+            if filled[key] < nums_dict[key]:
+                result.shortfalls[key] = nums_dict[key] - filled[key]
 
-            result_string += result
-            not_enough_string += not_enough
+        return result
 
-        return result_string, not_enough_string
+    def rank_by_history(self, key, associates, date):
+        """Orders associates least-recently-assigned to the role first: fewest times in the history window, then the
+        oldest last assignment. The incoming shuffled order breaks ties. Without a history the order is unchanged."""
+        if not self.rotation_history:
+            return associates
+        date = date or dt.date.today()
+        return sorted(associates, key=lambda associate: self.rotation_history.recency(associate, key, date))
 
     def get_nonzero_keys(self, nums_dict):
         """Returns the keys from nums_dict that have non-zero values."""
         return [key for key, val in nums_dict.items() if val != 0]
 
+    @timed
     def get_trained_associates(self, key, base_path):
         """Retrieve and shuffle the list of trained associates from a file."""
+        if self.eligibility_index:
+            trained_associates = list(self.eligibility_index.logins_for_role(key, base_path))
+            random.shuffle(trained_associates)
+            return trained_associates
+
         with open(self.pathfinder.get_custom_text(base_path, key)) as file:
             trained_associates = file.read().split("\n")
             trained_associates = [associate for associate in trained_associates if associate]  # Remove empty lines
@@ -39,29 +102,12 @@ class AssignmentManager(AssignmentManagerInterface):
             return trained_associates
 
     def assign_roles_to_associates(self, key, nums_roles, trained_associates, scheduled_associates, chosen_associates):
-        """Assign available trained associates to specific roles."""
-        result = ""
-        not_enough = ""
-        empty = False
-        for _ in range(nums_roles):
-            while True:
-                try:
-                    choice = trained_associates.pop()
-                except IndexError:
-                    not_enough += f"Not enough eligible AAs to fill {key}.\n"
-                    empty = True
-                    break
-
-                else:
-                    if choice not in scheduled_associates:
-                        continue
-
-                    if choice not in chosen_associates:
-                        chosen_associates.add(choice)
-                        result += f"{key}: {choice}\n"
-                        break
-
-            if empty:
-                break
-
-        return result, not_enough
+        """Assign available trained associates to specific roles. Returns the chosen logins, fewer than nums_roles if
+        the trained associates run out."""
+        chosen = []
+        while len(chosen) < nums_roles and trained_associates:
+            choice = trained_associates.pop()
+            if choice in scheduled_associates and choice not in chosen_associates:
+                chosen_associates.add(choice)
+                chosen.append(choice)
+        return chosen
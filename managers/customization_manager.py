@@ -1,30 +1,60 @@
+from utils.instrumentation import timed
 from utils.interfaces import CustomizationManagerInterface, FilePathInterface
 
+CONFIG_KEYS = {"site": "site", "saved_shifts": "shifts", "saved_roles": "roles"}
+
 
 class CustomizationManager(CustomizationManagerInterface):
-    def __init__(self, pathfinder: FilePathInterface):
+    def __init__(self, pathfinder: FilePathInterface, config_store=None):
         self.pathfinder = pathfinder
+        self.config_store = config_store
 
     def get_site(self, base_path):
         """Opens site.txt and returns site ID"""
+        if self.config_store:
+            return self.config_store.get("site")
+
         with open(self.pathfinder.get_custom_text(base_path, "site"), "r") as file:
             site = file.read()
             return site
 
     def get_shifts(self, base_path):
         """Opens saved_shifts.txt and returns all shifts"""
+        if self.config_store:
+            return self.join_lines(self.config_store.get("shifts"))
+
         with open(self.pathfinder.get_custom_text(base_path, "saved_shifts"), "r") as file:
             shifts = file.read()
             return shifts
 
     def get_roles(self, base_path):
         """Opens saved_roles.txt and returns all roles"""
+        if self.config_store:
+            return self.join_lines(self.config_store.get("roles"))
+
         with open(self.pathfinder.get_custom_text(base_path, "saved_roles"), "r") as file:
             text = file.read()
             return text
 
+    def get_presets(self, base_path):
+        """Returns the role headcount presets as {name: {role: count}}"""
+        if self.config_store:
+            return self.config_store.get("presets")
+        return {}
+
+    @timed
     def save(self, filename, text, base_path):
         """Writes text in files for given filename and text arguments"""
+        if self.config_store:
+            value = text[0] if filename == "site" else list(text)
+            self.config_store.set(CONFIG_KEYS[filename], value)
+            return
+
         with open(self.pathfinder.get_custom_text(base_path, filename), "w") as file:
             for line in text:
                 file.write(line + "\n")
+
+    @staticmethod
+    def join_lines(items):
+        """Joins items one per line with a trailing newline, the same layout as the txt files."""
+        return "".join(f"{item}\n" for item in items)
@@ -1,8 +1,12 @@
+import queue
+import threading
 import datetime as dt
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from utils.interfaces import BusinessLogicInterface
 
+SEARCH_DELAY_MS = 200  # wait for a pause in typing before searching the logins
+
 
 def create_textbox(title, save_file):
     def decorator(func):
@@ -10,30 +14,7 @@ def create_textbox(title, save_file):
 
         def wrapper(self):
             chars = func(self)
-            self.text_window = tk.Tk()
-            self.text_window.title(title)
-            self.text_window.protocol("WM_DELETE_WINDOW", self.close_text)
-            self.text_window.iconbitmap(self.koala)
-            self.text_box = tk.Text(self.text_window)
-            self.text_box.insert(tk.END, chars=chars)
-
-            save_button = ttk.Button(self.text_window, text="Save", width=20, command=None)
-            if save_file == "perms":
-                save_button.config(command=lambda: self.save_permissions(self.text_box))
-            elif save_file == "res":
-                save_button.config(text="Main Menu", command=self.main_menu)
-            else:
-                save_button.config(command=lambda: self.save_textbox(save_file))
-
-            save_button.place(x=480, y=10)
-
-            scrollbar = tk.Scrollbar(self.text_window, orient="vertical", command=self.text_box.yview)
-            scrollbar.pack(side="right", fill="y")
-            self.text_box.config(yscrollcommand=scrollbar.set)
-
-            self.text_box.pack()
-            self.center_window(self.text_window, 630, 300)
-            self.text_window.mainloop()
+            self.show_text_view(title, chars, save_file)
 
         return wrapper
 
@@ -54,13 +35,22 @@ class DisplayManager:
         self.setup_window()
 
         self.setup_widgets()
+        self.setup_text_view()
+        self.setup_permissions_view()
 
-        self.text_window = None
-        self.text_box = None
         self.roles = None
         self.entry_dict = {}
 
+        self.worker = None
+        self.cancel_event = threading.Event()
+        self.events = queue.Queue()  # messages from the generate worker, handled on the Tk thread
+
         self.create_roles()
+        self.canvas.pack()
+
+    def run(self):
+        """Enters the Tk main loop. The single root window lives until the app is closed."""
+        self.window.mainloop()
 
     def setup_window(self):
         """Set up the Tkinter window."""
@@ -86,15 +76,90 @@ class DisplayManager:
 
     def close_app(self):
         """Close the app and quit the driver properly."""
+        self.cancel_event.set()
         self.window.destroy()
         if self.driver:
             self.driver.quit()
 
+    def setup_text_view(self):
+        """Builds the text view shared by the results and the editors. It is swapped in place of the menu."""
+        self.text_frame = tk.Frame(self.window)
+        self.text_box = tk.Text(self.text_frame)
+
+        self.save_button = ttk.Button(self.text_frame, text="Save", width=20)
+        self.back_button = tk.Button(self.text_frame, text="Back", width=10, command=self.close_text)
+        self.export_button = ttk.Button(self.text_frame, text="Export", width=20, command=self.export_results)
+
+        scrollbar = tk.Scrollbar(self.text_frame, orient="vertical", command=self.text_box.yview)
+        scrollbar.pack(side="right", fill="y")
+        self.text_box.config(yscrollcommand=scrollbar.set)
+        self.text_box.pack()
+
+    def show_text_view(self, title, chars, save_file):
+        """Loads chars into the text view and shows it in place of the menu."""
+        self.text_box.delete("1.0", tk.END)
+        self.text_box.insert(tk.END, chars=chars)
+
+        if save_file == "res":
+            self.save_button.config(text="Main Menu", command=self.main_menu)
+        else:
+            self.save_button.config(text="Save", command=lambda: self.save_textbox(save_file))
+
+        self.save_button.place(x=480, y=10)
+        self.export_button.place_forget()
+        if save_file == "res":
+            self.back_button.place_forget()
+        else:
+            self.back_button.place(x=520, y=110)
+
+        self.frame.pack_forget()
+        self.permissions_frame.pack_forget()
+        self.text_frame.pack(fill="both", expand=True)
+        self.window.title(title)
+        self.center_window(self.window, 630, 300)
+
+    def setup_permissions_view(self):
+        """Builds the role-by-role permissions editor. A role's logins are only loaded when it is selected, and the
+        search box filters the role list through the in-memory eligibility index."""
+        self.permissions_frame = tk.Frame(self.window)
+        self.editing_role = None
+        self.listed_roles = []
+        self.search_job = None
+
+        sidebar = tk.Frame(self.permissions_frame)
+        sidebar.pack(side="left", fill="y", padx=5, pady=5)
+        tk.Label(sidebar, text="Search logins:").pack(anchor="w")
+        self.search_text = tk.StringVar(self.window)
+        self.search_text.trace_add("write", lambda *args: self.schedule_search())
+        ttk.Entry(sidebar, textvariable=self.search_text, width=26).pack(fill="x")
+
+        self.role_list = tk.Listbox(sidebar, width=30, exportselection=False)
+        self.role_list.pack(fill="y", expand=True, pady=5)
+        self.role_list.bind("<<ListboxSelect>>", lambda event: self.select_role())
+
+        tk.Button(sidebar, text="Back", width=10, command=self.close_permissions).pack(side="left")
+        ttk.Button(sidebar, text="Save Role", width=12, command=self.save_role).pack(side="right")
+
+        editor = tk.Frame(self.permissions_frame)
+        editor.pack(side="right", fill="both", expand=True, padx=5, pady=5)
+        self.role_text = tk.Text(editor, width=40, undo=True)
+        scrollbar = tk.Scrollbar(editor, orient="vertical", command=self.role_text.yview)
+        scrollbar.pack(side="right", fill="y")
+        self.role_text.config(yscrollcommand=scrollbar.set)
+        self.role_text.pack(fill="both", expand=True)
+        self.role_text.tag_config("match", background="#FFE066")
+
+    def show_menu_view(self):
+        """Swaps the main menu back in. Its widgets are kept, so nothing is re-read or rebuilt."""
+        self.text_frame.pack_forget()
+        self.permissions_frame.pack_forget()
+        self.frame.pack(fill="both", expand=True)
+        self.window.title("Koality Rotator")
+        self.center_window(self.window, 500, 600)
+
     def close_text(self):
-        """Close the text window and quit the driver properly."""
-        self.text_window.destroy()
-        if self.driver:
-            self.driver.quit()
+        """Leaves the text view without saving. The driver is kept for the next Generate."""
+        self.show_menu_view()
 
     def setup_widgets(self):
         """Set up all the widgets on the window."""
@@ -132,12 +197,19 @@ class DisplayManager:
 
     def create_shift_dropdown(self):
         """Create a dropdown widget for selecting a shift."""
-        self.shifts = self.business_logic.get_shifts()
-        self.shifts = self.shifts.split("\n")[:-1]
         self.canvas.create_text(75, 100, text="Select a Shift:", font=("Helvetica", 12, "bold"))
-        self.dropdown_widget = ttk.Combobox(self.window, values=self.shifts)
+        self.dropdown_widget = ttk.Combobox(self.window)
         self.dropdown_widget.set("Select a shift")
         self.canvas.create_window(250, 100, window=self.dropdown_widget)
+        self.refresh_shifts()
+
+    def refresh_shifts(self):
+        """Reloads the saved shifts into the dropdown."""
+        self.shifts = self.business_logic.get_shifts()
+        self.shifts = self.shifts.split("\n")[:-1]
+        self.dropdown_widget.config(values=self.shifts)
+        if self.dropdown_widget.get() not in self.shifts:
+            self.dropdown_widget.set("Select a shift")
 
     def create_site_label(self):
         """Create the site label."""
@@ -160,31 +232,43 @@ class DisplayManager:
         up_button = tk.Button(text="↑", width=1, command=lambda: self.change_date("up"))
         change_site_button = tk.Button(text="Change Site", width=10, command=self.change_site)
         change_shifts_button = tk.Button(text="Change Shifts", width=10, command=self.change_shifts)
-        generate_button = ttk.Button(text="Generate", width=35, command=self.generate_button_click)
+        self.generate_button = ttk.Button(text="Generate", width=35, command=self.generate_button_click)
+        self.cancel_button = tk.Button(text="Cancel", width=10, command=self.cancel_generate)
+        self.refresh_roster = tk.BooleanVar(self.window, value=False)
+        refresh_checkbox = tk.Checkbutton(text="Refresh roster", variable=self.refresh_roster, bg="#1399FF")
         permissions_button = ttk.Button(text="Check/Edit Permissions", width=35,
                                         command=self.check_permissions)
-        default1 = tk.Button(text="Default Refurb",
-                             command=lambda: self.default("REF"))
-        default2 = tk.Button(text="Default AR",
-                             command=lambda: self.default("AR"))
+        self.presets = self.business_logic.get_presets()
+        preset_buttons = [tk.Button(text=name, command=lambda name=name: self.default(name))
+                          for name in self.presets]
         reset_button = tk.Button(text="Reset",
                                  command=self.reset_entries)
         add_remove_button = tk.Button(text="Add/Remove Roles",
                                       command=self.add_remove_roles)
+        timings_button = tk.Button(text="Step Timings",
+                                   command=self.show_timings)
 
         self.canvas.create_window(335, 132, window=down_button)
         self.canvas.create_window(355, 132, window=up_button)
         self.canvas.create_window(435, 132, window=change_site_button)
         self.canvas.create_window(435, 165, window=change_shifts_button)
-        self.canvas.create_window(250, 200, window=generate_button)
+        self.canvas.create_window(250, 200, window=self.generate_button)
+        self.progress_text = self.canvas.create_text(250, 248, text="", font=("Helvetica", 10, "bold"))
+        self.cancel_window = self.canvas.create_window(435, 235, window=self.cancel_button, state="hidden")
+        self.canvas.create_window(435, 200, window=refresh_checkbox)
         self.canvas.create_window(250, 385, window=permissions_button)
-        self.canvas.create_window(60, 465, window=default1)
-        self.canvas.create_window(60, 500, window=default2)
-        self.canvas.create_window(60, 535, window=reset_button)
+        for n, preset_button in enumerate(preset_buttons):
+            self.canvas.create_window(60, 465 + 35 * n, window=preset_button)
+        self.canvas.create_window(60, 465 + 35 * len(preset_buttons), window=reset_button)
         self.canvas.create_window(410, 465, window=add_remove_button)
+        self.canvas.create_window(410, 500, window=timings_button)
 
         self.canvas.create_line(0, 445, 500, 445, fill="black", width=2)
 
+        # Buttons that open another view or change the site, so they're disabled while a Generate runs
+        self.view_buttons = [change_site_button, change_shifts_button, permissions_button, add_remove_button,
+                             timings_button]
+
     def change_date(self, direction):
         """Adjust the current date up or down by one day and update the entry field."""
         if direction == "down":
@@ -217,30 +301,21 @@ class DisplayManager:
         shifts = self.business_logic.get_shifts()
         return shifts
 
-    def save_permissions(self, text):
-        """Saves permissions in the check/edit permissions textbox to files on the user's PC."""
-        saved = self.business_logic.save_permissions(text)
-        self.text_window.destroy()
-        if not saved:
-            tk.messagebox.showinfo(title="Error",
-                                   message="Error: Changes not saved.\n\nIf you need to add or remove roles, "
-                                           "please do so on the main menu by clicking 'Add/Remove Roles.'")
-        else:
-            tk.messagebox.showinfo(title="Saved!", message="Permissions Saved!")
-
     def save_textbox(self, filename):
         """Saves the content in the given textbox to a file on the user's PC."""
         text = self.text_box.get("1.0", "end-1c").split("\n")
         text = [item for item in text if item != ""]
         self.business_logic.save(filename, text)
 
-        self.text_window.destroy()
+        if filename == "saved_shifts":
+            self.refresh_shifts()
+        elif filename == "saved_roles":
+            self.create_roles()
+
+        self.show_menu_view()
         tk.messagebox.showinfo(title="Saved!",
                                message="Saved!")
 
-        self.window.destroy()
-        DisplayManager(self.paths_dict, self.business_logic, self.driver)
-
     def generate_button_click(self):
         """Initiates Selenium Web Driver to find AA schedules, assign AAs to indirect roles."""
         if self.check_invalid_entries():
@@ -256,15 +331,110 @@ class DisplayManager:
             return
 
         self.get_nums_dict()
+        self.force_refresh = self.refresh_roster.get()
 
-        self.window.destroy()
+        self.start_generate()
 
-        if self.get_scheduled_associates():
-            return
+    def start_generate(self):
+        """Runs the scrape and assignment on a worker thread, keeping the main window responsive."""
+        self.cancel_event = threading.Event()
+        self.generate_button.state(["disabled"])
+        self.set_view_buttons("disabled")
+        self.canvas.itemconfigure(self.cancel_window, state="normal")
+        self.report_progress("Starting...")
 
-        self.assign_indirects()
+        self.worker = threading.Thread(target=self.run_generate, args=(self.cancel_event,), daemon=True)
+        self.worker.start()
+        self.window.after(100, self.poll_generate)
 
-        self.create_result_textbox()
+    def run_generate(self, cancel_event):
+        """Worker thread: gets the roster and assigns indirects, posting the outcome back to the Tk thread."""
+        try:
+            with self.business_logic.generate_run():
+                driver, scheduled_associates = self.business_logic.get_scheduled_associates(self, self.force_refresh)
+                if cancel_event.is_set():
+                    self.events.put(("cancelled",))
+                elif not scheduled_associates:
+                    self.events.put(("failed", driver))
+                else:
+                    self.report_progress("Assigning roles...")
+                    result = self.business_logic.assign(self.nums_dict, scheduled_associates, self.date, self.shift)
+                    self.events.put(("done", driver, scheduled_associates, result))
+        except Exception:  # quitting the driver on cancel can surface as almost any WebDriver/urllib3 error
+            self.events.put(("cancelled",) if cancel_event.is_set() else ("failed", None))
+
+    def poll_generate(self):
+        """Handles messages from the worker thread: progress, credential prompts and the final outcome."""
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+
+            kind = event[0]
+            if kind == "progress":
+                self.canvas.itemconfigure(self.progress_text, text=event[1])
+            elif kind == "prompt":
+                _, prompt, answer, answered = event
+                answer.append(prompt())
+                answered.set()
+            else:
+                self.finish_generate(event)
+                return
+
+        self.window.after(100, self.poll_generate)
+
+    def finish_generate(self, event):
+        """Restores the menu controls and shows the results or the error."""
+        self.generate_button.state(["!disabled"])
+        self.set_view_buttons("normal")
+        self.canvas.itemconfigure(self.cancel_window, state="hidden")
+        self.canvas.itemconfigure(self.progress_text, text="")
+        self.worker = None
+
+        kind = event[0]
+        if kind == "done":
+            _, self.driver, self.scheduled_associates, self.assignment_result = event
+            self.create_result_textbox()
+            if not self.business_logic.auto_export:  # already exported by assign
+                self.export_button.state(["!disabled"])
+                self.export_button.place(x=480, y=50)
+        elif kind == "failed":
+            self.driver = event[1]
+            self.show_scrape_error()
+
+    def set_view_buttons(self, state):
+        """Enables ("normal") or disables ("disabled") the buttons that leave the main menu."""
+        for button in self.view_buttons:
+            if isinstance(button, ttk.Button):
+                button.state(["!disabled"] if state == "normal" else ["disabled"])
+            else:
+                button.config(state=state)
+
+    def cancel_generate(self):
+        """Aborts the in-flight Generate. Quitting the driver makes any pending WebDriver wait fail immediately."""
+        self.cancel_event.set()
+        self.canvas.itemconfigure(self.progress_text, text="Cancelling...")
+        driver, self.driver = self.driver, None
+        if driver:
+            threading.Thread(target=driver.quit, daemon=True).start()
+
+    def report_progress(self, message):
+        """Shows a progress message on the main menu. Safe to call from the worker thread."""
+        self.events.put(("progress", message))
+
+    def ask_on_main_thread(self, prompt):
+        """Runs a dialog on the Tk thread on behalf of the worker and waits for the answer (None if cancelled)."""
+        if threading.current_thread() is threading.main_thread():
+            return prompt()
+
+        answer = []
+        answered = threading.Event()
+        self.events.put(("prompt", prompt, answer, answered))
+        while not answered.wait(0.1):
+            if self.cancel_event.is_set():
+                return None
+        return answer[0]
 
     def check_invalid_entries(self):
         """Check role entries for invalid or all-zero values and display error messages."""
@@ -332,37 +502,145 @@ class DisplayManager:
         """Create a dictionary mapping roles to their entered numeric values."""
         self.nums_dict = {role: int(self.entry_dict[f"{role}_entry"].get()) for role in self.roles}
 
-    def get_scheduled_associates(self):
-        """Retrieve the list of scheduled associates and handle errors if retrieval fails."""
-        self.driver, self.scheduled_associates = self.business_logic.get_scheduled_associates(self)
-        if not self.scheduled_associates:  # if None returned due to a problem
-            messagebox.showinfo(title="Timeout", message="There was a problem.\n\nIs your PIN correct?\nIs your "
-                                                         "security key correct?\nIs your site ID correct?\nIs your "
-                                                         "shift time correct?\n\nIf yes, SSPOT may have bugged "
-                                                         "out.\nPlease try again.")
-            DisplayManager(self.paths_dict, self.business_logic, self.driver)
-            return True
-        return False
-
-    def assign_indirects(self):
-        """Assign indirect roles to scheduled associates using business logic."""
-        self.result_string, self.not_enough_string = self.business_logic.assign_indirects(self.nums_dict,
-                                                                                          self.scheduled_associates)
+    def show_scrape_error(self):
+        """Explains that the roster couldn't be retrieved."""
+        messagebox.showinfo(title="Timeout", message="There was a problem.\n\nIs your PIN correct?\nIs your "
+                                                     "security key correct?\nIs your site ID correct?\nIs your "
+                                                     "shift time correct?\n\nIf yes, SSPOT may have bugged "
+                                                     "out.\nPlease try again.")
 
     @create_textbox("Koality Results", "res")
     def create_result_textbox(self):
         """Create a textbox displaying the final assignment results."""
-        if self.not_enough_string:
-            self.final_string = self.not_enough_string + "\n" + self.result_string
-        else:
-            self.final_string = self.result_string
+        self.final_string = self.assignment_result.render("text")
         return self.final_string
 
-    @create_textbox("Check/Edit Permissions", "perms")
+    def export_results(self):
+        """Appends the shown results to the site's assignments export file. The button stays disabled until the next
+        Generate so a result is only exported once."""
+        path = self.business_logic.export_assignments(self.assignment_result, self.date, self.shift, self.site)
+        if path:
+            self.export_button.state(["disabled"])
+            messagebox.showinfo(title="Exported", message=f"Results appended to:\n{path}")
+        else:
+            messagebox.showinfo(title="Export", message="There are no results to export.")
+
     def check_permissions(self):
-        """Opens text box to check/edit AA permissions for each saved role."""
-        permissions_string = self.business_logic.check_permissions()
-        return permissions_string
+        """Opens the role-by-role editor to check/edit AA permissions for each saved role."""
+        self.editing_role = None
+        self.role_text.delete("1.0", tk.END)
+        self.role_text.edit_modified(False)
+        self.search_text.set("")
+        self.refresh_role_list()
+
+        self.frame.pack_forget()
+        self.permissions_frame.pack(fill="both", expand=True)
+        self.window.title("Check/Edit Permissions")
+        self.center_window(self.window, 630, 400)
+
+        if self.listed_roles:
+            self.role_list.selection_set(0)
+            self.select_role()
+
+    def refresh_role_list(self):
+        """Lists the saved roles, or only the roles with a login matching the search and how many match."""
+        query = self.search_text.get().strip()
+        if query:
+            matches = self.business_logic.search_logins(query)
+            self.listed_roles = [role for role in self.roles if role in matches]
+            labels = [f"{role} ({len(matches[role])})" for role in self.listed_roles]
+        else:
+            self.listed_roles = list(self.roles)
+            labels = self.listed_roles
+
+        self.role_list.delete(0, tk.END)
+        self.role_list.insert(tk.END, *labels)
+        if self.editing_role in self.listed_roles:
+            self.role_list.selection_set(self.listed_roles.index(self.editing_role))
+
+    def schedule_search(self):
+        """Restarts the search timer so the logins are only searched once typing pauses."""
+        if self.search_job:
+            self.window.after_cancel(self.search_job)
+        self.search_job = self.window.after(SEARCH_DELAY_MS, self.run_search)
+
+    def run_search(self):
+        """Filters the role list and highlights matches in the role being edited."""
+        self.search_job = None
+        self.refresh_role_list()
+        self.highlight_matches()
+
+    def select_role(self):
+        """Loads the selected role's permissions into the editor, offering to save unsaved edits first."""
+        selection = self.role_list.curselection()
+        if not selection:
+            return
+        role = self.listed_roles[selection[0]]
+        if role == self.editing_role:
+            return
+
+        if not self.confirm_discard():
+            self.role_list.selection_clear(0, tk.END)
+            if self.editing_role in self.listed_roles:
+                self.role_list.selection_set(self.listed_roles.index(self.editing_role))
+            return
+
+        self.editing_role = role
+        self.role_text.delete("1.0", tk.END)
+        self.role_text.insert(tk.END, self.business_logic.get_role_permissions(role))
+        self.role_text.edit_reset()
+        self.role_text.edit_modified(False)
+        self.highlight_matches()
+
+    def highlight_matches(self):
+        """Highlights the search text in the role being edited."""
+        self.role_text.tag_remove("match", "1.0", tk.END)
+        query = self.search_text.get().strip()
+        if not query:
+            return
+
+        count = tk.IntVar(self.window)
+        index = self.role_text.search(query, "1.0", stopindex=tk.END, nocase=True, count=count)
+        if index:
+            self.role_text.see(index)
+        while index:
+            end = f"{index}+{count.get()}c"
+            self.role_text.tag_add("match", index, end)
+            index = self.role_text.search(query, end, stopindex=tk.END, nocase=True, count=count)
+
+    def confirm_discard(self):
+        """Asks whether to save unsaved edits to the current role. Returns False if the user cancels."""
+        if not self.editing_role or not self.role_text.edit_modified():
+            return True
+
+        answer = messagebox.askyesnocancel(title="Unsaved Changes",
+                                           message=f"Save your changes to {self.editing_role}?")
+        if answer is None:
+            return False
+        if answer:
+            self.save_role(notify=False)
+        return True
+
+    def save_role(self, notify=True):
+        """Saves the role being edited. Only that role's file is written, and only if it changed."""
+        if not self.editing_role:
+            return
+
+        text = self.role_text.get("1.0", "end-1c")
+        saved = self.business_logic.save_role_permissions(self.editing_role, text)
+        self.role_text.edit_modified(False)
+        if self.search_text.get().strip():
+            self.run_search()
+
+        if notify:
+            tk.messagebox.showinfo(title="Saved!" if saved else "No Changes",
+                                   message=f"{self.editing_role} Permissions Saved!" if saved
+                                   else "No changes to save.")
+
+    def close_permissions(self):
+        """Leaves the permissions editor, offering to save unsaved edits first."""
+        if self.confirm_discard():
+            self.show_menu_view()
 
     @create_textbox("Add/Remove Roles", "saved_roles")
     def add_remove_roles(self):
@@ -370,23 +648,18 @@ class DisplayManager:
         roles = self.business_logic.get_roles()
         return roles
 
-    def default(self, entry):
-        """Set default values for role entries based on the specified entry type."""
-        self.clear_entries()
+    @create_textbox("Step Timings", "res")
+    def show_timings(self):
+        """Shows p50/p95 durations of each Generate step over recent runs."""
+        return self.business_logic.get_timing_summary()
 
-        if entry == "REF":
-            self.entry_dict["Refurb_entry"].insert(tk.END, string="1")
-            self.entry_dict["Amazon Resale_entry"].insert(tk.END, string="0")
-        elif entry == "AR":
-            self.entry_dict["Refurb_entry"].insert(tk.END, string="0")
-            self.entry_dict["Amazon Resale_entry"].insert(tk.END, string="1")
+    def default(self, preset):
+        """Set role entries to the headcounts saved for the given preset. Roles the preset doesn't mention get 0."""
+        self.clear_entries()
 
-        self.entry_dict["End of Line_entry"].insert(tk.END, string="1")
-        self.entry_dict["Waterspider_entry"].insert(tk.END, string="1")
-        self.entry_dict["Problem Solve_entry"].insert(tk.END, string="2")
-        self.entry_dict["Detrash_entry"].insert(tk.END, string="2")
-        self.entry_dict["Unload_entry"].insert(tk.END, string="1")
-        self.entry_dict["Audit_entry"].insert(tk.END, string="2")
+        headcounts = self.presets.get(preset, {})
+        for role in self.roles:
+            self.entry_dict[f"{role}_entry"].insert(tk.END, string=str(headcounts.get(role, 0)))
 
     def clear_entries(self):
         """Clear all role entry fields."""
@@ -406,36 +679,43 @@ class DisplayManager:
         self.canvas.create_image(250, 285, image=self.smile_image, tag="image1")
 
     def create_roles(self):
-        """Reads and creates text/entry for every saved role"""
+        """Reads and creates text/entry for every saved role, replacing any role rows already on the canvas.
+        Values typed for roles that are still saved are kept."""
+        previous = {key: entry.get() for key, entry in self.entry_dict.items()}
+        self.canvas.delete("role")
+        for entry in self.entry_dict.values():
+            entry.destroy()
+        self.entry_dict = {}
+
         self.roles = self.business_logic.get_roles()
         self.roles = self.roles.split("\n")[:-1]
 
         curr_y = 465
         for role in self.roles:
-            self.canvas.create_text(200, curr_y, text=f"{role}:", font=("Helvetica", 12, "bold"))
+            self.canvas.create_text(200, curr_y, text=f"{role}:", font=("Helvetica", 12, "bold"), tag="role")
 
             self.entry_dict[f"{role}_entry"] = ttk.Entry(width=2)
-            self.entry_dict[f"{role}_entry"].insert(tk.END, string="0")
-            self.canvas.create_window(300, curr_y, window=self.entry_dict[f"{role}_entry"])
+            self.entry_dict[f"{role}_entry"].insert(tk.END, string=previous.get(f"{role}_entry", "0"))
+            self.canvas.create_window(300, curr_y, window=self.entry_dict[f"{role}_entry"], tag="role")
 
             curr_y += 50
 
-        self.canvas.pack()
-        self.canvas.mainloop()
+        self.on_frame_configure()
 
     def midway_pin(self):
         """Retrieves midway pin via entry box"""
-        pin = simpledialog.askstring("Midway PIN", "Please enter your Midway PIN:", show="*")
+        pin = self.ask_on_main_thread(
+            lambda: simpledialog.askstring("Midway PIN", "Please enter your Midway PIN:", show="*"))
         if not pin:
             return TypeError
         return pin
 
     def security_key(self):
         """Retrieves one-time password from user's security key via entry box"""
-        otp = simpledialog.askstring("Security Key", "Please press your Security Key.", show="*")
+        otp = self.ask_on_main_thread(
+            lambda: simpledialog.askstring("Security Key", "Please press your Security Key.", show="*"))
         return otp
 
     def main_menu(self):
-        """Closes the results text window and reopens the main menu."""
-        self.text_window.destroy()
-        DisplayManager(self.paths_dict, self.business_logic, self.driver)
+        """Leaves the results view, returning to the main menu."""
+        self.show_menu_view()
@@ -1,9 +1,15 @@
+import hashlib
+from utils.file_path import write_atomic
+from utils.eligibility_index import EligibilityIndex
+from utils.instrumentation import timed
 from utils.interfaces import PermissionsManagerInterface, FilePathInterface
 
 
 class PermissionsManager(PermissionsManagerInterface):
-    def __init__(self, pathfinder: FilePathInterface):
+    def __init__(self, pathfinder: FilePathInterface, eligibility_index=None, config_store=None):
         self.pathfinder = pathfinder
+        self.eligibility_index = eligibility_index
+        self.config_store = config_store
 
     def check_permissions(self, base_path):
         """Reads permissions files on user's PC for each saved indirect role."""
@@ -19,14 +25,52 @@ class PermissionsManager(PermissionsManagerInterface):
 
     def get_saved_roles(self, base_path):
         """Retrieve a list of saved roles from a file."""
+        if self.config_store:
+            return list(self.config_store.get("roles"))
+
         with open(self.pathfinder.get_custom_text(base_path, "saved_roles"), "r") as file:
             return [line.strip() for line in file.readlines()]
 
+    @timed
     def get_permissions_string(self, role, base_path):
-        """Get the permissions string for a specific role from a file."""
-        with open(self.pathfinder.get_permissions(role, base_path), "r") as file:
+        """Get the permissions string for a specific role from a file. A role without a file gets one from the
+        template, so it can be filled in from the editor."""
+        file_path = self.pathfinder.get_permissions(role, base_path)
+        if self.eligibility_index:
+            return self.eligibility_index.get_text(role, base_path)
+
+        with open(file_path, "r") as file:
             return file.read()
 
+    def get_role_permissions(self, role, base_path):
+        """Returns the permissions text of a single role, for the role-by-role editor."""
+        return self.get_permissions_string(role, base_path)
+
+    def save_role_permissions(self, role, text, base_path):
+        """Saves the permissions text of a single role. Returns whether anything changed."""
+        return self.save_edited_permissions(role, base_path, iter([text]))
+
+    def search_logins(self, query, base_path):
+        """Returns {role: sorted matching logins} for every saved role with a login containing query
+        (case-insensitive)."""
+        query = query.strip().lower()
+        if not query:
+            return {}
+
+        matches = {}
+        for role in self.get_saved_roles(base_path):
+            logins = sorted(login for login in self.get_logins(role, base_path) if query in login.lower())
+            if logins:
+                matches[role] = logins
+        return matches
+
+    def get_logins(self, role, base_path):
+        """Returns the logins trained for a role, from the index when there is one."""
+        if self.eligibility_index:
+            self.pathfinder.get_permissions(role, base_path)  # starts a missing role from the template, as above
+            return self.eligibility_index.logins_for_role(role, base_path)
+        return EligibilityIndex.parse_logins(self.get_permissions_string(role, base_path))
+
     def save_permissions(self, base_path, text_box):
         """Saves permissions files on user's PC for each saved indirect role."""
         indirect_roles = self.get_saved_roles(base_path)
@@ -52,7 +96,21 @@ class PermissionsManager(PermissionsManagerInterface):
                 saved_permissions[n] = f"##{saved_permissions[n]}"
             return saved_permissions
 
+    @timed
     def save_edited_permissions(self, role, base_path, saved_permissions_iter):
-        """Save the next edited permission string for a role to its file."""
-        with open(self.pathfinder.get_permissions(role, base_path), "w") as file:
-            file.write(next(saved_permissions_iter))
+        """Save the next edited permission string for a role to its file. Roles whose content hash hasn't changed
+        are skipped. Returns whether anything was written."""
+        text = next(saved_permissions_iter)
+        if self.content_hash(text) == self.content_hash(self.get_permissions_string(role, base_path)):
+            return False
+
+        if self.eligibility_index:
+            self.eligibility_index.save_text(role, text, base_path)
+        else:
+            write_atomic(self.pathfinder.get_permissions(role, base_path), text)
+        return True
+
+    @staticmethod
+    def content_hash(text):
+        """Hashes a role's permissions text to detect changes."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
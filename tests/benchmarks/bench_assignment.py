@@ -0,0 +1,116 @@
+"""Benchmarks AssignmentManager's greedy and matching engines on synthetic rosters and permission sets.
+
+Each scenario generates a roster of AAs, role permissions at a given eligibility density (the share of AAs trained
+for each role) and role headcounts adding up to a share of the roster. Both engines run with the same seed, and the
+report gives the median time, the peak memory (tracemalloc) and the fill rate: assigned slots over requested slots.
+Runs offline from the repository root:
+    python tests/benchmarks/bench_assignment.py                      # the full grid, 100 to 20,000 AAs
+    python tests/benchmarks/bench_assignment.py --quick              # a small grid for a quick check
+    python tests/benchmarks/bench_assignment.py --aas 5000 --roles 20 --density 0.1 --json results.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import itertools
+import statistics
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from managers import AssignmentManager  # noqa: E402
+from utils import FilePath  # noqa: E402
+
+ENGINES = ("greedy", "matching")
+FULL_GRID = {"aas": (100, 1000, 5000, 20000), "roles": (5, 20, 100), "density": (0.05, 0.2, 0.5)}
+QUICK_GRID = {"aas": (100, 1000), "roles": (5, 20), "density": (0.05, 0.2)}
+
+
+class SyntheticIndex:
+    """Stands in for EligibilityIndex with generated permissions. Logins come back in a fixed order so runs are
+    reproducible regardless of string hashing."""
+
+    def __init__(self, permissions):
+        self.permissions = permissions
+
+    def logins_for_role(self, role, base_path):
+        return self.permissions[role]
+
+
+def make_scenario(aas, roles, density, slot_share, seed):
+    """Returns (roster, permissions, headcounts). A quarter more logins than the roster hold permissions, as if some
+    trained AAs were off shift."""
+    rng = random.Random(seed)
+    population = [f"aa{n:05}" for n in range(int(aas * 1.25))]
+    roster = set(rng.sample(population, aas))
+
+    role_names = [f"Role {n:03}" for n in range(roles)]
+    permissions = {role: tuple(sorted(rng.sample(population, max(1, int(len(population) * density)))))
+                   for role in role_names}
+
+    slots = max(roles, int(aas * slot_share))
+    weights = [rng.random() for _ in role_names]
+    total = sum(weights)
+    headcounts = {role: max(1, round(slots * weight / total)) for role, weight in zip(role_names, weights)}
+    return roster, permissions, headcounts
+
+
+def run_engine(engine, roster, permissions, headcounts, seed, runs):
+    """Returns (median seconds, peak bytes, assigned slots) for one engine."""
+    assignment_manager = AssignmentManager(FilePath(), engine=engine, eligibility_index=SyntheticIndex(permissions))
+
+    times = []
+    for _ in range(runs):
+        random.seed(seed)
+        start = time.perf_counter()
+        result_string, _ = assignment_manager.assign_indirects(headcounts, roster, "")
+        times.append(time.perf_counter() - start)
+
+    random.seed(seed)
+    tracemalloc.start()
+    assignment_manager.assign_indirects(headcounts, roster, "")
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return statistics.median(times), peak, len(result_string.splitlines())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the assignment engines on synthetic rosters.")
+    parser.add_argument("--quick", action="store_true", help="run a small grid")
+    parser.add_argument("--aas", type=int, nargs="+", help="roster sizes")
+    parser.add_argument("--roles", type=int, nargs="+", help="role counts")
+    parser.add_argument("--density", type=float, nargs="+", help="share of AAs trained for each role")
+    parser.add_argument("--slot-share", type=float, default=0.3, help="headcount total as a share of the roster")
+    parser.add_argument("--engine", choices=ENGINES, nargs="+", default=ENGINES)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    grid = QUICK_GRID if args.quick else FULL_GRID
+    scenarios = itertools.product(args.aas or grid["aas"], args.roles or grid["roles"],
+                                  args.density or grid["density"])
+
+    print(f"{'AAs':>6} {'roles':>5} {'density':>7} {'slots':>6} {'engine':>8} {'time ms':>10} {'peak KiB':>10} "
+          f"{'fill':>7}")
+    results = []
+    for aas, roles, density in scenarios:
+        roster, permissions, headcounts = make_scenario(aas, roles, density, args.slot_share, args.seed)
+        slots = sum(headcounts.values())
+        for engine in args.engine:
+            elapsed, peak, filled = run_engine(engine, roster, permissions, headcounts, args.seed, args.runs)
+            results.append({"aas": aas, "roles": roles, "density": density, "slots": slots, "engine": engine,
+                            "seconds": elapsed, "peak_bytes": peak, "filled": filled, "fill_rate": filled / slots})
+            print(f"{aas:>6} {roles:>5} {density:>7.2f} {slots:>6} {engine:>8} {elapsed * 1000:>10.2f} "
+                  f"{peak / 1024:>10.1f} {filled / slots:>7.1%}")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compares bulk and per-element roster extraction against a local HTML fixture.
+
+Run from the repository root with Chrome installed:
+    python tests/benchmarks/bench_extract_logins.py [rows]
+"""
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from selenium import webdriver  # noqa: E402
+from utils import ScheduleFinder  # noqa: E402
+
+COLUMNS = ["Login", "Manager", "Shift Pattern", "Department"]
+
+
+def build_fixture(rows):
+    """Writes a roster page shaped like the SSPOT roster details table and returns its file:// URL."""
+    body = "".join(
+        "<tr>" + "".join(f"<td>{column.lower().replace(' ', '')}{n}</td>" for column in COLUMNS) + "</tr>"
+        for n in range(rows)
+    )
+    head = "".join(f"<th>{column}</th>" for column in COLUMNS)
+    html = (f"<html><body><button class='display-attribute'>Attributes</button>"
+            f"<table><thead><tr>{head}</tr></thead>"
+            f"<tbody class='roster-details-table-body'>{body}</tbody></table></body></html>")
+
+    path = os.path.join(tempfile.mkdtemp(), "roster.html")
+    with open(path, "w") as file:
+        file.write(html)
+    return "file://" + path
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument("--headless")
+    driver = webdriver.Chrome(options=chrome_options)
+
+    try:
+        driver.get(build_fixture(rows))
+        finder = ScheduleFinder()
+
+        bulk_time, bulk_logins = time_call(finder.extract_logins, driver)
+        element_time, element_logins = time_call(finder.extract_logins_per_element, driver)
+
+        assert bulk_logins == element_logins
+        print(f"rows: {rows}, cells: {rows * len(COLUMNS)}")
+        print(f"bulk execute_script: {bulk_time * 1000:9.1f} ms")
+        print(f"per-element .text:   {element_time * 1000:9.1f} ms")
+        print(f"speedup:             {element_time / bulk_time:9.1f}x")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
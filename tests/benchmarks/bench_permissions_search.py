@@ -0,0 +1,69 @@
+"""Times the permissions editor's data paths with 20k logins spread over 40 roles: a search across every role
+through the eligibility index, loading one role, and saving one role. Run from the repository root:
+    python tests/benchmarks/bench_permissions_search.py [runs]
+"""
+import os
+import sys
+import random
+import string
+import tempfile
+import statistics
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from managers import PermissionsManager  # noqa: E402
+from utils import FilePath, EligibilityIndex  # noqa: E402
+
+ROLES = 40
+LOGINS_PER_ROLE = 500
+
+
+def make_permissions(base_path):
+    """Writes the role files and saved_roles.txt."""
+    rng = random.Random(7)
+    os.makedirs(os.path.join(base_path, "txt"))
+    roles = [f"Role {n}" for n in range(ROLES)]
+    for role in roles:
+        logins = ["".join(rng.choices(string.ascii_lowercase, k=8)) for _ in range(LOGINS_PER_ROLE)]
+        with open(os.path.join(base_path, "txt", f"{role}.txt"), "w") as file:
+            file.write(f"## {role} Permissions\n" + "\n".join(logins) + "\n")
+    with open(os.path.join(base_path, "txt", "saved_roles.txt"), "w") as file:
+        file.write("\n".join(roles) + "\n")
+    return roles
+
+
+def time_ms(func, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(runs=20):
+    with tempfile.TemporaryDirectory() as base_path:
+        roles = make_permissions(base_path)
+        pathfinder = FilePath()
+        permissions_manager = PermissionsManager(pathfinder, eligibility_index=EligibilityIndex(pathfinder))
+
+        start = time.perf_counter()
+        permissions_manager.search_logins("ab", base_path)
+        print(f"first search (builds index): {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+        for query in ("a", "ab", "abc", "zzzzzzzz"):
+            elapsed = time_ms(lambda: permissions_manager.search_logins(query, base_path), runs)
+            print(f"search {query!r:12}          {elapsed:8.2f} ms")
+
+        text = permissions_manager.get_role_permissions(roles[0], base_path)
+        elapsed = time_ms(lambda: permissions_manager.get_role_permissions(roles[0], base_path), runs)
+        print(f"load one role:               {elapsed:8.2f} ms")
+
+        edits = iter(f"{text}newlogin{n}\n" for n in range(runs))
+        elapsed = time_ms(lambda: permissions_manager.save_role_permissions(roles[0], next(edits), base_path), runs)
+        print(f"save one role:               {elapsed:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
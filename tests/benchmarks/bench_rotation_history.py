@@ -0,0 +1,51 @@
+"""Times loading the rotation history and looking up recency, with six months of assignments from a busy site
+(3 shifts a day, 40 assignments per shift, 400 logins over 12 roles). Run from the repository root:
+    python tests/benchmarks/bench_rotation_history.py [days]
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+import datetime as dt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils import RotationHistory  # noqa: E402
+
+SHIFTS = ("04-00-00", "09-30-00", "15-00-00")
+ROLES = [f"Role {n}" for n in range(12)]
+LOGINS = [f"login{n:03}" for n in range(400)]
+
+
+def main(days=180):
+    rng = random.Random(3)
+    with tempfile.TemporaryDirectory() as history_dir:
+        history_file = os.path.join(history_dir, "assignments.csv")
+        writer = RotationHistory(history_file, retention_days=days + 1)
+        today = dt.date.today()
+        for day in range(days, 0, -1):
+            for shift in SHIFTS:
+                writer.record(today - dt.timedelta(days=day), shift,
+                              zip(rng.choices(ROLES, k=40), rng.sample(LOGINS, 40)))
+
+        with open(history_file) as file:
+            rows = sum(1 for _ in file) - 1
+
+        start = time.perf_counter()
+        history = RotationHistory(history_file, retention_days=days + 1)
+        history.load()
+        print(f"load {rows} rows:          {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+        start = time.perf_counter()
+        lookups = 0
+        for role in ROLES:
+            for login in LOGINS:
+                history.recency(login, role, today)
+                lookups += 1
+        elapsed = (time.perf_counter() - start) * 1e6 / lookups
+        print(f"recency lookup:            {elapsed:8.2f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 180)
@@ -0,0 +1,108 @@
+"""Reports time-to-first-window for the development and frozen (PyInstaller) layouts.
+
+Each measurement runs in a fresh interpreter so import costs are counted. Run from the repository root:
+    python tests/benchmarks/bench_startup.py [runs]
+
+The frozen layout is simulated with a temporary _MEIPASS bundle and an empty config folder (first launch) or an
+already bootstrapped one (warm launch). Without a display, the window step is skipped and only imports and bootstrap
+are timed.
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Runs inside the child interpreter; prints one JSON line of timings in milliseconds.
+CHILD = r"""
+import os, sys, time, json
+start = time.perf_counter()
+timings = {}
+meipass, base_path = sys.argv[1] or None, sys.argv[2] or None
+
+import utils, managers
+from main import create_business_logic
+timings["imports"] = time.perf_counter() - start
+
+pathfinder = utils.FilePath()
+if meipass:
+    pathfinder.get_paths = lambda: (meipass, base_path)
+temp_path, base_path = pathfinder.get_paths()
+pathfinder.app_init(temp_path, base_path)
+business_logic = create_business_logic(pathfinder, base_path)
+timings["bootstrap"] = time.perf_counter() - start
+
+try:
+    import tkinter as tk
+    from unittest.mock import patch
+    paths_dict = {"temp_path": temp_path, "base_path": base_path,
+                  "smile_logo": pathfinder.get_image_path(temp_path, base_path, "image1.png"),
+                  "koala_logo": pathfinder.get_image_path(temp_path, base_path, "image2.ico")}
+    with patch.object(tk.Tk, "iconbitmap"):
+        display = managers.DisplayManager(paths_dict, business_logic)
+        display.window.update()
+    timings["first_window"] = time.perf_counter() - start
+    display.window.destroy()
+except Exception as error:
+    timings["first_window"] = None
+    timings["window_error"] = str(error).splitlines()[0]
+
+timings["selenium_loaded"] = any(name.startswith("selenium") for name in sys.modules)
+print(json.dumps({key: value * 1000 if isinstance(value, float) else value for key, value in timings.items()}))
+"""
+
+
+def make_bundle():
+    """Builds a fake _MEIPASS folder with the bundled txt files and images."""
+    meipass = tempfile.mkdtemp()
+    os.makedirs(os.path.join(meipass, "txt"))
+    for filename in ("End of Line.txt", "Problem Solve.txt", "Waterspider.txt", "Refurb.txt", "Unload.txt",
+                     "Detrash.txt"):
+        with open(os.path.join(meipass, "txt", filename), "w") as file:
+            file.write(f"## {filename[:-4]} Permissions\nEnter Logins Here\n\n")
+    for filename in ("saved_roles.txt", "saved_shifts.txt", "site.txt"):
+        shutil.copyfile(os.path.join(ROOT, "txt", filename), os.path.join(meipass, "txt", filename))
+    shutil.copytree(os.path.join(ROOT, "images"), os.path.join(meipass, "images"))
+    return meipass
+
+
+def measure(meipass="", base_path=""):
+    result = subprocess.run([sys.executable, "-c", CHILD, meipass, base_path], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def report(name, samples):
+    print(name)
+    for step in ("imports", "bootstrap", "first_window"):
+        values = [sample[step] for sample in samples if sample.get(step) is not None]
+        if values:
+            print(f"  {step:<13} median {statistics.median(values):8.1f} ms   min {min(values):8.1f} ms")
+        else:
+            print(f"  {step:<13} skipped ({samples[0].get('window_error', 'unavailable')})")
+    print(f"  selenium imported before first window: {any(sample['selenium_loaded'] for sample in samples)}")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    report("development layout", [measure() for _ in range(runs)])
+
+    meipass = make_bundle()
+    first_launch = []
+    for _ in range(runs):
+        base_path = tempfile.mkdtemp()
+        first_launch.append(measure(meipass, base_path))
+    report("frozen layout, first launch", first_launch)
+
+    base_path = tempfile.mkdtemp()
+    measure(meipass, base_path)
+    report("frozen layout, warm launch", [measure(meipass, base_path) for _ in range(runs)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Measures memory and latency of switching between the menu and the text views over many round trips.
+
+Needs a display. Run from the repository root:
+    python tests/benchmarks/bench_view_switching.py [round_trips]
+
+With one long-lived Tk root, memory, widget count and Tcl interpreter count should stay flat however many round
+trips are made.
+"""
+import os
+import sys
+import time
+import tracemalloc
+import tkinter as tk
+from unittest.mock import patch
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from managers.display_manager import DisplayManager  # noqa: E402
+from utils import Assignment, AssignmentResult  # noqa: E402
+
+
+class StubBusinessLogic:
+    """Serves fixed config so the benchmark measures the UI only."""
+
+    def __init__(self):
+        self.roles = "End of Line\nProblem Solve\nWaterspider\nAudit\n"
+
+    def get_shifts(self):
+        return "04-00-00\n09-30-00\n15-00-00\n20-30-00\n"
+
+    def get_roles(self):
+        return self.roles
+
+    def get_site(self):
+        return "SMF9"
+
+    def get_presets(self):
+        return {"Default Refurb": {"End of Line": 1}}
+
+    def get_role_permissions(self, role):
+        return f"## {role} Permissions\nlogin1\n"
+
+    def search_logins(self, query):
+        return {role: ["login1"] for role in self.roles.split("\n") if role}
+
+    def save(self, filename, text_list):
+        if filename == "saved_roles":
+            self.roles = "".join(f"{role}\n" for role in text_list)
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def round_trip(display):
+    """Opens and leaves each view once: permissions, results, and a saved roles edit."""
+    display.check_permissions()
+    display.close_permissions()
+
+    display.assignment_result = AssignmentResult([Assignment("End of Line", "login1", 0)])
+    display.create_result_textbox()
+    display.main_menu()
+
+    display.add_remove_roles()
+    display.save_textbox("saved_roles")
+    display.window.update()
+
+
+def main():
+    round_trips = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    paths_dict = {"temp_path": None, "base_path": ROOT,
+                  "smile_logo": os.path.join(ROOT, "images", "image1.png"),
+                  "koala_logo": os.path.join(ROOT, "images", "image2.ico")}
+
+    with patch("managers.display_manager.messagebox"), patch.object(tk.Tk, "iconbitmap"):
+        display = DisplayManager(paths_dict, StubBusinessLogic())
+        display.window.update()
+
+        tracemalloc.start()
+        samples = []
+        start = time.perf_counter()
+        for n in range(1, round_trips + 1):
+            trip_start = time.perf_counter()
+            round_trip(display)
+            if n == 1 or n % (round_trips // 5 or 1) == 0:
+                current, _ = tracemalloc.get_traced_memory()
+                samples.append((n, current, count_widgets(display.window), time.perf_counter() - trip_start))
+        total = time.perf_counter() - start
+
+        print(f"{'round trip':>10} {'python heap':>12} {'widgets':>8} {'latency':>9}")
+        for n, current, widgets, latency in samples:
+            print(f"{n:>10} {current / 1024:>9.1f} KB {widgets:>8} {latency * 1000:>6.2f} ms")
+        print(f"mean round trip: {total / round_trips * 1000:.2f} ms over {round_trips} trips")
+        display.window.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import os
+import datetime as dt
 import pytest
 from unittest.mock import Mock, mock_open, patch
 from managers import AssignmentManager
@@ -50,3 +51,48 @@ def test_assign_indirects(assignment_manager,
 def test_nonzero_keys(assignment_manager, nums_dict, expected_result):
     result = assignment_manager.get_nonzero_keys(nums_dict)
     assert result == expected_result
+
+
+def test_assign_indirects_matching(assignment_manager, base_path):
+    assignment_manager.engine = "matching"
+    file_contents = {"End of Line": "galleaus\ndayvinc\n", "Problem Solve": "galleaus\n"}
+    assignment_manager.pathfinder.get_custom_text.side_effect = lambda path, key: key
+
+    def fake_open(filename, *args, **kwargs):
+        return mock_open(read_data=file_contents[filename])()
+
+    with patch("builtins.open", side_effect=fake_open):
+        for _ in range(10):
+            result_string, not_enough_string = assignment_manager.assign_indirects(
+                {"End of Line": 1, "Problem Solve": 1}, ["galleaus", "dayvinc"], base_path)
+            assert sorted(result_string.splitlines()) == ["End of Line: dayvinc", "Problem Solve: galleaus"]
+            assert not_enough_string == ""
+
+
+@pytest.mark.parametrize("engine", ["greedy", "matching"])
+def test_assign_indirects_prefers_least_recently_assigned(base_path, engine):
+    pathfinder = Mock(spec=FilePath)
+    pathfinder.get_custom_text.return_value = "fakefile.txt"
+    rotation_history = Mock()
+    recent = {"galleaus": (2, 20), "dayvinc": (0, 0), "zoeyk": (1, 10)}
+    rotation_history.recency.side_effect = lambda login, role, date: recent[login]
+    assignment_manager = AssignmentManager(pathfinder, engine=engine, rotation_history=rotation_history)
+
+    with patch("builtins.open", mock_open(read_data="galleaus\ndayvinc\nzoeyk\n")):
+        for _ in range(10):
+            result_string, _ = assignment_manager.assign_indirects({"Waterspider": 2}, ["galleaus", "dayvinc", "zoeyk"],
+                                                                   base_path, dt.date(2025, 1, 2))
+            assert sorted(result_string.splitlines()) == ["Waterspider: dayvinc", "Waterspider: zoeyk"]
+
+
+@pytest.mark.parametrize("engine", ["greedy", "matching"])
+def test_assign_returns_records(assignment_manager, base_path, engine):
+    assignment_manager.engine = engine
+
+    with patch("builtins.open", mock_open(read_data="galleaus\ndayvinc\n")):
+        result = assignment_manager.assign({"End of Line": 3, "Audit": 0}, ["galleaus", "dayvinc"], base_path)
+
+    assert sorted(login for role, login in result.pairs()) == ["dayvinc", "galleaus"]
+    slots = [assignment.slot for assignment in result.assignments]
+    assert len(set(slots)) == 2 and set(slots) <= {0, 1, 2}
+    assert result.shortfalls == {"End of Line": 1}
@@ -0,0 +1,35 @@
+import json
+import pytest
+from utils import Assignment, AssignmentResult
+
+
+@pytest.fixture()
+def result():
+    return AssignmentResult([Assignment("End of Line", "galleaus", 0), Assignment("Audit", "dayvinc", 2)],
+                            {"Audit": 1, "Unload": 2})
+
+
+def test_text(result):
+    assert result.text() == ("End of Line: galleaus\nAudit: dayvinc\n",
+                             "Not enough eligible AAs to fill Audit.\nNot enough eligible AAs to fill Unload.\n")
+    assert result.render("text") == ("Not enough eligible AAs to fill Audit.\nNot enough eligible AAs to fill "
+                                     "Unload.\n\nEnd of Line: galleaus\nAudit: dayvinc\n")
+    assert AssignmentResult([Assignment("Audit", "dayvinc", 0)]).render() == "Audit: dayvinc\n"
+
+
+def test_render_csv(result):
+    assert result.render("csv").splitlines() == ["role,login,slot,unfilled", "End of Line,galleaus,0,",
+                                                 "Audit,dayvinc,2,", "Audit,,,1", "Unload,,,2"]
+
+
+def test_render_json(result):
+    assert json.loads(result.render("json")) == {
+        "assignments": [{"role": "End of Line", "login": "galleaus", "slot": 0},
+                        {"role": "Audit", "login": "dayvinc", "slot": 2}],
+        "shortfalls": {"Audit": 1, "Unload": 2}}
+
+
+def test_slotted(result):
+    assert result.pairs() == [("End of Line", "galleaus"), ("Audit", "dayvinc")]
+    with pytest.raises(AttributeError):
+        result.assignments[0].extra = True
@@ -1,7 +1,8 @@
+import datetime as dt
 import pytest
 from unittest.mock import Mock
 from managers import DisplayManager
-from utils import ScheduleBusinessLogic
+from utils import ScheduleBusinessLogic, Assignment, AssignmentResult
 from utils.interfaces import (AssignmentManagerInterface, PermissionsManagerInterface,
                               CustomizationManagerInterface, ScheduleFinderInterface, FilePathInterface)
 
@@ -48,7 +49,8 @@ def test_assign_indirects(mock_business_logic,
 
     business_logic.assignment_manager.assign_indirects.assert_called_once_with(nums_dict,
                                                                                scheduled_associates,
-                                                                               business_logic.base_path)
+                                                                               business_logic.base_path,
+                                                                               date=None)
 
 
 @pytest.mark.parametrize(
@@ -110,3 +112,108 @@ def test_get_scheduled_associates(mock_business_logic, mock_display_manager):
     business_logic.get_scheduled_associates(display_manager)
     business_logic.schedule_finder.get_scheduled_associates.assert_called_once_with(display_manager)
 
+
+def test_get_rosters(mock_business_logic, mock_display_manager):
+    business_logic = mock_business_logic
+    display_manager = mock_display_manager
+    shifts = [("date", "04-00-00"), ("date", "15-00-00")]
+
+    business_logic.get_rosters(display_manager, shifts)
+    business_logic.schedule_finder.get_rosters.assert_called_once_with(display_manager, shifts, 4)
+
+
+def test_get_scheduled_associates_cached(mock_business_logic, mock_display_manager):
+    business_logic = mock_business_logic
+    display_manager = mock_display_manager
+    business_logic.roster_cache = Mock()
+    business_logic.roster_cache.get.return_value = {"galleaus"}
+    business_logic.customization_manager.get_site.return_value = "SMF9\n"
+
+    result = business_logic.get_scheduled_associates(display_manager)
+    assert result == (display_manager.driver, {"galleaus"})
+    business_logic.roster_cache.get.assert_called_once_with("SMF9", display_manager.date, display_manager.shift)
+    business_logic.schedule_finder.get_scheduled_associates.assert_not_called()
+
+
+def test_get_scheduled_associates_force_refresh(mock_business_logic, mock_display_manager):
+    business_logic = mock_business_logic
+    display_manager = mock_display_manager
+    business_logic.roster_cache = Mock()
+    business_logic.customization_manager.get_site.return_value = "SMF9\n"
+    business_logic.schedule_finder.get_scheduled_associates.return_value = ("driver", {"dayvinc"})
+
+    result = business_logic.get_scheduled_associates(display_manager, force_refresh=True)
+    assert result == ("driver", {"dayvinc"})
+    business_logic.roster_cache.get.assert_not_called()
+    business_logic.roster_cache.put.assert_called_once_with("SMF9", display_manager.date, display_manager.shift,
+                                                            {"dayvinc"})
+
+
+def test_get_presets(mock_business_logic):
+    mock_business_logic.customization_manager.get_presets.return_value = {"Default AR": {"Audit": 2}}
+
+    assert mock_business_logic.get_presets() == {"Default AR": {"Audit": 2}}
+    mock_business_logic.customization_manager.get_presets.assert_called_once_with("/base")
+
+
+def test_role_permissions(mock_business_logic):
+    mock_business_logic.get_role_permissions("Audit")
+    mock_business_logic.save_role_permissions("Audit", "## Audit\n")
+    mock_business_logic.search_logins("gall")
+
+    permissions_manager = mock_business_logic.permissions_manager
+    permissions_manager.get_role_permissions.assert_called_once_with("Audit", "/base")
+    permissions_manager.save_role_permissions.assert_called_once_with("Audit", "## Audit\n", "/base")
+    permissions_manager.search_logins.assert_called_once_with("gall", "/base")
+
+
+def test_assign_indirects_records_history(mock_business_logic):
+    mock_business_logic.rotation_history = Mock()
+    mock_business_logic.customization_manager.get_site.return_value = "SMF9"
+    mock_business_logic.assignment_manager.assign_indirects.return_value = ("Audit: galleaus\nEnd of Line: dayvinc\n",
+                                                                           "")
+    date = dt.datetime(2025, 1, 2)
+
+    mock_business_logic.assign_indirects({"Audit": 1, "End of Line": 1}, ["galleaus", "dayvinc"], date, "04-00-00")
+
+    mock_business_logic.rotation_history.record.assert_called_once_with(
+        date, "04-00-00", [("Audit", "galleaus"), ("End of Line", "dayvinc")], site="SMF9")
+
+
+def test_assign_records_history(mock_business_logic):
+    mock_business_logic.rotation_history = Mock()
+    mock_business_logic.assignment_manager.assign.return_value = AssignmentResult([Assignment("Audit", "galleaus", 0)])
+    date = dt.datetime(2025, 1, 2)
+
+    result = mock_business_logic.assign({"Audit": 1}, ["galleaus"], date, "04-00-00", site="LAX9")
+
+    assert result.pairs() == [("Audit", "galleaus")]
+    mock_business_logic.assignment_manager.assign.assert_called_once_with({"Audit": 1}, ["galleaus"], "/base",
+                                                                          date=date)
+    mock_business_logic.rotation_history.record.assert_called_once_with(date, "04-00-00", [("Audit", "galleaus")],
+                                                                        site="LAX9")
+
+
+def test_assign_auto_export(mock_business_logic):
+    result = AssignmentResult([Assignment("Audit", "galleaus", 0)])
+    mock_business_logic.assignment_manager.assign.return_value = result
+    mock_business_logic.exporter = Mock()
+    date = dt.datetime(2025, 1, 2)
+
+    mock_business_logic.assign({"Audit": 1}, ["galleaus"], date, "04-00-00", site="SMF9")
+    mock_business_logic.exporter.export_assignments.assert_not_called()
+
+    mock_business_logic.auto_export = True
+    mock_business_logic.assign({"Audit": 1}, ["galleaus"], date, "04-00-00", site="SMF9")
+    mock_business_logic.exporter.export_assignments.assert_called_once_with("SMF9", date, "04-00-00", result)
+
+
+def test_export_assignments_uses_saved_site(mock_business_logic):
+    mock_business_logic.exporter = Mock()
+    mock_business_logic.customization_manager.get_site.return_value = "SMF9\n"
+    result = AssignmentResult()
+    date = dt.datetime(2025, 1, 2)
+
+    mock_business_logic.export_assignments(result, date, "04-00-00")
+
+    mock_business_logic.exporter.export_assignments.assert_called_once_with("SMF9\n", date, "04-00-00", result)
@@ -0,0 +1,122 @@
+import os
+import sys
+import json
+import subprocess
+import datetime as dt
+import pytest
+from unittest.mock import Mock, patch
+import cli
+from utils import Assignment, AssignmentResult
+
+
+@pytest.fixture()
+def session():
+    return cli.ConsoleSession("SMF9", dt.datetime(2025, 1, 2))
+
+
+@pytest.fixture()
+def business_logic():
+    business_logic = Mock()
+    business_logic.get_rosters.side_effect = lambda session, pairs, *args, **kwargs: {
+        pair: ({"galleaus", "dayvinc"} if pair[1] == "04-00-00" else None) for pair in pairs}
+    business_logic.assign.return_value = AssignmentResult([Assignment("Audit", "galleaus", 0)], {"Problem Solve": 1})
+    return business_logic
+
+
+def test_parse_headcounts():
+    result = cli.parse_headcounts(["Problem Solve=2", "# comment", "", "End of Line = 1"])
+    assert result == {"Problem Solve": 2, "End of Line": 1}
+
+    with pytest.raises(ValueError):
+        cli.parse_headcounts(["Audit"])
+
+
+def test_generate(business_logic, session):
+    results = cli.generate(business_logic, session, ["04-00-00", "15-00-00"], {"Audit": 1, "Problem Solve": 1})
+
+    assert results[0]["assignments"] == [{"role": "Audit", "login": "galleaus"}]
+    assert results[0]["shortfalls"] == ["Problem Solve"]
+    assert not results[1]["roster_found"]
+    business_logic.get_rosters.assert_called_once_with(
+        session, [(session.date, "04-00-00"), (session.date, "15-00-00")], 4, force_refresh=False, site="SMF9")
+
+
+@pytest.mark.parametrize("output_format", ["text", "json", "csv"])
+def test_render(business_logic, session, output_format):
+    results = cli.generate(business_logic, session, ["04-00-00"], {"Audit": 1})
+    output = cli.render(results, output_format)
+
+    if output_format == "json":
+        assert json.loads(output) == results
+    elif output_format == "csv":
+        assert output.splitlines()[1] == "SMF9,01-02-2025,04-00-00,Audit,galleaus,assigned"
+    else:
+        assert "Not enough eligible AAs to fill Problem Solve.\n\nAudit: galleaus\n" in output
+
+
+def test_cli_does_not_import_tkinter():
+    root = os.path.dirname(os.path.dirname(__file__))
+    code = "import sys, cli; print('tkinter' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_load_jobs(tmp_path):
+    batch_file = tmp_path / "jobs.json"
+    batch_file.write_text(json.dumps([
+        {"site": "smf9 ", "date": "01-02-2025", "shift": "04-00-00", "headcounts": {"Audit": "2"}},
+        {"site": "LAX9", "shifts": "all", "headcounts": ["Unload=1"]},
+        {"site": "SMF9", "shifts": ["09-30-00", "15-00-00"]},
+    ]))
+    args = cli.parse_args(["--batch", str(batch_file), "--date", "01-03-2025", "--role", "Detrash=1"])
+
+    jobs = cli.load_jobs(args.batch, args)
+
+    assert jobs[0] == {"site": "SMF9", "date": dt.datetime(2025, 1, 2), "shifts": ["04-00-00"],
+                       "headcounts": {"Audit": 2}}
+    assert jobs[1] == {"site": "LAX9", "date": dt.datetime(2025, 1, 3), "shifts": None,
+                       "headcounts": {"Unload": 1}}
+    assert jobs[2]["shifts"] == ["09-30-00", "15-00-00"]
+    assert jobs[2]["headcounts"] == {"Detrash": 1}
+    assert [[index for index, job in group] for group in cli.group_jobs(jobs)] == [[0, 2], [1]]
+
+
+def test_run_site_jobs(business_logic):
+    business_logic.get_shifts.return_value = "04-00-00\n15-00-00\n"
+    jobs = [(0, {"site": "SMF9", "date": dt.datetime(2025, 1, 2), "shifts": None, "headcounts": {"Audit": 1}}),
+            (2, {"site": "SMF9", "date": dt.datetime(2025, 1, 3), "shifts": ["04-00-00"],
+                 "headcounts": {"Audit": 1}})]
+
+    with patch("cli.create_business_logic", return_value=business_logic) as create:
+        output = cli.run_site_jobs(jobs)
+
+    assert [index for index, results in output] == [0, 2]
+    assert [(result["date"], result["shift"]) for result in output[0][1]] == [("01-02-2025", "04-00-00"),
+                                                                            ("01-02-2025", "15-00-00")]
+    assert output[1][1][0]["date"] == "01-03-2025"
+    assert business_logic.get_rosters.call_args.kwargs["site"] == "SMF9"
+    assert create.call_args.kwargs["worker"] == "SMF9"
+
+
+def test_batch_worker_files(tmp_path):
+    pathfinder = cli.utils.FilePath()
+    pathfinder.get_paths = lambda: (None, str(tmp_path))
+    with patch("utils.instrumentation.recorder.configure") as configure:
+        business_logic = cli.create_business_logic(pathfinder, str(tmp_path), worker="smf9")
+
+    assert configure.call_args.args[0] == os.path.join(str(tmp_path), "logs", "timings-SMF9.jsonl")
+    assert business_logic.rotation_history.file_path == os.path.join(str(tmp_path), "history",
+                                                                      "SMF9-assignments.csv")
+
+
+def test_multi_site_batch_needs_http_backend(tmp_path, monkeypatch):
+    batch_file = tmp_path / "jobs.json"
+    batch_file.write_text(json.dumps([{"site": "SMF9", "date": "01-02-2025", "shifts": ["04-00-00"]},
+                                      {"site": "LAX9", "date": "01-02-2025", "shifts": ["04-00-00"]}]))
+    monkeypatch.delenv("KOALITY_ROSTER_BACKEND", raising=False)
+
+    with patch("cli.utils.FilePath") as pathfinder, patch("cli.run_batch") as run_batch:
+        pathfinder.return_value.get_paths.return_value = (None, str(tmp_path))
+        with pytest.raises(SystemExit, match="KOALITY_ROSTER_BACKEND=http"):
+            cli.main(["--batch", str(batch_file), "--role", "Audit=1"])
+    run_batch.assert_not_called()
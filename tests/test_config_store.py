@@ -0,0 +1,100 @@
+import os
+import json
+import tempfile
+import pytest
+from unittest.mock import Mock
+from managers import CustomizationManager, PermissionsManager
+from utils import ConfigStore, FilePath
+from utils.config_store import DEFAULT_PRESETS
+
+
+@pytest.fixture()
+def base_path():
+    with tempfile.TemporaryDirectory() as base_path:
+        os.mkdir(os.path.join(base_path, "txt"))
+        yield base_path
+
+
+@pytest.fixture()
+def pathfinder():
+    pathfinder = Mock(spec=FilePath)
+    pathfinder.get_custom_text.side_effect = lambda base_path, name: os.path.join(base_path, "txt", f"{name}.txt")
+    return pathfinder
+
+
+def write_txt(base_path, name, text):
+    with open(os.path.join(base_path, "txt", f"{name}.txt"), "w") as file:
+        file.write(text)
+
+
+def test_migrates_txt_files(pathfinder, base_path):
+    write_txt(base_path, "site", "SMF9\n")
+    write_txt(base_path, "saved_shifts", "04-00-00\n09-30-00\n")
+    write_txt(base_path, "saved_roles", "End of Line\n\nAudit\n")
+
+    config_store = ConfigStore(pathfinder, base_path)
+
+    assert config_store.get("site") == "SMF9"
+    assert config_store.get("shifts") == ["04-00-00", "09-30-00"]
+    assert config_store.get("roles") == ["End of Line", "Audit"]
+    assert config_store.get("presets") == DEFAULT_PRESETS
+    assert os.path.exists(os.path.join(base_path, "config.json"))
+
+
+def test_migrates_without_txt_files(pathfinder, base_path):
+    config_store = ConfigStore(pathfinder, base_path)
+
+    assert config_store.get("site") == ""
+    assert config_store.get("shifts") == []
+
+
+def test_loads_once(pathfinder, base_path):
+    write_txt(base_path, "site", "SMF9\n")
+    config_store = ConfigStore(pathfinder, base_path)
+    config_store.get("site")
+
+    write_txt(base_path, "site", "LAX9\n")
+    os.remove(os.path.join(base_path, "config.json"))
+
+    assert config_store.get("site") == "SMF9"
+    assert pathfinder.get_custom_text.call_count == 3
+
+
+def test_set_persists(pathfinder, base_path):
+    ConfigStore(pathfinder, base_path).set("shifts", ["04-00-00"])
+
+    with open(os.path.join(base_path, "config.json")) as file:
+        assert json.load(file)["shifts"] == ["04-00-00"]
+    assert ConfigStore(pathfinder, base_path).get("shifts") == ["04-00-00"]
+    assert not [name for name in os.listdir(base_path) if name.endswith(".tmp")]
+
+
+def test_config_file_wins_over_txt(pathfinder, base_path):
+    with open(os.path.join(base_path, "config.json"), "w") as file:
+        json.dump({"site": "LAX9", "shifts": [], "roles": ["Audit"]}, file)
+    write_txt(base_path, "site", "SMF9\n")
+
+    config_store = ConfigStore(pathfinder, base_path)
+
+    assert config_store.get("site") == "LAX9"
+    assert config_store.get("presets") == DEFAULT_PRESETS
+
+
+def test_customization_manager(pathfinder, base_path):
+    customization_manager = CustomizationManager(pathfinder, config_store=ConfigStore(pathfinder, base_path))
+
+    customization_manager.save("site", ["SMF9"], base_path)
+    customization_manager.save("saved_shifts", ["04-00-00", "09-30-00"], base_path)
+    customization_manager.save("saved_roles", ["Audit"], base_path)
+
+    assert customization_manager.get_site(base_path) == "SMF9"
+    assert customization_manager.get_shifts(base_path) == "04-00-00\n09-30-00\n"
+    assert customization_manager.get_roles(base_path) == "Audit\n"
+    assert "Default Refurb" in customization_manager.get_presets(base_path)
+
+
+def test_permissions_manager_saved_roles(pathfinder, base_path):
+    write_txt(base_path, "saved_roles", "End of Line\nAudit\n")
+    permissions_manager = PermissionsManager(pathfinder, config_store=ConfigStore(pathfinder, base_path))
+
+    assert permissions_manager.get_saved_roles(base_path) == ["End of Line", "Audit"]
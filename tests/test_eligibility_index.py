@@ -0,0 +1,67 @@
+import os
+import tempfile
+import pytest
+from unittest.mock import patch
+from utils import FilePath, EligibilityIndex
+
+
+@pytest.fixture()
+def base_path():
+    with tempfile.TemporaryDirectory() as base_path:
+        os.makedirs(os.path.join(base_path, "txt"))
+        yield base_path
+
+
+@pytest.fixture()
+def eligibility_index():
+    return EligibilityIndex(FilePath())
+
+
+def write_role(base_path, role, text):
+    with open(os.path.join(base_path, "txt", f"{role}.txt"), "w") as file:
+        file.write(text)
+
+
+def test_logins_for_role(eligibility_index, base_path):
+    write_role(base_path, "End of Line", "## End of Line Permissions\n# MOR Shift\ngalleaus\n\ndayvinc\n")
+    result = eligibility_index.logins_for_role("End of Line", base_path)
+    assert result == {"galleaus", "dayvinc"}
+
+
+def test_file_read_once_until_changed(eligibility_index, base_path):
+    write_role(base_path, "Audit", "galleaus\n")
+    eligibility_index.logins_for_role("Audit", base_path)
+
+    with patch("utils.eligibility_index.open") as mocked_open:
+        assert eligibility_index.logins_for_role("Audit", base_path) == {"galleaus"}
+        mocked_open.assert_not_called()
+
+    write_role(base_path, "Audit", "galleaus\ndayvinc\n")
+    assert eligibility_index.logins_for_role("Audit", base_path) == {"galleaus", "dayvinc"}
+
+
+def test_roles_for_login(eligibility_index, base_path):
+    write_role(base_path, "Audit", "galleaus\n")
+    write_role(base_path, "Unload", "galleaus\ndayvinc\n")
+    assert eligibility_index.roles_for_login("galleaus", ["Audit", "Unload"], base_path) == {"Audit", "Unload"}
+
+    write_role(base_path, "Audit", "dayvinc\n")
+    eligibility_index.invalidate("Audit")
+    assert eligibility_index.roles_for_login("galleaus", ["Audit", "Unload"], base_path) == {"Unload"}
+    assert eligibility_index.roles_for_login("dayvinc", ["Audit", "Unload"], base_path) == {"Audit", "Unload"}
+
+
+def test_save_text(eligibility_index, base_path):
+    write_role(base_path, "Audit", "galleaus\n")
+    eligibility_index.logins_for_role("Audit", base_path)
+
+    eligibility_index.save_text("Audit", "dayvinc\n", base_path)
+
+    assert eligibility_index.logins_for_role("Audit", base_path) == {"dayvinc"}
+    assert eligibility_index.roles_for_login("galleaus", ["Audit"], base_path) == set()
+
+
+def test_missing_role_not_created(eligibility_index, base_path):
+    with pytest.raises(FileNotFoundError):
+        eligibility_index.logins_for_role("Audit", base_path)
+    assert not os.path.exists(os.path.join(base_path, "txt", "Audit.txt"))
@@ -0,0 +1,89 @@
+import csv
+import json
+import datetime as dt
+import pytest
+from utils import Exporter, Assignment, AssignmentResult
+
+DATE = dt.datetime(2025, 1, 2)
+
+
+@pytest.fixture()
+def result():
+    return AssignmentResult([Assignment("End of Line", "galleaus", 0), Assignment("Audit", "dayvinc", 1)],
+                            {"Audit": 1})
+
+
+def read_csv(path):
+    with open(path, "r", newline="", encoding="utf-8") as file:
+        return list(csv.DictReader(file))
+
+
+def test_export_assignments_csv_appends(tmp_path, result):
+    exporter = Exporter(str(tmp_path / "exports"))
+
+    path = exporter.export_assignments("smf9\n", DATE, "04-00-00", result)
+    exporter.export_assignments("SMF9", DATE, "15-00-00", AssignmentResult([Assignment("Audit", "smithj", 0)]))
+
+    assert path == str(tmp_path / "exports" / "SMF9-assignments.csv")
+    rows = read_csv(path)
+    assert [(row["shift"], row["role"], row["login"], row["slot"], row["unfilled"]) for row in rows] == [
+        ("04-00-00", "End of Line", "galleaus", "0", ""),
+        ("04-00-00", "Audit", "dayvinc", "1", ""),
+        ("04-00-00", "Audit", "", "", "1"),
+        ("15-00-00", "Audit", "smithj", "0", "")]
+    assert {row["site"] for row in rows} == {"SMF9"}
+    assert {row["date"] for row in rows} == {"2025-01-02"}
+
+
+def test_export_assignments_jsonl(tmp_path, result):
+    exporter = Exporter(str(tmp_path), "jsonl")
+
+    path = exporter.export_assignments("SMF9", DATE, "04-00-00", result)
+
+    with open(path, "r", encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+    assert path.endswith("SMF9-assignments.jsonl")
+    assert [(record["role"], record["login"], record["unfilled"]) for record in records] == [
+        ("End of Line", "galleaus", ""), ("Audit", "dayvinc", ""), ("Audit", "", 1)]
+
+
+def test_export_empty_result(tmp_path):
+    exporter = Exporter(str(tmp_path / "exports"))
+
+    assert exporter.export_assignments("SMF9", DATE, "04-00-00", AssignmentResult()) is None
+    assert not (tmp_path / "exports").exists()
+
+
+def test_export_roster_keeps_first_header(tmp_path):
+    exporter = Exporter(str(tmp_path))
+
+    exporter.export_roster("SMF9", DATE, "04-00-00", [{"Login": "galleaus", "Manager": "dayvinc"}])
+    path = exporter.export_roster("SMF9", DATE, "15-00-00", [{"Login": "smithj", "Badge": "123"}])
+
+    rows = read_csv(path)
+    assert list(rows[0]) == ["exported_at", "site", "date", "shift", "Login", "Manager"]
+    assert [(row["shift"], row["Login"], row["Manager"]) for row in rows] == [
+        ("04-00-00", "galleaus", "dayvinc"), ("15-00-00", "smithj", "")]
+
+
+def test_export_roster_streams_rows(tmp_path):
+    exporter = Exporter(str(tmp_path), "jsonl")
+    consumed = []
+
+    def rows():
+        for n in range(3):
+            consumed.append(n)
+            yield {"login": f"aa{n}", "attributes": {"trained": n > 0}}
+
+    path = exporter.export_roster("SMF9", DATE, "04-00-00", rows())
+
+    with open(path, "r", encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+    assert consumed == [0, 1, 2]
+    assert [record["login"] for record in records] == ["aa0", "aa1", "aa2"]
+    assert records[2]["attributes"] == {"trained": True}
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        Exporter(str(tmp_path), "xlsx")
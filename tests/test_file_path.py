@@ -2,6 +2,7 @@ import os
 import sys
 import pytest
 import tempfile
+from unittest.mock import patch
 from utils import FilePath
 
 
@@ -107,3 +108,22 @@ def get_image_path(file_path):
 
     result3 = file_path.get_image_path(fake_temp_path, fake_base_path, fake_file)
     assert result3 == expected1
+
+
+def test_app_init_copies_only_missing(file_path):
+    with tempfile.TemporaryDirectory() as temp_path, tempfile.TemporaryDirectory() as base_path:
+        os.makedirs(os.path.join(temp_path, "txt"))
+        os.makedirs(os.path.join(base_path, "txt"))
+        for filename in ["site.txt", "saved_roles.txt"]:
+            with open(os.path.join(temp_path, "txt", filename), "w") as file:
+                file.write("bundled")
+        with open(os.path.join(base_path, "txt", "site.txt"), "w") as file:
+            file.write("LAX9")
+
+        with patch("utils.file_path.BOOTSTRAP_MANIFEST", ("site.txt", "saved_roles.txt")):
+            file_path.app_init(temp_path, base_path)
+
+        with open(os.path.join(base_path, "txt", "site.txt")) as file:
+            assert file.read() == "LAX9"
+        with open(os.path.join(base_path, "txt", "saved_roles.txt")) as file:
+            assert file.read() == "bundled"
@@ -0,0 +1,119 @@
+import json
+import threading
+import datetime as dt
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+import pytest
+from unittest.mock import Mock
+from utils import HttpScheduleFinder
+
+ROSTERS = {"04-00-00": {"roster": [{"employeeLogin": "galleaus", "manager": "dayvinc"}, {"login": "dayvinc"}]},
+           "15-00-00": [{"login": "smithj"}]}
+
+
+class StubRosterHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        if "session=valid" not in self.headers.get("Cookie", ""):
+            self.send_response(302)
+            self.send_header("Location", "/login")
+            self.end_headers()
+            return
+        if query["site"] != ["SMF9"] or query["date"] != ["2025-01-02"] or query["shift"][0] not in ROSTERS:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        body = json.dumps(ROSTERS[query["shift"][0]]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def roster_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubRosterHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/roster"
+    server.shutdown()
+
+
+@pytest.fixture()
+def session_store():
+    session_store = Mock()
+    session_store.load.return_value = [{"name": "session", "value": "valid", "domain": "127.0.0.1"}]
+    return session_store
+
+
+@pytest.fixture()
+def display():
+    display = Mock()
+    display.driver = None
+    display.site = "SMF9\n"
+    display.date = dt.datetime(2025, 1, 2)
+    display.shift = "04-00-00"
+    return display
+
+
+def test_get_scheduled_associates(roster_url, session_store, display):
+    browser_finder = Mock()
+    finder = HttpScheduleFinder(browser_finder, session_store, roster_url)
+
+    driver, logins = finder.get_scheduled_associates(display)
+    assert driver is None
+    assert logins == {"galleaus", "dayvinc"}
+    browser_finder.start_session.assert_not_called()
+
+
+def test_get_rosters(roster_url, session_store, display):
+    finder = HttpScheduleFinder(Mock(), session_store, roster_url)
+    date = dt.datetime(2025, 1, 2)
+
+    result = finder.get_rosters(display, [(date, "04-00-00"), (date, "15-00-00"), (date, "20-30-00")])
+    assert result == {(date, "04-00-00"): {"galleaus", "dayvinc"},
+                      (date, "15-00-00"): {"smithj"},
+                      (date, "20-30-00"): None}
+
+
+def test_expired_session_renewed_through_browser(roster_url, session_store, display):
+    session_store.load.return_value = [{"name": "session", "value": "expired", "domain": "127.0.0.1"}]
+    browser_finder = Mock()
+
+    def start_session(display):
+        display.driver = Mock()
+        session_store.load.return_value = [{"name": "session", "value": "valid", "domain": "127.0.0.1"}]
+        return True
+
+    browser_finder.start_session.side_effect = start_session
+    finder = HttpScheduleFinder(browser_finder, session_store, roster_url)
+
+    driver, logins = finder.get_scheduled_associates(display)
+    assert logins == {"galleaus", "dayvinc"}
+    assert driver is None
+    browser_finder.start_session.assert_called_once()
+
+
+def test_failed_login(roster_url, session_store, display):
+    session_store.load.return_value = []
+    browser_finder = Mock()
+    browser_finder.start_session.return_value = False
+    finder = HttpScheduleFinder(browser_finder, session_store, roster_url)
+
+    assert finder.get_scheduled_associates(display) == (None, None)
+
+
+def test_rosters_exported(roster_url, session_store, display):
+    exporter = Mock()
+    finder = HttpScheduleFinder(Mock(), session_store, roster_url, exporter=exporter)
+
+    finder.get_scheduled_associates(display)
+
+    site, date, shift, rows = exporter.export_roster.call_args.args
+    assert (site, date, shift) == ("SMF9\n", display.date, "04-00-00")
+    assert {row["login"] for row in rows} == {"galleaus", "dayvinc"}
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import pytest
+from utils import instrumentation
+from utils.instrumentation import StepRecorder
+
+
+@pytest.fixture()
+def recorder(monkeypatch):
+    recorder = StepRecorder()
+    monkeypatch.setattr(instrumentation, "recorder", recorder)
+    yield recorder
+    for handler in list(recorder.logger.handlers):
+        recorder.logger.removeHandler(handler)
+        handler.close()
+
+
+def test_summary_percentiles(recorder):
+    for ms in range(1, 101):
+        recorder.record("ScheduleFinder.select_date", ms / 1000)
+
+    summary = recorder.summary(runs=100)["ScheduleFinder.select_date"]
+    assert summary == {"count": 100, "p50": 50, "p95": 95, "max": 100}
+    assert recorder.summary(runs=10)["ScheduleFinder.select_date"]["p50"] == 95
+
+
+def test_timed_records_calls_and_failures(recorder):
+    class Finder:
+        @instrumentation.timed
+        def select_date(self, fail=False):
+            if fail:
+                raise ValueError()
+            return "selected"
+
+    assert Finder().select_date() == "selected"
+    with pytest.raises(ValueError):
+        Finder().select_date(fail=True)
+
+    assert recorder.summary()["test_timed_records_calls_and_failures.<locals>.Finder.select_date"]["count"] == 2
+
+
+def test_log_file_rotates_and_is_read_back(recorder):
+    with tempfile.TemporaryDirectory() as logs_dir:
+        log_file = os.path.join(logs_dir, "timings.jsonl")
+        recorder.configure(log_file, max_bytes=2000, backup_count=2)
+        for _ in range(40):
+            recorder.record("Generate", 0.5)
+
+        assert os.path.exists(f"{log_file}.1")
+        assert StepRecorder().summary() == {}
+
+        reader = StepRecorder()
+        reader.configure(log_file, max_bytes=2000, backup_count=2)
+        try:
+            assert reader.summary(runs=5)["Generate"] == {"count": 5, "p50": 500, "p95": 500, "max": 500}
+        finally:
+            reader.logger.handlers[0].close()
+
+
+def test_profiled_dumps_stats():
+    with tempfile.TemporaryDirectory() as profile_dir:
+        with instrumentation.profiled(profile_dir):
+            sum(range(1000))
+        assert [name[-5:] for name in os.listdir(profile_dir)] == [".prof"]
+
+    with instrumentation.profiled(None):
+        pass
+
+
+def test_format_summary():
+    text = instrumentation.format_summary({"Generate": {"count": 3, "p50": 1200.0, "p95": 1500.0, "max": 1500.0}})
+    assert text.splitlines()[1].split() == ["Generate", "3", "1200.0", "1500.0", "1500.0"]
+    assert "No timings" in instrumentation.format_summary({})
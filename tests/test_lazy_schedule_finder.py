@@ -0,0 +1,34 @@
+import os
+import sys
+import subprocess
+import pytest
+from unittest.mock import Mock
+from utils import LazyScheduleFinder
+
+
+@pytest.fixture()
+def factory():
+    return Mock()
+
+
+def test_finder_built_on_first_use(factory):
+    lazy_finder = LazyScheduleFinder(factory)
+    factory.assert_not_called()
+
+    display = Mock()
+    lazy_finder.get_scheduled_associates(display)
+    lazy_finder.get_rosters(display, [("date", "04-00-00")])
+
+    factory.assert_called_once_with()
+    factory.return_value.get_scheduled_associates.assert_called_once_with(display)
+    factory.return_value.get_rosters.assert_called_once_with(display, [("date", "04-00-00")], 4)
+
+
+def test_startup_does_not_import_selenium(tmp_path):
+    root = os.path.dirname(os.path.dirname(__file__))
+    code = ("import sys, main, utils; pathfinder = utils.FilePath(); "
+            f"pathfinder.get_paths = lambda: (None, {str(tmp_path)!r}); "
+            f"main.create_business_logic(pathfinder, {str(tmp_path)!r}); "
+            "print(any(name.split('.')[0] in ('selenium', 'urllib3') for name in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,125 @@
+import os
+import sqlite3
+import tempfile
+import pytest
+from unittest.mock import patch
+from utils import FilePath, PermissionsDatabase
+
+
+@pytest.fixture()
+def base_path():
+    with tempfile.TemporaryDirectory() as base_path:
+        os.makedirs(os.path.join(base_path, "txt"))
+        yield base_path
+
+
+@pytest.fixture()
+def permissions_db(base_path):
+    permissions_db = PermissionsDatabase.open(FilePath(), base_path)
+    yield permissions_db
+    permissions_db.close()
+
+
+def write_role(base_path, role, text):
+    with open(os.path.join(base_path, "txt", f"{role}.txt"), "w") as file:
+        file.write(text)
+
+
+def read_role(base_path, role):
+    with open(os.path.join(base_path, "txt", f"{role}.txt"), "r") as file:
+        return file.read()
+
+
+def test_imports_role_on_first_use(permissions_db, base_path):
+    write_role(base_path, "End of Line", "## End of Line Permissions\n# MOR Shift\ngalleaus\n\ndayvinc\n")
+
+    assert permissions_db.logins_for_role("End of Line", base_path) == {"galleaus", "dayvinc"}
+
+    with patch("builtins.open") as mocked_open:
+        assert permissions_db.logins_for_role("End of Line", base_path) == {"galleaus", "dayvinc"}
+        mocked_open.assert_not_called()
+
+
+def test_roles_for_login(permissions_db, base_path):
+    permissions_db.upsert({"Audit": ["galleaus"], "Unload": ["galleaus", "dayvinc"], "Detrash": ["dayvinc"]})
+
+    assert permissions_db.roles_for_login("galleaus", ["Audit", "Unload", "Detrash"], base_path) == {"Audit",
+                                                                                                      "Unload"}
+    assert permissions_db.roles_for_login("galleaus", ["Unload"], base_path) == {"Unload"}
+    assert permissions_db.roles_for_login("nobody", ["Audit"], base_path) == set()
+
+
+def test_upsert_replace_and_append(permissions_db, base_path):
+    permissions_db.upsert({"Audit": ["galleaus", "dayvinc", "galleaus"]})
+    permissions_db.upsert({"Audit": ["zoeyk", "dayvinc"]}, replace=False)
+    assert permissions_db.logins_in_order("Audit", base_path) == ["galleaus", "dayvinc", "zoeyk"]
+
+    permissions_db.upsert({"Audit": ["zoeyk"]})
+    assert permissions_db.logins_in_order("Audit", base_path) == ["zoeyk"]
+
+
+def test_upsert_is_one_transaction(permissions_db, base_path):
+    permissions_db.upsert({"Audit": ["galleaus"]})
+
+    with pytest.raises(TypeError):
+        permissions_db.upsert({"Audit": ["dayvinc"], "Unload": None})
+
+    assert permissions_db.logins_for_role("Audit", base_path) == {"galleaus"}
+
+
+def test_save_text_and_export(permissions_db, base_path):
+    permissions_db.save_text("Audit", "## Audit Permissions\ngalleaus\ndayvinc\n", base_path)
+    permissions_db.export_txt(["Audit"], base_path)
+
+    text = read_role(base_path, "Audit")
+    assert text == permissions_db.get_text("Audit", base_path)
+    assert text.startswith("## Audit Permissions")
+    assert text.split("\n")[1:3] == ["galleaus", "dayvinc"]
+
+
+def test_persists_between_connections(permissions_db, base_path):
+    permissions_db.upsert({"Audit": ["galleaus"]})
+    permissions_db.close()
+
+    reopened = PermissionsDatabase.open(FilePath(), base_path)
+    try:
+        assert reopened.logins_for_role("Audit", base_path) == {"galleaus"}
+    finally:
+        reopened.close()
+
+
+def test_round_trip_keeps_headers_and_comments(permissions_db, base_path):
+    text = "## End of Line Permissions ----\n# MOR Shift\ngalleaus\n\n# NIT Shift\ndayvinc\n\n"
+    write_role(base_path, "End of Line", text)
+
+    assert permissions_db.get_text("End of Line", base_path) == text
+    permissions_db.export_txt(["End of Line"], base_path)
+    assert read_role(base_path, "End of Line") == text
+
+    edited = text.replace("dayvinc", "dayvinc\nsmithj")
+    permissions_db.save_text("End of Line", edited, base_path)
+    permissions_db.export_txt(["End of Line"], base_path)
+    assert read_role(base_path, "End of Line") == edited
+    assert permissions_db.logins_for_role("End of Line", base_path) == {"galleaus", "dayvinc", "smithj"}
+
+
+def test_upsert_drops_stale_text(permissions_db, base_path):
+    permissions_db.save_text("Audit", "## Audit Permissions\n# MOR Shift\ngalleaus\n", base_path)
+    permissions_db.upsert({"Audit": ["dayvinc"]}, replace=False)
+
+    assert permissions_db.get_text("Audit", base_path).split("\n")[1:3] == ["galleaus", "dayvinc"]
+
+
+def test_upgrades_schema_1_database(base_path):
+    db_path = os.path.join(base_path, "old.db")
+    connection = sqlite3.connect(db_path)
+    connection.executescript("CREATE TABLE roles (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, "
+                             "updated_at TEXT NOT NULL);")
+    connection.close()
+
+    permissions_db = PermissionsDatabase(db_path, FilePath())
+    try:
+        permissions_db.save_text("Audit", "## Audit Permissions\ngalleaus\n", base_path)
+        assert permissions_db.get_text("Audit", base_path) == "## Audit Permissions\ngalleaus\n"
+    finally:
+        permissions_db.close()
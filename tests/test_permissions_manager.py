@@ -102,3 +102,46 @@ def test_save_permissions(permissions_manager, base_path, text_box):
         with open(temp_path) as file:
             content = file.read()
             assert content == new_content
+
+
+def test_save_edited_permissions_skips_unchanged(permissions_manager, base_path):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = os.path.join(temp_dir, "Audit.txt")
+        with open(temp_path, "w") as file:
+            file.write("## Audit\n\ngalleaus\n\n")
+        permissions_manager.pathfinder.get_permissions.return_value = temp_path
+
+        with patch("managers.permissions_manager.write_atomic") as mocked_write:
+            assert not permissions_manager.save_edited_permissions("Audit", base_path,
+                                                                   iter(["## Audit\n\ngalleaus\n\n"]))
+            mocked_write.assert_not_called()
+
+        assert permissions_manager.save_edited_permissions("Audit", base_path,
+                                                           iter(["## Audit\n\ngalleaus\ndayvinc\n\n"]))
+        with open(temp_path) as file:
+            assert file.read() == "## Audit\n\ngalleaus\ndayvinc\n\n"
+        assert os.listdir(temp_dir) == ["Audit.txt"]
+
+
+def test_search_logins(base_path):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for role, text in (("Audit", "## Audit\nGalleaus\ndayvinc\n"), ("Unload", "## Unload\ndayvinc\n"),
+                           ("Detrash", "## Detrash\nzoeyk\n")):
+            with open(os.path.join(temp_dir, f"{role}.txt"), "w") as file:
+                file.write(text)
+        pathfinder = Mock(spec=FilePath())
+        pathfinder.get_permissions.side_effect = lambda role, path: os.path.join(temp_dir, f"{role}.txt")
+        permissions_manager = PermissionsManager(pathfinder)
+
+        with patch.object(permissions_manager, "get_saved_roles", return_value=["Audit", "Unload", "Detrash"]):
+            assert permissions_manager.search_logins("ga", base_path) == {"Audit": ["Galleaus"]}
+            assert permissions_manager.search_logins("V", base_path) == {"Audit": ["dayvinc"], "Unload": ["dayvinc"]}
+            assert permissions_manager.search_logins("  ", base_path) == {}
+
+
+def test_save_role_permissions(permissions_manager, base_path):
+    with patch.object(permissions_manager, "save_edited_permissions", return_value=True) as mocked_save:
+        assert permissions_manager.save_role_permissions("Audit", "## Audit\ngalleaus\n", base_path)
+
+    role, path, texts = mocked_save.call_args.args
+    assert (role, path, list(texts)) == ("Audit", base_path, ["## Audit\ngalleaus\n"])
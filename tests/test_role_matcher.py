@@ -0,0 +1,38 @@
+import random
+import pytest
+from utils.role_matcher import RoleMatcher
+
+
+@pytest.fixture()
+def role_matcher():
+    return RoleMatcher(random.Random(0))
+
+
+def test_match_prefers_full_fill(role_matcher):
+    slots = ["End of Line", "Problem Solve"]
+    eligible = {"End of Line": ["galleaus", "dayvinc"], "Problem Solve": ["galleaus"]}
+
+    for _ in range(20):
+        result = role_matcher.match(slots, eligible)
+        assert result == {0: "dayvinc", 1: "galleaus"}
+
+
+def test_match_reports_shortfall(role_matcher):
+    slots = ["Audit", "Audit", "Audit"]
+    eligible = {"Audit": ["galleaus", "dayvinc"]}
+
+    result = role_matcher.match(slots, eligible)
+    assert len(result) == 2
+    assert set(result.values()) == {"galleaus", "dayvinc"}
+
+
+def test_match_no_associate_used_twice(role_matcher):
+    logins = [f"login{n}" for n in range(300)]
+    eligible = {f"Role{r}": logins[r * 7:r * 7 + 40] for r in range(30)}
+    slots = [role for role in eligible for _ in range(3)]
+
+    result = role_matcher.match(slots, eligible)
+    assert len(result) == len(slots)
+    assert len(set(result.values())) == len(result)
+    for slot, login in result.items():
+        assert login in eligible[slots[slot]]
@@ -0,0 +1,40 @@
+import datetime as dt
+import tempfile
+import pytest
+from unittest.mock import patch
+from utils import RosterCache
+
+
+@pytest.fixture()
+def roster_cache():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        yield RosterCache(cache_dir, ttl=60)
+
+
+@pytest.fixture()
+def date():
+    return dt.datetime(2025, 1, 2)
+
+
+def test_get_missing(roster_cache, date):
+    assert roster_cache.get("SMF9", date, "04-00-00") is None
+
+
+def test_put_and_get(roster_cache, date):
+    roster_cache.put("SMF9", date, "04-00-00", {"galleaus", "dayvinc"})
+    assert roster_cache.get("SMF9", date, "04-00-00") == {"galleaus", "dayvinc"}
+    assert roster_cache.get("SMF9", date, "09-30-00") is None
+    assert roster_cache.get("LAX9", date, "04-00-00") is None
+
+
+def test_expired(roster_cache, date):
+    with patch("utils.roster_cache.time.time", return_value=1000.0):
+        roster_cache.put("SMF9", date, "04-00-00", {"galleaus"})
+    with patch("utils.roster_cache.time.time", return_value=1061.0):
+        assert roster_cache.get("SMF9", date, "04-00-00") is None
+
+
+def test_invalidate(roster_cache, date):
+    roster_cache.put("SMF9", date, "04-00-00", {"galleaus"})
+    roster_cache.invalidate("SMF9", date, "04-00-00")
+    assert roster_cache.get("SMF9", date, "04-00-00") is None
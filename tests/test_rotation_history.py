@@ -0,0 +1,114 @@
+import os
+import tempfile
+import datetime as dt
+import pytest
+from utils import RotationHistory
+
+
+@pytest.fixture()
+def history_file():
+    with tempfile.TemporaryDirectory() as history_dir:
+        yield os.path.join(history_dir, "history", "assignments.csv")
+
+
+def days_ago(days):
+    return dt.date.today() - dt.timedelta(days=days)
+
+
+def test_count_and_last_assigned(history_file):
+    history = RotationHistory(history_file, window_days=7)
+    history.record(days_ago(2), "04-00-00", [("Waterspider", "galleaus"), ("Audit", "dayvinc")])
+    history.record(days_ago(1), "04-00-00", [("Waterspider", "galleaus")])
+
+    assert history.count("galleaus", "Waterspider", dt.date.today()) == 2
+    assert history.count("galleaus", "Audit", dt.date.today()) == 0
+    assert history.last_assigned("galleaus", "Waterspider") == days_ago(1)
+    assert history.last_assigned("zoeyk", "Waterspider") is None
+
+
+def test_window_moves_forward(history_file):
+    history = RotationHistory(history_file, window_days=7)
+    history.record(days_ago(10), "04-00-00", [("Waterspider", "galleaus")])
+    history.record(days_ago(3), "04-00-00", [("Waterspider", "galleaus")])
+
+    assert history.count("galleaus", "Waterspider", dt.date.today()) == 1
+    assert history.count("galleaus", "Waterspider", dt.date.today() + dt.timedelta(days=5)) == 0
+    assert history.last_assigned("galleaus", "Waterspider") == days_ago(3)
+
+
+def test_regenerated_shift_replaces_record(history_file):
+    history = RotationHistory(history_file)
+    history.record(days_ago(1), "04-00-00", [("Waterspider", "galleaus")])
+    history.record(days_ago(1), "04-00-00", [("Waterspider", "dayvinc")])
+
+    assert history.count("galleaus", "Waterspider", dt.date.today()) == 0
+    assert history.count("dayvinc", "Waterspider", dt.date.today()) == 1
+
+    reloaded = RotationHistory(history_file)
+    assert reloaded.count("galleaus", "Waterspider", dt.date.today()) == 0
+    assert reloaded.count("dayvinc", "Waterspider", dt.date.today()) == 1
+
+
+def test_reload_and_compact(history_file):
+    history = RotationHistory(history_file, retention_days=30)
+    for days in range(60, 0, -1):
+        history.record(days_ago(days), "04-00-00", [("Audit", "galleaus")])
+
+    reloaded = RotationHistory(history_file, window_days=10, retention_days=20)
+    assert reloaded.count("galleaus", "Audit", dt.date.today()) == 9
+    assert reloaded.last_assigned("galleaus", "Audit") == days_ago(1)
+    with open(history_file) as file:
+        assert len(file.readlines()) == 1 + 20
+
+
+def test_recency_orders_least_recent_first(history_file):
+    history = RotationHistory(history_file)
+    history.record(days_ago(3), "04-00-00", [("Audit", "galleaus"), ("Unload", "dayvinc")])
+    history.record(days_ago(1), "04-00-00", [("Audit", "galleaus"), ("Unload", "zoeyk")])
+    history.record(days_ago(2), "04-00-00", [("Audit", "zoeyk")])
+
+    logins = sorted(["galleaus", "zoeyk", "dayvinc"], key=lambda login: history.recency(login, "Audit",
+                                                                                        dt.date.today()))
+    assert logins == ["dayvinc", "zoeyk", "galleaus"]
+
+
+def test_regenerated_shift_rolls_back_last_assigned(history_file):
+    history = RotationHistory(history_file, window_days=7)
+    history.record(days_ago(20), "04-00-00", [("Audit", "galleaus")])
+    history.record(days_ago(1), "04-00-00", [("Audit", "galleaus")])
+    history.record(days_ago(1), "04-00-00", [("Audit", "dayvinc")])
+    history.record(days_ago(30), "15-00-00", [("Audit", "smithj")])
+    history.record(days_ago(30), "15-00-00", [("Audit", "zoeyk")])
+
+    for reloaded in (history, RotationHistory(history_file, window_days=7)):
+        assert reloaded.last_assigned("galleaus", "Audit") == days_ago(20)
+        assert reloaded.last_assigned("dayvinc", "Audit") == days_ago(1)
+        assert reloaded.last_assigned("smithj", "Audit") is None
+        assert reloaded.last_assigned("zoeyk", "Audit") == days_ago(30)
+
+
+def test_sites_keep_separate_records(history_file):
+    history = RotationHistory(history_file)
+    history.record(days_ago(1), "04-00-00", [("Audit", "smf9_aa")], site="smf9")
+    RotationHistory(history_file).record(days_ago(1), "04-00-00", [("Audit", "lax9_aa")], site="LAX9")
+
+    for reloaded in (history, RotationHistory(history_file)):
+        assert reloaded.count("smf9_aa", "Audit", dt.date.today()) == 1
+        assert reloaded.last_assigned("smf9_aa", "Audit") == days_ago(1)
+    assert RotationHistory(history_file).count("lax9_aa", "Audit", dt.date.today()) == 1
+
+
+def test_reads_history_without_site_column(history_file):
+    os.makedirs(os.path.dirname(history_file))
+    with open(history_file, "w") as file:
+        file.write("recorded_at,date,shift,role,login\n"
+                   f"2025-01-01T04:00:00,{days_ago(2):%Y-%m-%d},04-00-00,Audit,galleaus\n")
+
+    history = RotationHistory(history_file)
+    history.record(days_ago(1), "04-00-00", [("Audit", "dayvinc")], site="SMF9")
+
+    reloaded = RotationHistory(history_file)
+    assert reloaded.last_assigned("galleaus", "Audit") == days_ago(2)
+    assert reloaded.last_assigned("dayvinc", "Audit") == days_ago(1)
+    with open(history_file) as file:
+        assert file.readline().strip() == ",".join(("recorded_at", "site", "date", "shift", "role", "login"))
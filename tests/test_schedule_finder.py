@@ -0,0 +1,449 @@
+import pytest
+from unittest.mock import Mock, patch
+from selenium.common.exceptions import (JavascriptException, TimeoutException, InvalidSessionIdException,
+                                        WebDriverException)
+from utils import ScheduleFinder
+from utils.schedule_finder import SessionLost, SessionWatchdog, RosterIncomplete
+
+
+@pytest.fixture()
+def schedule_finder():
+    return ScheduleFinder()
+
+
+@pytest.fixture()
+def driver():
+    driver = Mock()
+    driver.execute_script.return_value = {"headers": ["Login", "Manager"],
+                                          "rows": [["galleaus", "dayvinc"], ["dayvinc", ""], ["ignored", "x"]]}
+    return driver
+
+
+@pytest.fixture(autouse=True)
+def no_wait():
+    with patch("utils.schedule_finder.WebDriverWait"):
+        yield
+
+
+def test_extract_logins_bulk(schedule_finder, driver):
+    result = schedule_finder.extract_logins(driver)
+    assert result == {"galleaus", "dayvinc"}
+    driver.find_elements.assert_not_called()
+
+
+def test_extract_logins_falls_back_per_element(schedule_finder, driver):
+    driver.execute_script.side_effect = JavascriptException("blocked")
+    cells = [Mock(text="galleaus"), Mock(text=""), Mock(text="ignored")]
+    driver.find_elements.return_value = cells
+
+    result = schedule_finder.extract_logins(driver)
+    assert result == {"galleaus"}
+
+
+def test_extract_roster(schedule_finder, driver):
+    driver.execute_script.return_value = {"headers": ["Login", ""], "rows": [["galleaus", "DAY"]]}
+    result = schedule_finder.extract_roster(driver)
+    assert result == [{"Login": "galleaus", "column_1": "DAY"}]
+
+
+def test_wait_for_stable_rows(schedule_finder):
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    row_counts = iter([0, 120, 250, 400, 400, 400])
+    driver = Mock()
+    driver.execute_script.side_effect = lambda script: next(row_counts) if "length" in script else True
+
+    with patch("utils.schedule_finder.WebDriverWait", WebDriverWait):
+        schedule_finder.POLL_FREQUENCY = 0.001
+        schedule_finder.wait_for_stable_rows(driver, timeout=1)
+
+    assert next(row_counts, None) is None
+
+
+def test_get_rosters_survives_browser_start_failure(schedule_finder):
+    display = Mock()
+    display.driver.execute_cdp_cmd.return_value = {"cookies": []}
+    started = []
+
+    def setup_webdriver(persistent=True):
+        if not started:
+            started.append(True)
+            raise WebDriverException("chrome failed to start")
+        return Mock()
+
+    schedule_finder.setup_webdriver = setup_webdriver
+    schedule_finder.fetch_roster = Mock(return_value={"galleaus"})
+    shifts = [("01-02-2025", "04-00-00"), ("01-02-2025", "15-00-00")]
+
+    result = schedule_finder.get_rosters(display, shifts, max_workers=1)
+
+    assert result == {shifts[0]: None, shifts[1]: {"galleaus"}}
+
+
+def test_wait_for_stable_rows_accepts_empty_roster(schedule_finder):
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    driver = Mock()
+    driver.execute_script.side_effect = lambda script: 0 if "length" in script else True
+
+    with patch("utils.schedule_finder.WebDriverWait", WebDriverWait):
+        schedule_finder.POLL_FREQUENCY = 0.001
+        schedule_finder.wait_for_stable_rows(driver, timeout=1)
+
+    row_polls = [call for call in driver.execute_script.call_args_list if "length" in call.args[0]]
+    assert len(row_polls) == schedule_finder.EMPTY_POLLS
+
+
+def test_extract_logins_incremental_empty_roster(no_sleep):
+    driver = Mock()
+    driver.execute_script.return_value = None
+
+    assert ScheduleFinder(incremental=True).extract_logins(driver) == set()
+
+
+def test_login_skipped_when_session_valid(schedule_finder, monkeypatch):
+    monkeypatch.setattr("os.getlogin", lambda: "galleaus")
+    schedule_finder.session_store = Mock()
+    schedule_finder.session_store.load.return_value = [{"name": "session", "value": "abc"}]
+    schedule_finder.session_is_valid = Mock(return_value=True)
+    driver = Mock()
+    display = Mock()
+
+    schedule_finder.login_to_site(driver, display)
+
+    driver.execute_cdp_cmd.assert_called_once_with("Network.setCookies",
+                                                   {"cookies": [{"name": "session", "value": "abc"}]})
+    display.midway_pin.assert_not_called()
+    schedule_finder.session_store.save.assert_not_called()
+
+
+def test_login_saves_session(schedule_finder, monkeypatch):
+    monkeypatch.setattr("os.getlogin", lambda: "galleaus")
+    schedule_finder.session_store = Mock()
+    schedule_finder.session_store.load.return_value = []
+    schedule_finder.session_is_valid = Mock(return_value=False)
+    driver = Mock()
+    driver.execute_cdp_cmd.return_value = {"cookies": [{"name": "session", "value": "new"}]}
+    display = Mock()
+
+    schedule_finder.login_to_site(driver, display)
+
+    display.midway_pin.assert_called_once()
+    display.security_key.assert_called_once()
+    schedule_finder.session_store.save.assert_called_once_with([{"name": "session", "value": "new"}])
+
+
+def test_get_rosters(schedule_finder):
+    display = Mock()
+    display.driver.execute_cdp_cmd.return_value = {"cookies": [{"name": "session", "value": "abc", "size": 10}]}
+    pool_drivers = []
+
+    def setup_webdriver(persistent=True):
+        assert not persistent
+        driver = Mock()
+        pool_drivers.append(driver)
+        return driver
+
+    def fetch_roster(driver, date, shift, need_attribute, on_table=None):
+        if shift == "bad":
+            raise TimeoutException()
+        return {f"{date}-{shift}"}
+
+    schedule_finder.setup_webdriver = setup_webdriver
+    schedule_finder.fetch_roster = fetch_roster
+    shifts = [("01-02-2025", "04-00-00"), ("01-02-2025", "bad"), ("01-03-2025", "15-00-00")]
+
+    result = schedule_finder.get_rosters(display, shifts, max_workers=2)
+
+    assert result == {("01-02-2025", "04-00-00"): {"01-02-2025-04-00-00"},
+                      ("01-02-2025", "bad"): None,
+                      ("01-03-2025", "15-00-00"): {"01-03-2025-15-00-00"}}
+    assert 1 <= len(pool_drivers) <= 3
+    for driver in pool_drivers:
+        driver.execute_cdp_cmd.assert_called_once_with("Network.setCookies",
+                                                       {"cookies": [{"name": "session", "value": "abc"}]})
+        driver.quit.assert_called_once()
+
+
+def test_extract_logins_passes_table(schedule_finder, driver):
+    on_table = Mock()
+    schedule_finder.extract_logins(driver, on_table=on_table)
+    on_table.assert_called_once_with(["Login", "Manager"],
+                                     [["galleaus", "dayvinc"], ["dayvinc", ""], ["ignored", "x"]])
+
+
+def test_roster_export(driver):
+    exporter = Mock()
+    schedule_finder = ScheduleFinder(exporter=exporter)
+
+    assert ScheduleFinder().roster_export("SMF9", "date", "04-00-00") is None
+    schedule_finder.extract_logins(driver, on_table=schedule_finder.roster_export("SMF9", "date", "04-00-00"))
+
+    site, date, shift, rows = exporter.export_roster.call_args.args
+    assert (site, date, shift) == ("SMF9", "date", "04-00-00")
+    assert list(rows)[0] == {"Login": "galleaus", "Manager": "dayvinc"}
+
+
+@pytest.fixture()
+def no_sleep():
+    with patch("utils.schedule_finder.time.sleep") as sleep:
+        yield sleep
+
+
+def test_retry_recovers_on_live_session(schedule_finder, no_sleep):
+    driver = Mock()
+    driver.find_elements.return_value = []
+    step = Mock(side_effect=[TimeoutException(), TimeoutException(), "done"])
+
+    assert schedule_finder.retry(driver, step, "arg") == "done"
+    assert step.call_count == 3
+    assert [call.args[0] for call in no_sleep.call_args_list] == [0.5, 1.0]
+
+
+def test_retry_gives_up(schedule_finder, no_sleep):
+    driver = Mock()
+    driver.find_elements.return_value = []
+    step = Mock(side_effect=TimeoutException())
+
+    with pytest.raises(TimeoutException):
+        schedule_finder.retry(driver, step)
+    assert step.call_count == schedule_finder.STEP_RETRIES + 1
+
+
+@pytest.mark.parametrize("find_elements, error, browser_alive", [
+    (Mock(return_value=[Mock(**{"is_displayed.return_value": True})]), TimeoutException(), True),
+    (Mock(side_effect=WebDriverException("chrome not reachable")), TimeoutException(), False),
+    (Mock(return_value=[]), InvalidSessionIdException(), False),
+])
+def test_retry_raises_session_lost(schedule_finder, no_sleep, find_elements, error, browser_alive):
+    driver = Mock()
+    driver.find_elements = find_elements
+    step = Mock(side_effect=error)
+
+    with pytest.raises(SessionLost) as lost:
+        schedule_finder.retry(driver, step)
+    assert lost.value.browser_alive == browser_alive
+    step.assert_called_once()
+    no_sleep.assert_not_called()
+
+
+def test_logged_out_session_logs_in_again(schedule_finder):
+    display = Mock()
+    driver = display.driver
+    schedule_finder.fetch_roster = Mock(side_effect=[SessionLost(browser_alive=True), {"galleaus"}])
+    schedule_finder.login_to_site = Mock()
+    schedule_finder.start_session = Mock()
+
+    assert schedule_finder.get_scheduled_associates(display) == (driver, {"galleaus"})
+    schedule_finder.login_to_site.assert_called_once_with(driver, display)
+    schedule_finder.start_session.assert_not_called()
+    driver.quit.assert_not_called()
+
+
+def test_crashed_browser_restarted(schedule_finder):
+    display = Mock()
+    crashed = display.driver
+
+    def start_session(display):
+        display.driver = Mock()
+        return True
+
+    schedule_finder.fetch_roster = Mock(side_effect=[SessionLost(browser_alive=False), {"galleaus"}])
+    schedule_finder.start_session = Mock(side_effect=start_session)
+
+    driver, logins = schedule_finder.get_scheduled_associates(display)
+
+    assert logins == {"galleaus"}
+    assert driver is display.driver and driver is not crashed
+    crashed.quit.assert_called_once()
+    assert schedule_finder.fetch_roster.call_args_list[1].args[3] is True  # new browser needs the attribute panel
+
+
+def test_open_attribute_panel_rerun_keeps_unchecked(schedule_finder):
+    driver = Mock()
+    panel = Mock(**{"is_displayed.return_value": True})
+    checkboxes = [Mock(**{"is_selected.return_value": n % 2 == 0}) for n in range(13)]
+    driver.find_elements.side_effect = lambda by, value: [panel] if value == "roster-details-multi-checkbox" \
+        else checkboxes
+
+    schedule_finder.open_attribute_panel(driver)
+
+    driver.execute_script.assert_not_called()  # the panel was already open
+    assert [n for n, checkbox in enumerate(checkboxes) if checkbox.click.called] == [0, 6, 10, 12]
+
+
+def test_watchdog_marks_crashed_browser_dead(schedule_finder):
+    driver = Mock()
+    driver.find_elements.side_effect = WebDriverException("chrome not reachable")
+    schedule_finder.watchdog.watch(driver)
+
+    schedule_finder.watchdog.check()
+
+    assert schedule_finder.watchdog.state_of(driver) == "dead"
+    assert schedule_finder.watchdog.state_of(Mock()) is None
+
+
+def test_watchdog_skips_probe_during_scrape(schedule_finder):
+    driver = Mock()
+    schedule_finder.watchdog.watch(driver)
+
+    with schedule_finder.watchdog.lock:
+        schedule_finder.watchdog.check()
+
+    driver.find_elements.assert_not_called()
+    assert schedule_finder.watchdog.state_of(driver) == "ok"
+
+
+def test_watchdog_refreshes_session(schedule_finder):
+    driver = Mock()
+    driver.find_elements.return_value = []
+    schedule_finder.session_is_valid = Mock(side_effect=[True, False])
+    schedule_finder.save_session = Mock()
+    watchdog = SessionWatchdog(schedule_finder, refresh_interval=0)
+    watchdog.watch(driver)
+
+    watchdog.check()
+    assert watchdog.state_of(driver) == "ok"
+    schedule_finder.save_session.assert_called_once_with(driver)
+
+    watchdog.check()
+    assert watchdog.state_of(driver) == "logged_out"
+
+
+def test_watchdog_thread_started_with_interval(schedule_finder):
+    watchdog = SessionWatchdog(schedule_finder, interval=60)
+    watchdog.watch(None)
+    assert watchdog.thread is None
+
+    watchdog.watch(Mock())
+    try:
+        assert watchdog.thread.is_alive()
+    finally:
+        watchdog.stop()
+        watchdog.thread.join(1)
+
+
+def test_dead_session_replaced_before_scraping(schedule_finder):
+    display = Mock()
+    crashed = display.driver
+    schedule_finder.watchdog.watch(crashed)
+    schedule_finder.watchdog.state = "dead"
+
+    def start_session(display):
+        display.driver = Mock()
+        return True
+
+    schedule_finder.start_session = Mock(side_effect=start_session)
+    schedule_finder.fetch_roster = Mock(return_value={"galleaus"})
+
+    driver, logins = schedule_finder.get_scheduled_associates(display)
+
+    crashed.quit.assert_called_once()
+    schedule_finder.fetch_roster.assert_called_once()
+    assert schedule_finder.watchdog.state_of(driver) == "ok"
+
+
+def test_logged_out_session_logs_in_before_scraping(schedule_finder):
+    display = Mock()
+    schedule_finder.watchdog.watch(display.driver)
+    schedule_finder.watchdog.state = "logged_out"
+    schedule_finder.login_to_site = Mock()
+    schedule_finder.fetch_roster = Mock(return_value={"galleaus"})
+
+    assert schedule_finder.get_scheduled_associates(display) == (display.driver, {"galleaus"})
+    schedule_finder.login_to_site.assert_called_once_with(display.driver, display)
+    schedule_finder.fetch_roster.assert_called_once()
+
+
+class VirtualGrid:
+    """Fake driver for ROSTER_CHUNK_SCRIPT: renders `window` rows at a time and follows the script's rules for
+    marking read rows and scrolling."""
+
+    def __init__(self, rows, window=50, headcount=None):
+        self.rows = rows
+        self.window = window
+        self.headcount = headcount
+        self.top = 0
+        self.marks = {}  # rendered position -> text it was read with
+        self.calls = 0
+
+    def execute_script(self, script, reset=False, limit=500, *selectors):
+        self.calls += 1
+        if reset:
+            self.marks = {}
+            self.top = 0
+            return {"headers": ["Login"], "rows": [], "more": True, "headcount": None, "idle": False}
+        rendered = self.rows[self.top:self.top + self.window]
+        chunk, pending = [], False
+        for position, row in enumerate(rendered):
+            if self.marks.get(position) == tuple(row):
+                continue
+            if len(chunk) >= limit:
+                pending = True
+                break
+            self.marks[position] = tuple(row)
+            chunk.append(row)
+
+        moved = False
+        if not pending:
+            top = min(self.top + len(rendered) - 1, max(0, len(self.rows) - self.window))
+            moved, self.top = top != self.top, top
+        return {"headers": ["Login"], "rows": chunk, "more": pending or moved, "headcount": self.headcount,
+                "idle": True}
+
+
+def test_extract_logins_incremental_walks_virtualized_grid(no_sleep):
+    rows = [[f"aa{n:04}"] for n in range(1500)]
+    grid = VirtualGrid(rows, headcount=1500)
+    schedule_finder = ScheduleFinder(incremental=True)
+    streamed = []
+
+    logins = schedule_finder.extract_logins(grid, on_table=lambda headers, new_rows: streamed.extend(new_rows))
+
+    assert logins == {row[0] for row in rows}
+    assert streamed == rows  # in order, each row once
+    assert grid.calls < 40
+
+
+def test_extract_logins_incremental_reads_in_chunks(no_sleep):
+    rows = [[f"aa{n:04}"] for n in range(1200)]
+    grid = VirtualGrid(rows, window=1200)
+    schedule_finder = ScheduleFinder(incremental=True)
+    chunks = []
+
+    schedule_finder.extract_logins(grid, on_table=lambda headers, new_rows: chunks.append(len(new_rows)))
+
+    assert chunks == [500, 500, 200]
+
+
+def test_extract_logins_incremental_stops_at_empty_cell(no_sleep):
+    grid = VirtualGrid([["galleaus"], ["dayvinc"], [""], ["ignored"]])
+
+    assert ScheduleFinder(incremental=True).extract_logins(grid) == {"galleaus", "dayvinc"}
+
+
+def test_extract_logins_incremental_checks_headcount(no_sleep):
+    grid = VirtualGrid([["galleaus"], ["dayvinc"]], headcount=3)
+
+    with pytest.raises(RosterIncomplete):
+        ScheduleFinder(incremental=True).extract_logins(grid)
+
+
+def test_extract_logins_incremental_rereads_from_top(no_sleep):
+    rows = [[f"aa{n:04}"] for n in range(1500)]
+    grid = VirtualGrid(rows, headcount=1500)
+    schedule_finder = ScheduleFinder(incremental=True)
+
+    schedule_finder.extract_logins(grid)
+    assert schedule_finder.extract_logins(grid) == {row[0] for row in rows}
+
+
+def test_unique_rows_across_retries():
+    streamed = []
+    on_table = ScheduleFinder.unique_rows(lambda headers, rows: streamed.extend(rows))
+
+    on_table(["Login"], [["galleaus"], ["dayvinc"]])
+    on_table(["Login"], [["galleaus"], ["dayvinc"], ["smithj"]])
+
+    assert streamed == [["galleaus"], ["dayvinc"], ["smithj"]]
+    assert ScheduleFinder.unique_rows(None) is None
@@ -0,0 +1,32 @@
+import os
+import tempfile
+import pytest
+from utils import SessionStore
+
+
+@pytest.fixture()
+def session_store():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield SessionStore(os.path.join(temp_dir, "cookies.json"))
+
+
+def test_load_missing(session_store):
+    assert session_store.load() == []
+
+
+def test_save_and_load(session_store):
+    cookies = [{"name": "session", "value": "abc", "domain": ".example.com", "path": "/", "expires": -1,
+                "size": 10, "session": True, "httpOnly": True},
+               {"name": "token", "value": "xyz", "domain": ".example.com", "path": "/", "expires": 1900000000.5}]
+    session_store.save(cookies)
+
+    result = session_store.load()
+    assert result == [{"name": "session", "value": "abc", "domain": ".example.com", "path": "/", "httpOnly": True},
+                      {"name": "token", "value": "xyz", "domain": ".example.com", "path": "/",
+                       "expires": 1900000000.5}]
+
+
+def test_clear(session_store):
+    session_store.save([{"name": "session", "value": "abc"}])
+    session_store.clear()
+    assert session_store.load() == []
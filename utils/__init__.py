@@ -1,5 +1,28 @@
+from . import instrumentation
 from .file_path import FilePath
-from .schedule_finder import ScheduleFinder
 from .business_logic import ScheduleBusinessLogic
+from .eligibility_index import EligibilityIndex
+from .session_store import SessionStore
+from .roster_cache import RosterCache
+from .lazy_schedule_finder import LazyScheduleFinder
+from .config_store import ConfigStore
+from .permissions_db import PermissionsDatabase
+from .rotation_history import RotationHistory
+from .assignment_result import Assignment, AssignmentResult
+from .exporter import Exporter
 
-__all__ = ["FilePath", "ScheduleFinder", "ScheduleBusinessLogic"]
+__all__ = ["instrumentation", "FilePath", "ScheduleFinder", "ScheduleBusinessLogic", "EligibilityIndex",
+           "SessionStore", "RosterCache", "HttpScheduleFinder", "LazyScheduleFinder", "ConfigStore",
+           "PermissionsDatabase", "RotationHistory",
+           "Assignment", "AssignmentResult", "Exporter"]
+
+
+def __getattr__(name):
+    # The schedule finders pull in selenium and urllib3, so they are only imported when a scrape needs them
+    if name == "ScheduleFinder":
+        from .schedule_finder import ScheduleFinder
+        return ScheduleFinder
+    if name == "HttpScheduleFinder":
+        from .http_schedule_finder import HttpScheduleFinder
+        return HttpScheduleFinder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,68 @@
+import io
+import csv
+import json
+
+
+class Assignment:
+    """One filled role slot."""
+    __slots__ = ("role", "login", "slot")
+
+    def __init__(self, role, login, slot):
+        self.role = role
+        self.login = login
+        self.slot = slot
+
+    def __repr__(self):
+        return f"Assignment({self.role!r}, {self.login!r}, {self.slot})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Assignment):
+            return NotImplemented
+        return (self.role, self.login, self.slot) == (other.role, other.login, other.slot)
+
+
+class AssignmentResult:
+    """What the assignment engine produced: the filled slots in assignment order and, per role, how many slots could
+    not be filled. Text, CSV and JSON are only rendered when asked for."""
+    __slots__ = ("assignments", "shortfalls")
+
+    def __init__(self, assignments=None, shortfalls=None):
+        self.assignments = assignments if assignments is not None else []
+        self.shortfalls = shortfalls if shortfalls is not None else {}  # role -> unfilled slots
+
+    def add(self, role, login, slot):
+        self.assignments.append(Assignment(role, login, slot))
+
+    def pairs(self):
+        """Returns (role, login) for every assignment."""
+        return [(assignment.role, assignment.login) for assignment in self.assignments]
+
+    def text(self):
+        """Returns the (result_string, not_enough_string) pair the text views have always shown."""
+        result_string = "".join(f"{assignment.role}: {assignment.login}\n" for assignment in self.assignments)
+        not_enough_string = "".join(f"Not enough eligible AAs to fill {role}.\n" for role in self.shortfalls)
+        return result_string, not_enough_string
+
+    def to_dict(self):
+        return {"assignments": [{"role": assignment.role, "login": assignment.login, "slot": assignment.slot}
+                                for assignment in self.assignments],
+                "shortfalls": dict(self.shortfalls)}
+
+    def render(self, output_format="text"):
+        """Renders the result as "text" (shortfalls first, like the results view), "csv" or "json"."""
+        if output_format == "json":
+            return json.dumps(self.to_dict(), indent=2) + "\n"
+
+        if output_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(["role", "login", "slot", "unfilled"])
+            writer.writerows((assignment.role, assignment.login, assignment.slot, "")
+                             for assignment in self.assignments)
+            writer.writerows((role, "", "", missing) for role, missing in self.shortfalls.items())
+            return buffer.getvalue()
+
+        result_string, not_enough_string = self.text()
+        if not_enough_string:
+            return not_enough_string + "\n" + result_string
+        return result_string
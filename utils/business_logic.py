@@ -1,3 +1,5 @@
+import contextlib
+from . import instrumentation
 from .interfaces import (AssignmentManagerInterface, PermissionsManagerInterface,
                          CustomizationManagerInterface, ScheduleFinderInterface,
                          FilePathInterface, BusinessLogicInterface)
@@ -8,16 +10,54 @@ class ScheduleBusinessLogic(BusinessLogicInterface):
                  permissions_manager: PermissionsManagerInterface,
                  customization_manager: CustomizationManagerInterface,
                  schedule_finder: ScheduleFinderInterface,
-                 pathfinder: FilePathInterface):
+                 pathfinder: FilePathInterface,
+                 roster_cache=None,
+                 rotation_history=None,
+                 profile_dir=None,
+                 exporter=None,
+                 auto_export=False):
         self.assignment_manager = assignment_manager
         self.permissions_manager = permissions_manager
         self.customization_manager = customization_manager
         self.schedule_finder = schedule_finder
         self.pathfinder = pathfinder
+        self.roster_cache = roster_cache
+        self.rotation_history = rotation_history
+        self.profile_dir = profile_dir
+        self.exporter = exporter
+        self.auto_export = auto_export
         self.temp_path, self.base_path = pathfinder.get_paths()
 
-    def assign_indirects(self, nums_dict, scheduled_associates):
-        return self.assignment_manager.assign_indirects(nums_dict, scheduled_associates, self.base_path)
+    def assign_indirects(self, nums_dict, scheduled_associates, date=None, shift=None):
+        """Assigns indirects for a shift. When the shift is given, the assignments are added to the rotation
+        history under the current site."""
+        result = self.assignment_manager.assign_indirects(nums_dict, scheduled_associates, self.base_path, date=date)
+        if self.rotation_history and date and shift:
+            self.rotation_history.record(date, shift, self.parse_assignments(result[0]), site=self.get_site())
+        return result
+
+    def assign(self, nums_dict, scheduled_associates, date=None, shift=None, site=None):
+        """Assigns indirects for a shift and returns the structured AssignmentResult. When the shift is given, the
+        assignments are added to the site's rotation history and, with auto_export on, appended to the export file.
+        The site defaults to the current one."""
+        result = self.assignment_manager.assign(nums_dict, scheduled_associates, self.base_path, date=date)
+        if self.rotation_history and date and shift:
+            self.rotation_history.record(date, shift, result.pairs(), site=site or self.get_site())
+        if self.auto_export and date and shift:
+            self.export_assignments(result, date, shift, site)
+        return result
+
+    def export_assignments(self, result, date, shift, site=None):
+        """Appends an AssignmentResult to the site's assignments export. Returns the file path, or None when there
+        is nothing to export."""
+        if not self.exporter:
+            return None
+        return self.exporter.export_assignments(site or self.get_site(), date, shift, result)
+
+    @staticmethod
+    def parse_assignments(result_string):
+        """Splits "Role: login" result lines into (role, login) pairs."""
+        return [tuple(line.rsplit(": ", 1)) for line in result_string.splitlines() if ": " in line]
 
     def save_permissions(self, text):
         return self.permissions_manager.save_permissions(self.base_path, text)
@@ -25,6 +65,15 @@ class ScheduleBusinessLogic(BusinessLogicInterface):
     def check_permissions(self):
         return self.permissions_manager.check_permissions(self.base_path)
 
+    def get_role_permissions(self, role):
+        return self.permissions_manager.get_role_permissions(role, self.base_path)
+
+    def save_role_permissions(self, role, text):
+        return self.permissions_manager.save_role_permissions(role, text, self.base_path)
+
+    def search_logins(self, query):
+        return self.permissions_manager.search_logins(query, self.base_path)
+
     def get_shifts(self):
         return self.customization_manager.get_shifts(self.base_path)
 
@@ -37,5 +86,53 @@ class ScheduleBusinessLogic(BusinessLogicInterface):
     def get_site(self):
         return self.customization_manager.get_site(self.base_path)
 
-    def get_scheduled_associates(self, display_manager):
-        return self.schedule_finder.get_scheduled_associates(display_manager)
+    def get_presets(self):
+        return self.customization_manager.get_presets(self.base_path)
+
+    @contextlib.contextmanager
+    def generate_run(self):
+        """Times a whole Generate as one step, running it under cProfile when profiling is on."""
+        with instrumentation.profiled(self.profile_dir), instrumentation.step("Generate"):
+            yield
+
+    def get_timing_summary(self, runs=20):
+        """Returns the p50/p95 table of step timings over each step's last runs."""
+        return instrumentation.format_summary(instrumentation.recorder.summary(runs))
+
+    def get_scheduled_associates(self, display_manager, force_refresh=False, site=None):
+        """Returns the roster from the cache when fresh, otherwise scrapes it and caches the result."""
+        if not self.roster_cache:
+            return self.schedule_finder.get_scheduled_associates(display_manager)
+
+        site = (site or self.get_site()).strip().upper()
+        if not force_refresh:
+            logins = self.roster_cache.get(site, display_manager.date, display_manager.shift)
+            if logins:
+                return display_manager.driver, logins
+
+        driver, logins = self.schedule_finder.get_scheduled_associates(display_manager)
+        if logins:
+            self.roster_cache.put(site, display_manager.date, display_manager.shift, logins)
+        return driver, logins
+
+    def get_rosters(self, display_manager, shifts, max_workers=4, force_refresh=False, site=None):
+        """Returns rosters for several (date, shift) pairs, scraping only the ones missing from the cache."""
+        if not self.roster_cache:
+            return self.schedule_finder.get_rosters(display_manager, shifts, max_workers)
+
+        site = (site or self.get_site()).strip().upper()
+        rosters = {}
+        if not force_refresh:
+            for date, shift in shifts:
+                logins = self.roster_cache.get(site, date, shift)
+                if logins:
+                    rosters[(date, shift)] = logins
+
+        missing = [pair for pair in shifts if pair not in rosters]
+        if missing:
+            fetched = self.schedule_finder.get_rosters(display_manager, missing, max_workers)
+            for (date, shift), logins in fetched.items():
+                if logins:
+                    self.roster_cache.put(site, date, shift, logins)
+            rosters.update(fetched)
+        return {pair: rosters[pair] for pair in shifts}
@@ -0,0 +1,69 @@
+import os
+import json
+import threading
+from .file_path import write_atomic
+from .interfaces import FilePathInterface
+
+DEFAULT_PRESETS = {
+    "Default Refurb": {"Refurb": 1, "Amazon Resale": 0, "End of Line": 1, "Waterspider": 1, "Problem Solve": 2,
+                       "Detrash": 2, "Unload": 1, "Audit": 2},
+    "Default AR": {"Refurb": 0, "Amazon Resale": 1, "End of Line": 1, "Waterspider": 1, "Problem Solve": 2,
+                   "Detrash": 2, "Unload": 1, "Audit": 2},
+}
+
+
+class ConfigStore:
+    """Site, shifts, roles and role presets, loaded once per process and held in memory.
+
+    Saved as config.json in the config folder (written atomically). On first use the settings are migrated from
+    site.txt, saved_shifts.txt and saved_roles.txt."""
+
+    def __init__(self, pathfinder: FilePathInterface, base_path):
+        self.pathfinder = pathfinder
+        self.base_path = base_path
+        self.config_file = os.path.join(base_path, "config.json")
+        self.lock = threading.RLock()
+        self.config = None
+
+    def get(self, key):
+        """Returns a setting ("site", "shifts", "roles" or "presets")."""
+        with self.lock:
+            return self.load()[key]
+
+    def set(self, key, value):
+        """Changes a setting and writes the config back to disk."""
+        with self.lock:
+            self.load()[key] = value
+            self.save()
+
+    def load(self):
+        """Returns the in-memory config, reading (or migrating) it on first use."""
+        if self.config is None:
+            try:
+                with open(self.config_file, "r") as file:
+                    self.config = json.load(file)
+            except FileNotFoundError:
+                self.config = self.migrate()
+                self.save()
+            self.config.setdefault("presets", DEFAULT_PRESETS)
+        return self.config
+
+    def save(self):
+        """Writes the config to disk atomically."""
+        write_atomic(self.config_file, json.dumps(self.config, indent=2))
+
+    def migrate(self):
+        """Builds the config from the txt files used by earlier versions."""
+        site = self.read_lines("site")
+        return {"site": site[0] if site else "",
+                "shifts": self.read_lines("saved_shifts"),
+                "roles": self.read_lines("saved_roles"),
+                "presets": DEFAULT_PRESETS}
+
+    def read_lines(self, filename):
+        """Reads the non-empty lines of a legacy txt file, or nothing if it doesn't exist."""
+        try:
+            with open(self.pathfinder.get_custom_text(self.base_path, filename), "r") as file:
+                return [line.strip() for line in file.read().split("\n") if line.strip()]
+        except FileNotFoundError:
+            return []
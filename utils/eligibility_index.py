@@ -0,0 +1,87 @@
+import os
+import threading
+from .file_path import write_atomic
+from .instrumentation import timed
+from .interfaces import FilePathInterface
+
+
+class EligibilityIndex:
+    """Process-wide index of role permission files (role -> logins, login -> roles).
+
+    Each file is parsed once and only re-read when its mtime or size changes, so repeated Generates and permission
+    checks don't reopen every role file."""
+
+    def __init__(self, pathfinder: FilePathInterface):
+        self.pathfinder = pathfinder
+        self.lock = threading.RLock()
+        self.entries = {}  # role -> (stat signature, text, frozenset of logins)
+        self.login_roles = {}
+
+    def get_text(self, role, base_path):
+        """Returns the raw permissions text for a role."""
+        return self.load(role, base_path)[1]
+
+    def logins_for_role(self, role, base_path):
+        """Returns the set of logins trained for a role."""
+        return self.load(role, base_path)[2]
+
+    def roles_for_login(self, login, roles, base_path):
+        """Returns the subset of roles the given login is trained for."""
+        with self.lock:
+            for role in roles:
+                self.load(role, base_path)
+            return self.login_roles.get(login, set()) & set(roles)
+
+    def save_text(self, role, text, base_path):
+        """Writes a role's permissions file atomically and drops its cached entry."""
+        write_atomic(self.pathfinder.get_permissions(role, base_path), text)
+        self.invalidate(role)
+
+    def invalidate(self, role=None):
+        """Drops a cached role (or every role) so the next lookup re-reads it from disk."""
+        with self.lock:
+            roles = [role] if role else list(self.entries)
+            for name in roles:
+                entry = self.entries.pop(name, None)
+                if entry:
+                    self.unlink_logins(name, entry[2])
+
+    @timed
+    def load(self, role, base_path):
+        """Returns the cached entry for a role, re-parsing its file only if it changed on disk. Only reads: a
+        missing file raises FileNotFoundError rather than being created."""
+        file_path = self.pathfinder.get_custom_text(base_path, role)
+        stat = os.stat(file_path)
+        signature = (file_path, stat.st_mtime_ns, stat.st_size)
+
+        with self.lock:
+            entry = self.entries.get(role)
+            if entry and entry[0] == signature:
+                return entry
+
+            with open(file_path, "r") as file:
+                text = file.read()
+            logins = frozenset(self.parse_logins(text))
+
+            if entry:
+                self.unlink_logins(role, entry[2])
+            for login in logins:
+                self.login_roles.setdefault(login, set()).add(role)
+
+            entry = (signature, text, logins)
+            self.entries[role] = entry
+            return entry
+
+    def unlink_logins(self, role, logins):
+        """Removes a role from the reverse index of the given logins."""
+        for login in logins:
+            roles = self.login_roles.get(login)
+            if roles:
+                roles.discard(role)
+                if not roles:
+                    del self.login_roles[login]
+
+    @staticmethod
+    def parse_logins(text):
+        """Splits a permissions file into logins, skipping blank lines and '#' headers."""
+        return [line.strip() for line in text.split("\n") if line.strip() and not line.lstrip().startswith("#")]
@@ -0,0 +1,84 @@
+import os
+import csv
+import json
+import itertools
+import threading
+import datetime as dt
+
+FORMATS = ("csv", "jsonl")
+ASSIGNMENT_FIELDS = ("exported_at", "site", "date", "shift", "role", "login", "slot", "unfilled")
+
+
+class Exporter:
+    """Appends assignment results and scraped rosters to CSV or JSON Lines files in export_dir.
+
+    Each export opens its file in append mode and writes rows one at a time as they come in, so memory use doesn't
+    grow with the roster and nothing already exported is rewritten. Files are kept per site, so batch workers (one per
+    site) never append to the same file: assignments go to <SITE>-assignments.<format> and rosters, with every
+    attribute column the table had, to <SITE>-rosters.<format>."""
+
+    def __init__(self, export_dir, output_format="csv"):
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown export format {output_format!r}, expected one of {', '.join(FORMATS)}")
+        self.export_dir = export_dir
+        self.output_format = output_format
+        self.lock = threading.Lock()
+
+    def export_assignments(self, site, date, shift, result):
+        """Appends an AssignmentResult for a shift, one row per filled slot and one per short role. Returns the
+        file path, or None when the result is empty."""
+        prefix = self.prefix(site, date, shift)
+        rows = ({**prefix, "role": assignment.role, "login": assignment.login, "slot": assignment.slot,
+                 "unfilled": ""} for assignment in result.assignments)
+        shortfalls = ({**prefix, "role": role, "login": "", "slot": "", "unfilled": missing}
+                      for role, missing in result.shortfalls.items())
+        return self.append(self.path(site, "assignments"), ASSIGNMENT_FIELDS, itertools.chain(rows, shortfalls))
+
+    def export_roster(self, site, date, shift, rows):
+        """Appends a shift's roster rows (dicts keyed by column). The CSV header is taken from the file when it
+        already has one, otherwise from the first row; columns outside it are dropped. Returns the file path, or
+        None when there were no rows."""
+        prefix = self.prefix(site, date, shift)
+        return self.append(self.path(site, "rosters"), None, ({**prefix, **row} for row in rows))
+
+    def path(self, site, name):
+        return os.path.join(self.export_dir, f"{site.strip().upper()}-{name}.{self.output_format}")
+
+    def append(self, path, fields, rows):
+        """Writes rows to the end of path as they are produced."""
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return None
+
+        os.makedirs(self.export_dir, exist_ok=True)
+        with self.lock, open(path, "a+", newline="", encoding="utf-8") as file:
+            if self.output_format == "jsonl":
+                file.write(json.dumps(first, default=str) + "\n")
+                for row in rows:
+                    file.write(json.dumps(row, default=str) + "\n")
+                return path
+
+            header = self.read_header(file)
+            writer = csv.DictWriter(file, fieldnames=header or fields or list(first), restval="",
+                                    extrasaction="ignore")
+            if not header:
+                writer.writeheader()
+            writer.writerow(first)
+            writer.writerows(rows)
+        return path
+
+    @staticmethod
+    def read_header(file):
+        """Returns the header row of a CSV file opened for appending, or None if the file is empty."""
+        if file.tell() == 0:
+            return None
+        file.seek(0)
+        header = next(csv.reader(file), None)
+        file.seek(0, os.SEEK_END)
+        return header
+
+    @staticmethod
+    def prefix(site, date, shift):
+        return {"exported_at": dt.datetime.now().isoformat(timespec="seconds"), "site": site.strip().upper(),
+                "date": date.strftime("%Y-%m-%d"), "shift": shift}
@@ -1,7 +1,34 @@
 import os
 import sys
+import shutil
+import tempfile
+import contextlib
+from .instrumentation import timed
 from .interfaces import FilePathInterface
 
+# Files bundled in the frozen app's txt folder and copied to the user's config folder on first launch.
+BOOTSTRAP_MANIFEST = (
+    "End of Line.txt", "Problem Solve.txt", "Waterspider.txt", "Refurb.txt", "Unload.txt",
+    "Detrash.txt", "saved_roles.txt", "saved_shifts.txt", "site.txt"
+)
+
+
+@timed
+def write_atomic(file_path, text):
+    """Writes text to a temporary file beside file_path and renames it into place, so readers never see a
+    half-written file. The temporary file gets a unique name, so processes saving the same file at once don't
+    overwrite each other's half-written copy."""
+    fd, temp_file_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or ".",
+                                          prefix=f"{os.path.basename(file_path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(text)
+        os.replace(temp_file_path, file_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_file_path)
+        raise
+
 
 class FilePath(FilePathInterface):
     def get_paths(self):
@@ -16,20 +43,23 @@ class FilePath(FilePathInterface):
             base_path = os.path.dirname(os.path.dirname(__file__))
         return temp_path, base_path
 
+    @timed
     def app_init(self, temp_path, base_path):
         """Gets filepath for specific role permissions depending on whether the app is frozen or running in a normal
             Python environment"""
         if temp_path:  # Execute function only if app is running as .exe file
             file_path = os.path.join(base_path, "txt")
-            os.makedirs(file_path, exist_ok=True)
 
-            files = [
-                "End of Line.txt", "Problem Solve.txt", "Waterspider.txt", "Refurb.txt", "Unload.txt",
-                "Detrash.txt", "saved_roles.txt", "saved_shifts.txt", "site.txt"
-            ]
+            # One directory scan instead of a stat per file; after the first launch nothing is missing
+            try:
+                existing = {entry.name for entry in os.scandir(file_path)}
+            except FileNotFoundError:
+                os.makedirs(file_path, exist_ok=True)
+                existing = set()
 
-            for filename in files:
-                self.create_file(temp_path, file_path, filename)
+            for filename in BOOTSTRAP_MANIFEST:
+                if filename not in existing:
+                    self.create_file(temp_path, file_path, filename)
 
     def create_file(self, temp_path, file_path, filename):
         """Create a file at the target path by copying it from a
@@ -38,10 +68,7 @@ class FilePath(FilePathInterface):
         full_temp_path = os.path.join(temp_path, "txt", filename)
 
         if not os.path.exists(full_path):
-            with open(full_temp_path) as file2:
-                text = file2.read()
-            with open(full_path, "w") as file:
-                file.write(text)
+            shutil.copyfile(full_temp_path, full_path)
 
     def get_permissions(self, role, base_path):
         """Gets filepath for specific role permissions. Creates it if it doesn't exist."""
@@ -56,6 +83,13 @@ class FilePath(FilePathInterface):
         file_path = os.path.join(base_path, "txt", f"{file}.txt")
         return file_path
 
+    def get_data_dir(self, base_path, name):
+        """Gets the folder for app-managed data such as the browser profile or caches. Creates it if it doesn't
+        exist."""
+        dir_path = os.path.join(base_path, name)
+        os.makedirs(dir_path, exist_ok=True)
+        return dir_path
+
     def get_image_path(self, temp_path, base_path, filename):
         """Gets filepath for Amazon Smile Logo depending on whether the app is frozen or running in a normal Python
         Environment"""
@@ -0,0 +1,138 @@
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlencode
+import urllib3
+from urllib3.exceptions import HTTPError
+from .instrumentation import timed
+from .interfaces import ScheduleFinderInterface
+
+LOGIN_KEYS = ("login", "employeeLogin", "employee_login")
+
+
+class SessionExpired(Exception):
+    """Raised when the roster endpoint rejects the saved cookies."""
+
+
+class HttpScheduleFinder(ScheduleFinderInterface):
+    """Fetches rosters straight from the SSPOT roster data endpoint over a pooled HTTP connection.
+
+    Auth cookies are harvested once from a browser login (through the browser schedule finder) and reused until the
+    endpoint rejects them, so Chrome only starts when the session has to be renewed."""
+
+    def __init__(self, browser_finder: ScheduleFinderInterface, session_store, roster_url=None, max_connections=4,
+                 exporter=None):
+        self.browser_finder = browser_finder
+        self.session_store = session_store
+        self.exporter = exporter
+        self.roster_url = roster_url or os.getenv("ROSTER_API_URL")
+        self.cookie_header = None
+        self.http = urllib3.PoolManager(maxsize=max_connections,
+                                        retries=urllib3.Retry(total=2, backoff_factor=0.3,
+                                                              status_forcelist=(502, 503, 504)),
+                                        timeout=urllib3.Timeout(connect=5, read=15))
+
+    def get_scheduled_associates(self, display):
+        """Main function to get scheduled AA logins for a given shift and date."""
+        rosters = self.get_rosters(display, [(display.date, display.shift)], max_workers=1)
+        return display.driver, rosters[(display.date, display.shift)]
+
+    def get_rosters(self, display, shifts, max_workers=4):
+        """Fetches the rosters for several (date, shift) pairs concurrently. Returns {(date, shift): logins}, with
+        None for any pair that failed."""
+        display.report_progress("Fetching roster...")
+        renewed = False
+        if self.get_cookie_header() is None:
+            if not self.renew_session(display):
+                return {pair: None for pair in shifts}
+            renewed = True
+
+        while True:
+            try:
+                return self.fetch_all(display.site, shifts, max_workers)
+            except SessionExpired:
+                if renewed or not self.renew_session(display):
+                    return {pair: None for pair in shifts}
+                renewed = True
+
+    def fetch_all(self, site, shifts, max_workers):
+        """Fetches every roster over the shared connection pool. A rejected session aborts the whole batch."""
+        def fetch(pair):
+            try:
+                return self.fetch_logins(site, pair[0], pair[1])
+            except (HTTPError, ValueError, KeyError, TypeError):
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(shifts)))) as executor:
+            return dict(zip(shifts, executor.map(fetch, shifts)))
+
+    def fetch_logins(self, site, date, shift):
+        """Requests one roster and returns its logins, streaming its rows to the exporter when exports are on."""
+        rows = self.fetch_roster(site, date, shift)
+        if self.exporter:
+            self.exporter.export_roster(site, date, shift, rows)
+        return {row["login"] for row in rows}
+
+    @timed
+    def fetch_roster(self, site, date, shift):
+        """Requests one roster and returns its rows, each with a normalised "login" key."""
+        query = urlencode({"site": site.strip(), "date": date.strftime("%Y-%m-%d"), "shift": shift})
+        response = self.http.request("GET", f"{self.roster_url}?{query}",
+                                     headers={"Cookie": self.get_cookie_header() or "",
+                                              "Accept": "application/json"},
+                                     redirect=False)
+        if response.status in (401, 403) or 300 <= response.status < 400:
+            raise SessionExpired()
+        if response.status != 200:
+            raise HTTPError(f"Roster request failed with status {response.status}")
+        return self.parse_roster(json.loads(response.data.decode("utf-8")))
+
+    @staticmethod
+    def parse_roster(payload):
+        """Returns roster rows from the endpoint's JSON, which is either a list of records or an object holding
+        one under "roster" or "associates"."""
+        if isinstance(payload, dict):
+            payload = payload.get("roster", payload.get("associates", []))
+
+        rows = []
+        for record in payload:
+            login = next((record[key] for key in LOGIN_KEYS if record.get(key)), None)
+            if login:
+                rows.append({**record, "login": login})
+        return rows
+
+    def get_cookie_header(self):
+        """Returns the Cookie header for the roster endpoint, reading the saved session only once."""
+        if self.cookie_header is None:
+            self.cookie_header = self.build_cookie_header()
+        return self.cookie_header
+
+    def build_cookie_header(self):
+        """Builds a Cookie header from the saved session cookies for the roster endpoint's host."""
+        host = urlsplit(self.roster_url).hostname or ""
+        cookies = [cookie for cookie in self.session_store.load()
+                   if self.domain_matches(host, cookie.get("domain", host))]
+        if not cookies:
+            return None
+        return "; ".join(f"{cookie['name']}={cookie['value']}" for cookie in cookies)
+
+    @staticmethod
+    def domain_matches(host, domain):
+        """Checks whether a cookie set for domain would be sent to host."""
+        domain = domain.lstrip(".")
+        return host == domain or host.endswith(f".{domain}")
+
+    @timed
+    def renew_session(self, display):
+        """Logs in once through the browser to harvest fresh cookies, then quits the browser."""
+        if display.driver:
+            display.driver.quit()
+            display.driver = None
+
+        if not self.browser_finder.start_session(display):
+            return False
+        self.browser_finder.save_session(display.driver)
+        self.cookie_header = None
+        display.driver.quit()
+        display.driver = None
+        return self.get_cookie_header() is not None
@@ -0,0 +1,140 @@
+import os
+import json
+import math
+import time
+import cProfile
+import logging
+import datetime as dt
+import threading
+import functools
+import contextlib
+from collections import defaultdict, deque
+from logging.handlers import RotatingFileHandler
+
+
+class StepRecorder:
+    """Collects how long each pipeline step takes.
+
+    Durations are kept in memory and, once a log file is configured, appended as JSON lines to a rotating log so the
+    summary covers earlier sessions too."""
+
+    def __init__(self, history=1000):
+        self.lock = threading.Lock()
+        self.samples = defaultdict(lambda: deque(maxlen=history))  # step -> durations in ms
+        self.log_file = None
+        self.backup_count = 0
+        self.logger = logging.getLogger("koality.timings")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+
+    def configure(self, log_file, max_bytes=1_000_000, backup_count=3):
+        """Starts writing timings to log_file, rotating it at max_bytes."""
+        if self.log_file == log_file:
+            return
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+
+        handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self.logger.addHandler(handler)
+        self.log_file = log_file
+        self.backup_count = backup_count
+
+    def record(self, step, seconds, ok=True):
+        ms = round(seconds * 1000, 3)
+        with self.lock:
+            self.samples[step].append(ms)
+        if self.log_file:
+            self.logger.info(json.dumps({"time": dt.datetime.now().isoformat(timespec="milliseconds"),
+                                         "step": step, "ms": ms, "ok": ok,
+                                         "thread": threading.current_thread().name}))
+
+    def summary(self, runs=20):
+        """Returns {step: {"count", "p50", "p95", "max"}} in ms over each step's last `runs` samples."""
+        samples = self.read_log() if self.log_file else self.samples
+        summary = {}
+        for step, durations in sorted(samples.items()):
+            durations = sorted(list(durations)[-runs:])
+            if durations:
+                summary[step] = {"count": len(durations), "p50": percentile(durations, 0.5),
+                                 "p95": percentile(durations, 0.95), "max": durations[-1]}
+        return summary
+
+    def read_log(self):
+        """Reads every sample from the log file and its backups, oldest first."""
+        samples = defaultdict(list)
+        paths = [f"{self.log_file}.{n}" for n in range(self.backup_count, 0, -1)] + [self.log_file]
+        for path in paths:
+            try:
+                with open(path, "r") as file:
+                    for line in file:
+                        try:
+                            entry = json.loads(line)
+                            samples[entry["step"]].append(entry["ms"])
+                        except (ValueError, KeyError):
+                            continue
+            except FileNotFoundError:
+                continue
+        return samples
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[max(0, math.ceil(len(sorted_values) * fraction) - 1)]
+
+
+recorder = StepRecorder()
+
+
+@contextlib.contextmanager
+def step(name):
+    """Times the enclosed block as the named step."""
+    start = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        recorder.record(name, time.perf_counter() - start, ok)
+
+
+def timed(func):
+    """Times every call of the decorated function, named after its qualified name (e.g. ScheduleFinder.select_date)."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with step(func.__qualname__):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def profiled(profile_dir):
+    """Runs the enclosed block under cProfile and dumps the stats to a timestamped .prof file in profile_dir. Does
+    nothing when profile_dir is None."""
+    if not profile_dir:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        os.makedirs(profile_dir, exist_ok=True)
+        profiler.dump_stats(os.path.join(profile_dir, f"generate-{dt.datetime.now():%Y%m%d-%H%M%S}.prof"))
+
+
+def format_summary(summary):
+    """Renders a summary as a text table."""
+    if not summary:
+        return "No timings recorded yet. Run Generate first.\n"
+
+    width = max(len(name) for name in summary)
+    lines = [f"{'Step':<{width}}  {'runs':>5}  {'p50 ms':>10}  {'p95 ms':>10}  {'max ms':>10}"]
+    for name, stats in summary.items():
+        lines.append(f"{name:<{width}}  {stats['count']:>5}  {stats['p50']:>10.1f}  {stats['p95']:>10.1f}  "
+                     f"{stats['max']:>10.1f}")
+    return "\n".join(lines) + "\n"
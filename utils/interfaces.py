@@ -3,7 +3,11 @@ from abc import ABC, abstractmethod
 
 class AssignmentManagerInterface(ABC):
     @abstractmethod
-    def assign_indirects(self, nums_dict, scheduled_associates, base_path):
+    def assign_indirects(self, nums_dict, scheduled_associates, base_path, date=None):
+        pass
+
+    @abstractmethod
+    def assign(self, nums_dict, scheduled_associates, base_path, date=None):
         pass
 
 
@@ -16,6 +20,18 @@ class PermissionsManagerInterface(ABC):
     def check_permissions(self, base_path):
         pass
 
+    @abstractmethod
+    def get_role_permissions(self, role, base_path):
+        pass
+
+    @abstractmethod
+    def save_role_permissions(self, role, text, base_path):
+        pass
+
+    @abstractmethod
+    def search_logins(self, query, base_path):
+        pass
+
 
 class CustomizationManagerInterface(ABC):
     @abstractmethod
@@ -34,12 +50,20 @@ class CustomizationManagerInterface(ABC):
     def get_site(self, base_path):
         pass
 
+    @abstractmethod
+    def get_presets(self, base_path):
+        pass
+
 
 class ScheduleFinderInterface(ABC):
     @abstractmethod
     def get_scheduled_associates(self, display_manager):
         pass
 
+    @abstractmethod
+    def get_rosters(self, display_manager, shifts, max_workers=4):
+        pass
+
 
 class FilePathInterface(ABC):
     @abstractmethod
@@ -54,6 +78,10 @@ class FilePathInterface(ABC):
     def get_permissions(self, role, base_path):
         pass
 
+    @abstractmethod
+    def get_data_dir(self, base_path, name):
+        pass
+
 
 class BusinessLogicInterface(ABC):
     @abstractmethod
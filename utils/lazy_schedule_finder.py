@@ -0,0 +1,24 @@
+import threading
+from .interfaces import ScheduleFinderInterface
+
+
+class LazyScheduleFinder(ScheduleFinderInterface):
+    """Stands in for a schedule finder until the first scrape, so selenium isn't imported at startup."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.finder = None
+        self.lock = threading.Lock()
+
+    def get_finder(self):
+        """Builds the real schedule finder on first use."""
+        with self.lock:
+            if self.finder is None:
+                self.finder = self.factory()
+            return self.finder
+
+    def get_scheduled_associates(self, display_manager):
+        return self.get_finder().get_scheduled_associates(display_manager)
+
+    def get_rosters(self, display_manager, shifts, max_workers=4):
+        return self.get_finder().get_rosters(display_manager, shifts, max_workers)
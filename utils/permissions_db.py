@@ -0,0 +1,149 @@
+import os
+import sqlite3
+import threading
+import datetime as dt
+from .eligibility_index import EligibilityIndex
+from .file_path import write_atomic
+from .interfaces import FilePathInterface
+
+SCHEMA_VERSION = "2"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS roles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    updated_at TEXT NOT NULL,
+    text TEXT
+);
+CREATE TABLE IF NOT EXISTS logins (
+    role_id INTEGER NOT NULL REFERENCES roles(id) ON DELETE CASCADE,
+    login TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (role_id, login)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS logins_by_login ON logins(login, role_id);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class PermissionsDatabase:
+    """SQLite store of role permissions (role -> logins, login -> roles), for sites with too many logins for the
+    per-role txt files.
+
+    Has the same lookups as EligibilityIndex so either can back the managers. A role that isn't in the database yet
+    is imported from its txt file on first use, and export_txt writes the roles back out in the txt format. The text
+    a role was imported or saved with is kept beside its logins, so group headers and comments come back unchanged;
+    logins written through upsert alone are rendered as a plain list."""
+
+    def __init__(self, db_path, pathfinder: FilePathInterface):
+        self.db_path = db_path
+        self.pathfinder = pathfinder
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        with self.lock, self.connection:
+            self.connection.executescript(SCHEMA)
+            columns = {name for _, name, *_ in self.connection.execute("PRAGMA table_info(roles)")}
+            if "text" not in columns:  # databases created before the raw text was kept
+                self.connection.execute("ALTER TABLE roles ADD COLUMN text TEXT")
+            self.connection.execute("INSERT INTO metadata (key, value) VALUES ('schema_version', ?) "
+                                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value", (SCHEMA_VERSION,))
+
+    def get_text(self, role, base_path):
+        """Returns the permissions for a role in the txt file format: the text it was saved with, if any."""
+        with self.lock:
+            self.ensure_role(role, base_path)
+            text, = self.connection.execute("SELECT text FROM roles WHERE name = ?", (role,)).fetchone()
+        if text is not None:
+            return text
+        return self.render_text(role, self.logins_in_order(role, base_path))
+
+    def logins_for_role(self, role, base_path):
+        """Returns the set of logins trained for a role."""
+        return frozenset(self.logins_in_order(role, base_path))
+
+    def roles_for_login(self, login, roles, base_path):
+        """Returns the subset of roles the given login is trained for."""
+        with self.lock:
+            for role in roles:
+                self.ensure_role(role, base_path)
+            rows = self.connection.execute("SELECT roles.name FROM logins JOIN roles ON roles.id = logins.role_id "
+                                           "WHERE logins.login = ?", (login,)).fetchall()
+        return {name for name, in rows} & set(roles)
+
+    def save_text(self, role, text, base_path):
+        """Replaces a role's logins with the ones in the given permissions text, keeping the text as written."""
+        self.upsert({role: EligibilityIndex.parse_logins(text)}, texts={role: text})
+
+    def invalidate(self, role=None):
+        """Nothing is cached outside the database, so there is nothing to drop."""
+
+    def upsert(self, role_logins, replace=True, texts=None):
+        """Writes {role: logins} in a single transaction. With replace, each role's logins are replaced; otherwise
+        the new logins are added after the existing ones. texts holds the txt file text for roles that have it;
+        any other role's stored text is dropped since it no longer matches the logins."""
+        texts = texts or {}
+        updated_at = dt.datetime.now().isoformat(timespec="seconds")
+        with self.lock, self.connection:
+            for role, logins in role_logins.items():
+                self.connection.execute("INSERT INTO roles (name, updated_at, text) VALUES (?, ?, ?) "
+                                        "ON CONFLICT(name) DO UPDATE SET updated_at = excluded.updated_at, "
+                                        "text = excluded.text", (role, updated_at, texts.get(role)))
+                role_id, = self.connection.execute("SELECT id FROM roles WHERE name = ?", (role,)).fetchone()
+
+                start = 0
+                if replace:
+                    self.connection.execute("DELETE FROM logins WHERE role_id = ?", (role_id,))
+                else:
+                    start, = self.connection.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM logins "
+                                                     "WHERE role_id = ?", (role_id,)).fetchone()
+
+                self.connection.executemany("INSERT OR IGNORE INTO logins (role_id, login, position) "
+                                            "VALUES (?, ?, ?)",
+                                            ((role_id, login, start + n)
+                                             for n, login in enumerate(dict.fromkeys(logins))))
+
+    def import_txt(self, roles, base_path):
+        """Loads the given roles from their txt files in one transaction, replacing what the database holds."""
+        role_logins = {}
+        texts = {}
+        for role in roles:
+            with open(self.pathfinder.get_custom_text(base_path, role), "r") as file:
+                texts[role] = file.read()
+            role_logins[role] = EligibilityIndex.parse_logins(texts[role])
+        self.upsert(role_logins, texts=texts)
+
+    def export_txt(self, roles, base_path):
+        """Writes the given roles back to their txt files."""
+        for role in roles:
+            write_atomic(self.pathfinder.get_permissions(role, base_path), self.get_text(role, base_path))
+
+    def logins_in_order(self, role, base_path):
+        """Returns a role's logins in the order they were saved."""
+        with self.lock:
+            self.ensure_role(role, base_path)
+            rows = self.connection.execute("SELECT login FROM logins JOIN roles ON roles.id = logins.role_id "
+                                           "WHERE roles.name = ? ORDER BY position", (role,)).fetchall()
+        return [login for login, in rows]
+
+    def ensure_role(self, role, base_path):
+        """Imports a role from its txt file if the database doesn't have it yet."""
+        if not self.connection.execute("SELECT 1 FROM roles WHERE name = ?", (role,)).fetchone():
+            self.import_txt([role], base_path)
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    @staticmethod
+    def render_text(role, logins):
+        """Formats logins like a permissions txt file."""
+        return f"## {role} Permissions {"-" * 30}\n" + "".join(f"{login}\n" for login in logins) + "\n"
+
+    @classmethod
+    def open(cls, pathfinder: FilePathInterface, base_path):
+        """Opens (or creates) the permissions database in the app's data folder."""
+        return cls(os.path.join(pathfinder.get_data_dir(base_path, "data"), "permissions.db"), pathfinder)
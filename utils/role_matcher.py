@@ -0,0 +1,98 @@
+import random
+from collections import deque
+
+INF = float("inf")
+
+
+class RoleMatcher:
+    """Maximum bipartite matching of role slots to associates using Hopcroft-Karp."""
+
+    def __init__(self, rng=None):
+        self.rng = rng or random
+
+    def match(self, slots, eligible, ranked=False):
+        """Returns {slot index: associate} for a maximum matching.
+
+        slots holds one role name per headcount, eligible maps each role name to the associates that can fill it.
+        Slot order and candidate order are shuffled so ties between equally good matchings are broken randomly.
+        With ranked, candidate order is kept instead, so earlier candidates are preferred where the matching allows."""
+        associates = {}
+        role_adjacency = {}
+        for role in set(slots):
+            candidates = [associates.setdefault(login, len(associates)) for login in eligible.get(role, ())]
+            if not ranked:
+                self.rng.shuffle(candidates)
+            role_adjacency[role] = candidates
+
+        adjacency = [role_adjacency[role] for role in slots]
+        pair_slot = [-1] * len(slots)
+        pair_associate = [-1] * len(associates)
+
+        self.greedy_seed(adjacency, pair_slot, pair_associate)
+
+        dist = [0] * len(slots)
+        while self.build_layers(adjacency, pair_slot, pair_associate, dist):
+            ptr = [0] * len(slots)
+            for slot in range(len(slots)):
+                if pair_slot[slot] == -1:
+                    self.augment(slot, adjacency, pair_slot, pair_associate, dist, ptr)
+
+        logins = list(associates)
+        return {slot: logins[associate] for slot, associate in enumerate(pair_slot) if associate != -1}
+
+    def greedy_seed(self, adjacency, pair_slot, pair_associate):
+        """Seeds the matching with a random greedy pass so the phases only have to repair conflicts."""
+        order = list(range(len(adjacency)))
+        self.rng.shuffle(order)
+        for slot in order:
+            for associate in adjacency[slot]:
+                if pair_associate[associate] == -1:
+                    pair_slot[slot] = associate
+                    pair_associate[associate] = slot
+                    break
+
+    def build_layers(self, adjacency, pair_slot, pair_associate, dist):
+        """Breadth-first layering from all free slots. Returns True if an augmenting path exists."""
+        queue = deque()
+        for slot, associate in enumerate(pair_slot):
+            if associate == -1:
+                dist[slot] = 0
+                queue.append(slot)
+            else:
+                dist[slot] = INF
+
+        found = False
+        while queue:
+            slot = queue.popleft()
+            for associate in adjacency[slot]:
+                owner = pair_associate[associate]
+                if owner == -1:
+                    found = True
+                elif dist[owner] == INF:
+                    dist[owner] = dist[slot] + 1
+                    queue.append(owner)
+        return found
+
+    def augment(self, root, adjacency, pair_slot, pair_associate, dist, ptr):
+        """Iterative depth-first search for an augmenting path along the layers, flipping it if found."""
+        stack = [root]
+        while stack:
+            slot = stack[-1]
+            if ptr[slot] < len(adjacency[slot]):
+                associate = adjacency[slot][ptr[slot]]
+                ptr[slot] += 1
+                owner = pair_associate[associate]
+                if owner == -1:
+                    while stack:
+                        slot = stack.pop()
+                        previous = pair_slot[slot]
+                        pair_slot[slot] = associate
+                        pair_associate[associate] = slot
+                        associate = previous
+                    return True
+                if dist[owner] == dist[slot] + 1:
+                    stack.append(owner)
+            else:
+                dist[slot] = INF
+                stack.pop()
+        return False
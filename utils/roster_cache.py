@@ -0,0 +1,43 @@
+import os
+import re
+import json
+import time
+from .file_path import write_atomic
+
+
+class RosterCache:
+    """On-disk cache of scraped rosters keyed by site, date and shift, so regenerating a shift skips SSPOT."""
+
+    def __init__(self, cache_dir, ttl=1800):
+        self.cache_dir = cache_dir
+        self.ttl = ttl  # seconds
+
+    def get(self, site, date, shift):
+        """Returns the cached logins, or None if there is no entry or it is older than the TTL."""
+        try:
+            with open(self.get_cache_file(site, date, shift), "r") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry["fetched_at"] > self.ttl:
+            return None
+        return set(entry["logins"])
+
+    def put(self, site, date, shift, logins):
+        """Caches the logins scraped for a site, date and shift."""
+        entry = {"site": site, "date": date.strftime("%Y-%m-%d"), "shift": shift,
+                 "fetched_at": time.time(), "logins": sorted(logins)}
+        write_atomic(self.get_cache_file(site, date, shift), json.dumps(entry))
+
+    def invalidate(self, site, date, shift):
+        """Removes the cached roster for a site, date and shift."""
+        try:
+            os.remove(self.get_cache_file(site, date, shift))
+        except FileNotFoundError:
+            pass
+
+    def get_cache_file(self, site, date, shift):
+        """Gets the cache file for a site, date and shift."""
+        name = f"{site}_{date.strftime('%Y-%m-%d')}_{shift}".upper()
+        return os.path.join(self.cache_dir, re.sub(r"[^A-Z0-9_-]", "_", name) + ".json")
@@ -0,0 +1,186 @@
+import io
+import os
+import csv
+import heapq
+import threading
+import datetime as dt
+from collections import Counter
+from .file_path import write_atomic
+
+FIELDS = ("recorded_at", "site", "date", "shift", "role", "login")
+LEGACY_FIELDS = ("recorded_at", "date", "shift", "role", "login")
+
+
+class RotationHistory:
+    """Persistent log of past assignments (site, date, shift, role, login) with constant-time recency lookups.
+
+    Rows are appended to a CSV file. In memory, assignment counts cover a rolling window of days that moves forward
+    with the dates looked up, and old day buckets are dropped as it moves. The date each login last did each role is
+    kept for the whole retention period. Regenerating a shift replaces what was recorded for it at the same site; counts
+    and dates are shared across sites."""
+
+    def __init__(self, file_path, window_days=30, retention_days=180):
+        self.file_path = file_path
+        self.window_days = window_days
+        self.retention_days = retention_days
+        self.lock = threading.RLock()
+        self.loaded = False
+
+        self.shifts = {}  # (site, day ordinal, shift) -> tuple of (role, login) inside the window
+        self.days = {}  # day ordinal -> (site, shift) pairs recorded that day
+        self.day_heap = []  # ordinals in self.days, oldest first
+        self.counts = Counter()  # (login, role) -> assignments inside the window
+        self.records = {}  # (site, day ordinal, shift) -> tuple of (role, login) for the whole retention period
+        self.assigned_days = {}  # (login, role) -> Counter of day ordinal -> assignments that day
+        self.last_days = {}  # (login, role) -> ordinal of the latest assignment
+        self.window_start = None
+
+    def count(self, login, role, date):
+        """Returns how many times login did role in the window_days ending at date."""
+        with self.lock:
+            self.load()
+            self.advance(date.toordinal())
+            return self.counts[(login, role)]
+
+    def last_assigned(self, login, role):
+        """Returns the date login last did role, or None."""
+        with self.lock:
+            self.load()
+            ordinal = self.last_days.get((login, role))
+            return dt.date.fromordinal(ordinal) if ordinal else None
+
+    def recency(self, login, role, date):
+        """Sort key putting the least-recently-assigned first: (count in window, last assignment ordinal)."""
+        with self.lock:
+            self.load()
+            self.advance(date.toordinal())
+            return self.counts[(login, role)], self.last_days.get((login, role), 0)
+
+    def record(self, date, shift, assignments, site=""):
+        """Records the (role, login) assignments made for a site's shift, replacing any earlier record for it."""
+        recorded_at = dt.datetime.now().isoformat(timespec="microseconds")
+        site = site.strip().upper()
+        day = date.strftime("%Y-%m-%d")
+        assignments = list(assignments)
+        rows = [(recorded_at, site, day, shift, role, login) for role, login in assignments]
+        if not rows:
+            rows = [(recorded_at, site, day, shift, "", "")]  # still replaces the shift's earlier record on reload
+
+        with self.lock:
+            self.load()
+            self.apply(site, date.toordinal(), shift, assignments)
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            new_file = not os.path.exists(self.file_path)
+            with open(self.file_path, "a", newline="") as file:
+                writer = csv.writer(file)
+                if new_file:
+                    writer.writerow(FIELDS)
+                writer.writerows(rows)
+
+    def load(self):
+        """Reads the history file once, skipping rows past the retention period. The file is compacted when most of
+        it is past retention, or rewritten with an empty site column when it predates the site column."""
+        if self.loaded:
+            return
+        self.loaded = True
+
+        today = dt.date.today().toordinal()
+        self.advance(today)
+        cutoff = today - self.retention_days
+        try:
+            with open(self.file_path, "r", newline="") as file:
+                header, *rows = list(csv.reader(file)) or [FIELDS]
+        except FileNotFoundError:
+            return
+        legacy = tuple(header) == LEGACY_FIELDS
+
+        kept = []
+        group_key = None
+        group = []
+        for row in rows:
+            if legacy and len(row) == len(LEGACY_FIELDS):
+                row = [row[0], ""] + row[1:]
+            if len(row) != len(FIELDS):
+                continue
+            recorded_at, site, day, shift, role, login = row
+            ordinal = dt.date.fromisoformat(day).toordinal()
+            if ordinal < cutoff:
+                continue
+            kept.append(row)
+
+            if (recorded_at, site, ordinal, shift) != group_key:
+                if group_key:
+                    self.apply(*group_key[1:], group)
+                group_key = (recorded_at, site, ordinal, shift)
+                group = []
+            if role and login:
+                group.append((role, login))
+        if group_key:
+            self.apply(*group_key[1:], group)
+
+        if legacy or len(rows) - len(kept) > len(kept):
+            self.compact(kept)
+
+    def compact(self, rows):
+        """Rewrites the history file with only the given rows."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(FIELDS)
+        writer.writerows(rows)
+        write_atomic(self.file_path, buffer.getvalue())
+
+    def apply(self, site, ordinal, shift, assignments):
+        """Puts a site's shift assignments into memory, replacing any earlier record for that site and shift. Logins
+        dropped from a replaced record get their last assignment date recomputed from what is left."""
+        key = (site, ordinal, shift)
+        for role, login in self.shifts.pop(key, ()):
+            self.decrement(login, role)
+        for role, login in self.records.pop(key, ()):
+            self.unmark_day(login, role, ordinal)
+
+        self.records[key] = tuple(assignments)
+        for role, login in assignments:
+            self.assigned_days.setdefault((login, role), Counter())[ordinal] += 1
+            if self.last_days.get((login, role), 0) < ordinal:
+                self.last_days[(login, role)] = ordinal
+
+        if ordinal < self.window_start:
+            return
+        self.shifts[key] = tuple(assignments)
+        if ordinal not in self.days:
+            self.days[ordinal] = set()
+            heapq.heappush(self.day_heap, ordinal)
+        self.days[ordinal].add((site, shift))
+        for role, login in assignments:
+            self.counts[(login, role)] += 1
+
+    def advance(self, ordinal):
+        """Moves the window forward to end at the given day, dropping the days that fall out of it."""
+        start = ordinal - self.window_days + 1
+        if self.window_start is not None and start <= self.window_start:
+            return
+        self.window_start = start
+
+        while self.day_heap and self.day_heap[0] < start:
+            day = heapq.heappop(self.day_heap)
+            for site, shift in self.days.pop(day):
+                for role, login in self.shifts.pop((site, day, shift), ()):
+                    self.decrement(login, role)
+
+    def unmark_day(self, login, role, ordinal):
+        """Removes one assignment on the given day and moves the last assignment date back if it was the latest."""
+        key = (login, role)
+        days = self.assigned_days[key]
+        days[ordinal] -= 1
+        if days[ordinal] <= 0:
+            del days[ordinal]
+        if not days:
+            del self.assigned_days[key]
+            del self.last_days[key]
+        elif self.last_days[key] == ordinal and ordinal not in days:
+            self.last_days[key] = max(days)
+
+    def decrement(self, login, role):
+        self.counts[(login, role)] -= 1
+        if self.counts[(login, role)] <= 0:
+            del self.counts[(login, role)]
@@ -1,5 +1,7 @@
 import os
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib3.exceptions import ProtocolError
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -7,62 +9,388 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.common.exceptions import (InvalidSessionIdException, TimeoutException,
-                                        StaleElementReferenceException, NoSuchElementException)
+                                        StaleElementReferenceException, NoSuchElementException,
+                                        JavascriptException, WebDriverException)
+from .instrumentation import timed
 from .interfaces import ScheduleFinderInterface
+from .session_store import SessionStore
+
+
+class SessionLost(Exception):
+    """Raised when a scrape step fails because the browser crashed or Midway logged the session out."""
+
+    def __init__(self, browser_alive):
+        super().__init__("logged out" if browser_alive else "browser closed")
+        self.browser_alive = browser_alive
+
+
+class RosterIncomplete(Exception):
+    """Raised when fewer roster rows were read than the page reports as its headcount."""
+
+
+SCRAPE_ERRORS = (TypeError, ProtocolError, InvalidSessionIdException, TimeoutException,
+                 StaleElementReferenceException, NoSuchElementException, SessionLost, RosterIncomplete)
+
+# Failures a step can recover from by running again on the same page
+RETRYABLE_ERRORS = (TimeoutException, StaleElementReferenceException, NoSuchElementException, ProtocolError,
+                    RosterIncomplete)
+
+# Reads the whole roster table in one WebDriver round trip instead of one per cell.
+ROSTER_TABLE_SCRIPT = """
+const body = document.querySelector(".roster-details-table-body");
+if (!body) {
+    return null;
+}
+const table = body.closest("table");
+const headers = table ? Array.from(table.querySelectorAll("thead th"), th => th.innerText.trim()) : [];
+const rows = Array.from(body.querySelectorAll("tr"),
+                        tr => Array.from(tr.querySelectorAll("td"), td => td.innerText.trim()));
+return {headers: headers, rows: rows};
+"""
+
+# Installed before any page script runs so in-flight fetch/XHR requests can be counted.
+NETWORK_TRACKER_SCRIPT = """
+(() => {
+    if (window.__koalityPending !== undefined) {
+        return;
+    }
+    window.__koalityPending = 0;
+    const done = () => { window.__koalityPending = Math.max(0, window.__koalityPending - 1); };
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function (...args) {
+            window.__koalityPending++;
+            return originalFetch.apply(this, args).finally(done);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        window.__koalityPending++;
+        this.addEventListener("loadend", done, {once: true});
+        return originalSend.apply(this, args);
+    };
+})();
+"""
+
+PAGE_IDLE_SCRIPT = """
+return document.readyState === "complete" && !window.__koalityPending;
+"""
+
+ROW_COUNT_SCRIPT = """
+return document.querySelectorAll(".roster-details-table-body tr").length;
+"""
+
+# Returns up to `limit` rendered rows that haven't been read yet, marking each row with the text it was read with
+# so recycled rows of a virtualized grid are read again once they show new content. When every rendered row has
+# been read, it scrolls the last row to the top (or clicks the next page button) so more rows render. With reset,
+# it only clears the marks and rewinds to the first page and the top of the table, since an earlier read may have
+# left the grid at its end.
+ROSTER_CHUNK_SCRIPT = """
+const [reset, limit, headcountSelector, nextPageSelector, firstPageSelector] = arguments;
+const body = document.querySelector(".roster-details-table-body");
+if (!body) {
+    return null;
+}
+const table = body.closest("table");
+const headers = table ? Array.from(table.querySelectorAll("thead th"), th => th.innerText.trim()) : [];
+const trs = body.querySelectorAll("tr");
+if (reset) {
+    trs.forEach(tr => { delete tr.dataset.koalityRead; });
+    const first = firstPageSelector ? document.querySelector(firstPageSelector) : null;
+    if (first && !first.disabled && first.getAttribute("aria-disabled") !== "true") {
+        first.click();
+    }
+    for (let element = body.parentElement; element; element = element.parentElement) {
+        element.scrollTop = 0;
+    }
+    return {headers: headers, rows: [], more: true, headcount: null, idle: false};
+}
+
+const rows = [];
+let pending = false;
+for (const tr of trs) {
+    const cells = Array.from(tr.querySelectorAll("td"), td => td.innerText.trim());
+    const key = cells.join("\\t");
+    if (tr.dataset.koalityRead === key) {
+        continue;
+    }
+    if (rows.length >= limit) {
+        pending = true;
+        break;
+    }
+    tr.dataset.koalityRead = key;
+    rows.push(cells);
+}
+
+let moved = false;
+const last = body.lastElementChild;
+if (!pending && last) {
+    const before = last.getBoundingClientRect().top;
+    last.scrollIntoView({block: "start"});
+    moved = Math.abs(last.getBoundingClientRect().top - before) > 1;
+    const next = !moved && nextPageSelector ? document.querySelector(nextPageSelector) : null;
+    if (next && !next.disabled && next.getAttribute("aria-disabled") !== "true") {
+        next.click();
+        moved = true;
+    }
+}
+
+const counter = headcountSelector ? document.querySelector(headcountSelector) : null;
+const match = counter ? counter.innerText.match(/\\d[\\d,]*/) : null;
+return {headers: headers, rows: rows, more: pending || moved,
+        headcount: match ? parseInt(match[0].replace(/,/g, ""), 10) : null,
+        idle: document.readyState === "complete" && !window.__koalityPending};
+"""
 
 
 class ScheduleFinder(ScheduleFinderInterface):
+    STEP_TIMEOUT = 10  # seconds for a single element to appear
+    RENDER_TIMEOUT = 30  # seconds for the roster table to render after a shift is selected
+    POLL_FREQUENCY = 0.1
+    STABLE_POLLS = 3  # consecutive polls with an unchanged row count before the table counts as rendered
+    EMPTY_POLLS = 10  # consecutive polls with no rows on an idle page before the roster counts as empty
+    STEP_RETRIES = 2  # extra attempts per step while the session is still alive
+    RETRY_BACKOFF = 0.5  # seconds before the first retry, doubling up to MAX_BACKOFF
+    MAX_BACKOFF = 4
+    CHUNK_SIZE = 500  # rows per round trip when reading incrementally
+    HEADCOUNT_SELECTOR = ".roster-details-headcount"  # element showing the shift's total headcount, if any
+    NEXT_PAGE_SELECTOR = ".roster-details-pagination [aria-label='Next page']"
+    FIRST_PAGE_SELECTOR = ".roster-details-pagination [aria-label='First page']"
+
+    def __init__(self, profile_dir=None, session_store=None, exporter=None, watchdog_interval=None,
+                 incremental=False):
+        self.profile_dir = profile_dir
+        self.session_store = session_store
+        self.exporter = exporter
+        self.incremental = incremental
+        self.watchdog = SessionWatchdog(self, watchdog_interval)
+
     def get_scheduled_associates(self, display):
-        """Main function to get scheduled AA logins for a given shift and date."""
-        if not display.driver:
-            need_attribute = True
-            driver = self.setup_webdriver()
+        """Main function to get scheduled AA logins for a given shift and date. The browser is left open and
+        watched until the next call."""
+        with self.watchdog.lock:
+            driver, logins = self.scrape_roster(display)
+        self.watchdog.watch(driver if logins else None)
+        return driver, logins
 
-            try:
-                self.login_to_site(driver, display)
+    def scrape_roster(self, display):
+        """Scrapes the display's shift, reusing its browser when the watchdog last saw the session working. A
+        browser the watchdog found dead is replaced and a logged-out one logs in again, without waiting for a step
+        to time out first."""
+        state = self.watchdog.state_of(display.driver)
+        if state == "dead":
+            DriverPool.quit(display.driver)
+            display.driver = None
 
-            except (TypeError, ProtocolError, InvalidSessionIdException, TimeoutException,
-                    StaleElementReferenceException, NoSuchElementException):
-                display.driver.quit()
+        if not display.driver:
+            need_attribute = True
+            if not self.start_session(display):
                 return None, None
         else:
             need_attribute = False
+            if state == "logged_out" and not self.recover_session(display, SessionLost(browser_alive=True)):
+                return self.abandon(display)
+
+        on_table = self.roster_export(display.site, display.date, display.shift)
+        for attempt in range(2):
+            try:
+                logins = self.fetch_roster(display.driver, display.date, display.shift, need_attribute,
+                                           display.report_progress, on_table)
+                return display.driver, logins
+            except SessionLost as lost:
+                if attempt or not self.recover_session(display, lost):
+                    break
+                need_attribute = need_attribute or not lost.browser_alive
+            except SCRAPE_ERRORS:
+                break
+
+        return self.abandon(display)
 
+    @staticmethod
+    def abandon(display):
+        """Quits the display's browser after a failed scrape."""
+        if display.driver:  # already gone if the user cancelled
+            DriverPool.quit(display.driver)
+            display.driver = None
+        return None, None
+
+    def recover_session(self, display, lost):
+        """Gets a working session back after SessionLost: logs in again on the same browser when it only logged
+        out, or starts a new browser when it crashed. Returns False if that failed or the user cancelled."""
+        if not display.driver:
+            return False
+        if lost.browser_alive:
+            display.report_progress("Session expired, logging in again...")
+            try:
+                self.login_to_site(display.driver, display)
+                return True
+            except SCRAPE_ERRORS:
+                return False
+
+        DriverPool.quit(display.driver)
+        display.driver = None
+        return self.start_session(display)
+
+    def get_rosters(self, display, shifts, max_workers=4):
+        """Fetches the rosters for several (date, shift) pairs concurrently over a bounded pool of headless drivers
+        that share the display's login. Returns {(date, shift): logins}, with None for any pair that failed."""
+        if not display.driver and not self.start_session(display):
+            return {pair: None for pair in shifts}
+
+        cookies = display.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        pool = DriverPool(self, [SessionStore.restorable(cookie) for cookie in cookies])
+
+        def fetch(pair):
+            try:
+                driver, need_attribute = pool.acquire()
+                return self.fetch_roster(driver, pair[0], pair[1], need_attribute,
+                                         on_table=self.roster_export(display.site, pair[0], pair[1]))
+            except SCRAPE_ERRORS + (WebDriverException,):  # includes a pool browser that failed to start
+                pool.discard()
+                return None
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(shifts)))) as executor:
+                return dict(zip(shifts, executor.map(fetch, shifts)))
+        finally:
+            pool.close()
+
+    def start_session(self, display):
+        """Starts a browser for the display and logs in. Returns False (and quits the browser) if login fails."""
+        display.report_progress("Starting browser...")
+        display.driver = self.setup_webdriver()
         try:
-            self.select_date(display.driver, display.date)
-            self.select_shift(display.driver,
-                              display.date.strftime("%a"),
-                              display.date.strftime("%b"),
-                              display.date.strftime("%d"),
-                              display.shift)
+            display.report_progress("Logging in...")
+            self.login_to_site(display.driver, display)
+            return True
+        except SCRAPE_ERRORS:
+            if display.driver:
+                display.driver.quit()
+            display.driver = None
+            return False
+
+    def roster_export(self, site, date, shift):
+        """Returns an on_table callback that streams the scraped table to the exporter, or None when exports are
+        off."""
+        if not self.exporter:
+            return None
+
+        def export(headers, rows):
+            self.exporter.export_roster(site, date, shift, self.rows_as_dicts(headers, rows))
 
-            if need_attribute:
-                self.open_attribute_panel(display.driver)
+        return export
 
-            logins = self.extract_logins(display.driver)
+    @timed
+    def fetch_roster(self, driver, date, shift, need_attribute, progress=None, on_table=None):
+        """Runs the scrape steps for one date and shift on an authenticated driver and returns the logins. on_table,
+        if given, is called with the roster table's headers and rows."""
+        progress = progress or (lambda message: None)
 
-            return display.driver, logins
+        progress("Selecting date...")
+        self.retry(driver, self.select_date, driver, date)
+        progress("Selecting shift...")
+        self.retry(driver, self.select_shift, driver, date.strftime("%a"), date.strftime("%b"), date.strftime("%d"),
+                   shift)
 
-        except (TypeError, ProtocolError, InvalidSessionIdException, TimeoutException,
-                StaleElementReferenceException, NoSuchElementException):
-            display.driver.quit()
-            return None, None
+        if need_attribute:
+            progress("Opening attribute panel...")
+            self.retry(driver, self.open_attribute_panel, driver)
 
-    def setup_webdriver(self):
-        """Sets up the Selenium WebDriver with required options."""
+        progress("Reading roster...")
+        return self.retry(driver, self.extract_logins, driver, on_table=self.unique_rows(on_table))
+
+    @staticmethod
+    def unique_rows(on_table):
+        """Wraps an on_table callback so rows already passed on aren't passed again when a read is retried."""
+        if not on_table:
+            return None
+        seen = set()
+
+        def filtered(headers, rows):
+            new_rows = []
+            for row in rows:
+                if tuple(row) not in seen:
+                    seen.add(tuple(row))
+                    new_rows.append(row)
+            if new_rows:
+                on_table(headers, new_rows)
+
+        return filtered
+
+    def retry(self, driver, step, *args, **kwargs):
+        """Runs a scrape step, running it again with bounded exponential backoff when it fails on a live session.
+        Raises SessionLost as soon as the browser is gone or logged out, since retrying can't help then."""
+        for attempt in range(self.STEP_RETRIES + 1):
+            try:
+                return step(*args, **kwargs)
+            except InvalidSessionIdException:
+                raise SessionLost(browser_alive=False)
+            except RETRYABLE_ERRORS:
+                state = self.session_state(driver)
+                if state != "ok":
+                    raise SessionLost(browser_alive=state == "logged_out")
+                if attempt == self.STEP_RETRIES:
+                    raise
+                time.sleep(min(self.MAX_BACKOFF, self.RETRY_BACKOFF * 2 ** attempt))
+
+    @staticmethod
+    def session_state(driver):
+        """Cheaply checks the session without waiting: "ok", "logged_out" (Midway's login form is showing) or
+        "dead" (the browser no longer answers)."""
+        try:
+            logged_out = any(element.is_displayed() for element in driver.find_elements(By.ID, "user_name"))
+        except (WebDriverException, ProtocolError):
+            return "dead"
+        return "logged_out" if logged_out else "ok"
+
+    @timed
+    def setup_webdriver(self, persistent=True):
+        """Sets up the Selenium WebDriver with required options. Pool drivers pass persistent=False since a profile
+        directory can only be open in one browser at a time."""
         chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_experimental_option("detach", True)
+        if self.profile_dir and persistent:
+            # A detached browser would outlive the app and keep the profile locked for the next launch
+            chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+        else:
+            chrome_options.add_experimental_option("detach", True)
         chrome_options.add_argument("--disable-notifications")
         chrome_options.add_argument("--headless")  # Remove for debugging
-        return webdriver.Chrome(options=chrome_options)
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_TRACKER_SCRIPT})
+        return driver
+
+    def wait(self, driver, timeout=None):
+        """Returns a WebDriverWait that polls quickly so each step proceeds as soon as it is ready."""
+        return WebDriverWait(driver, timeout=timeout or self.STEP_TIMEOUT, poll_frequency=self.POLL_FREQUENCY,
+                             ignored_exceptions=(StaleElementReferenceException,))
+
+    def wait_for_page_idle(self, driver, timeout=None):
+        """Waits until the document has loaded and no fetch/XHR requests are in flight."""
+        self.wait(driver, timeout).until(lambda d: d.execute_script(PAGE_IDLE_SCRIPT))
+
+    def wait_for_stable_rows(self, driver, timeout=None):
+        """Waits until the roster table's row count stops changing while the page is idle. No rows only counts as
+        an empty roster after EMPTY_POLLS polls, so a table that hasn't started rendering isn't taken for one."""
+        history = []
+
+        def rows_stable(d):
+            history.append(d.execute_script(ROW_COUNT_SCRIPT))
+            polls = self.STABLE_POLLS if history[-1] > 0 else self.EMPTY_POLLS
+            recent = history[-polls:]
+            return len(recent) == polls and len(set(recent)) == 1 and d.execute_script(PAGE_IDLE_SCRIPT)
 
+        self.wait(driver, timeout or self.RENDER_TIMEOUT).until(rows_stable)
+
+    @timed
     def login_to_site(self, driver, display):
-        """Logs in to the website using OS login and the provided credentials."""
-        wait = WebDriverWait(driver, timeout=10)
-        driver.get(os.getenv('MIDWAY'))
+        """Logs in to the website using OS login and the provided credentials, unless the saved session is still
+        valid."""
+        self.restore_session(driver)
+        if self.session_is_valid(driver):
+            return
 
+        wait = self.wait(driver)
         login = os.getlogin()
-        wait.until(ec.visibility_of_element_located((By.ID, "user_name")))
         driver.find_element(By.ID, "user_name").send_keys(login)
 
         pin = display.midway_pin()
@@ -73,59 +401,174 @@ class ScheduleFinder(ScheduleFinderInterface):
         driver.find_element(By.ID, "verify_btn").click()
 
         wait.until(lambda d: f"Welcome {login}" in d.find_element(By.TAG_NAME, "h1").text)
+        self.save_session(driver)
+
+    def session_is_valid(self, driver):
+        """Loads Midway once and reports whether it shows the welcome banner (valid) or the login form (expired)."""
+        login = os.getlogin()
+        driver.get(os.getenv('MIDWAY'))
+
+        def session_state(d):
+            if any(element.is_displayed() for element in d.find_elements(By.ID, "user_name")):
+                return "login"
+            if any(f"Welcome {login}" in element.text for element in d.find_elements(By.TAG_NAME, "h1")):
+                return "valid"
+            return False
+
+        return self.wait(driver).until(session_state) == "valid"
 
+    def restore_session(self, driver):
+        """Loads saved cookies into the browser so a still-valid session skips the login prompts."""
+        if not self.session_store:
+            return
+        cookies = self.session_store.load()
+        if cookies:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+    def save_session(self, driver):
+        """Saves the browser's cookies after a successful login."""
+        if self.session_store:
+            self.session_store.save(driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"])
+
+    @timed
     def select_date(self, driver, date):
         """Selects the date in the date picker."""
-        wait = WebDriverWait(driver, timeout=10)
         driver.get(os.getenv('SITE_URL'))
-        wait.until(ec.visibility_of_element_located((By.ID, "date-picker")))
+        date_entry = self.wait(driver).until(ec.element_to_be_clickable((By.ID, "date-picker")))
 
+        # Re-enter the date only if the picker didn't take it the first time
+        for _ in range(2):
+            self.enter_date(driver, date_entry, date)
+            try:
+                self.wait(driver, timeout=2).until(lambda d: self.date_entered(date_entry, date))
+                break
+            except TimeoutException:
+                date_entry = driver.find_element(By.ID, "date-picker")
+
+    def enter_date(self, driver, date_entry, date):
+        """Types the date into the segmented date picker and moves focus off it to apply it."""
         month_num = date.month
         day = date.day
         year = date.strftime("%Y")
 
-        # Enter the date twice to avoid issues
-        for _ in range(2):
-            date_entry = driver.find_element(By.ID, "date-picker")
-            date_entry.send_keys(month_num)
-            if month_num == 1:
-                date_entry.send_keys(Keys.TAB)
-            date_entry.send_keys(day)
-            if day <= 3:
-                date_entry.send_keys(Keys.TAB)
-            date_entry.send_keys(year)
+        date_entry.send_keys(month_num)
+        if month_num == 1:
+            date_entry.send_keys(Keys.TAB)
+        date_entry.send_keys(day)
+        if day <= 3:
+            date_entry.send_keys(Keys.TAB)
+        date_entry.send_keys(year)
 
-            driver.find_element(By.ID, "schedule-timeline-current-week-text").click()
+        driver.find_element(By.ID, "schedule-timeline-current-week-text").click()
 
+    @staticmethod
+    def date_entered(date_entry, date):
+        """Checks whether the date picker holds the requested date."""
+        value = date_entry.get_attribute("value") or ""
+        return value in (date.strftime("%Y-%m-%d"), date.strftime("%m/%d/%Y"), date.strftime("%m-%d-%Y"))
+
+    @timed
     def select_shift(self, driver, day_of_week, month, day_decimal, shift):
         """Clicks the shift button for the given date and shift."""
-        wait = WebDriverWait(driver, timeout=10)
-        wait.until(ec.visibility_of_element_located((By.ID, f"time-cell-{day_of_week}-{month}-{day_decimal}-{shift}")))
-        driver.find_element(By.ID, f"time-cell-{day_of_week}-{month}-{day_decimal}-{shift}").click()
+        time_cell = (By.ID, f"time-cell-{day_of_week}-{month}-{day_decimal}-{shift}")
+        self.wait(driver).until(ec.element_to_be_clickable(time_cell)).click()
 
+    @timed
     def open_attribute_panel(self, driver):
-        """Opens the attribute panel and unchecks the unnecessary checkboxes."""
-        wait_long = WebDriverWait(driver, timeout=60)
-        wait_long.until(ec.visibility_of_element_located((By.CLASS_NAME, "display-attribute")))
-        attribute_button = driver.find_element(By.CLASS_NAME, "display-attribute")
-        driver.execute_script("arguments[0].scrollIntoView(true);", attribute_button)
-        attribute_button.click()
+        """Opens the attribute panel and unchecks the unnecessary checkboxes. Safe to run again after a failure
+        part way: an already open panel is reused and checkboxes already unchecked are left alone."""
+        if not any(panel.is_displayed() for panel in driver.find_elements(By.ID, "roster-details-multi-checkbox")):
+            attribute_button = self.wait(driver, self.RENDER_TIMEOUT).until(
+                ec.element_to_be_clickable((By.CLASS_NAME, "display-attribute")))
+            driver.execute_script("arguments[0].scrollIntoView(true);", attribute_button)
+            attribute_button.click()
 
         # Uncheck the required checkboxes
-        wait = WebDriverWait(driver, timeout=10)
-        wait.until(ec.visibility_of_element_located((By.ID, "roster-details-multi-checkbox")))
+        self.wait(driver).until(ec.visibility_of_element_located((By.ID, "roster-details-multi-checkbox")))
         checkboxes = driver.find_elements(By.CSS_SELECTOR, "#roster-details-multi-checkbox div input")
         click = [0, 3, 5, 6, 7, 9, 10, 11, 12]
         for num in click:
-            checkboxes[num].click()
+            if checkboxes[num].is_selected():
+                checkboxes[num].click()
 
         driver.find_element(By.ID, "roster-details-multi-checkbox-modal-submit-button").click()
-        time.sleep(1)
+        self.wait(driver).until(ec.invisibility_of_element_located((By.ID, "roster-details-multi-checkbox")))
+        self.wait_for_page_idle(driver)
+
+    @timed
+    def extract_logins(self, driver, bulk=True, on_table=None):
+        """Extracts the scheduled associate logins from the table. on_table only sees the table when it is read in
+        bulk or incrementally."""
+        self.wait_for_stable_rows(driver)
+        if bulk and self.incremental:
+            try:
+                return self.extract_logins_incremental(driver, on_table)
+            except JavascriptException:
+                pass
+        elif bulk:
+            try:
+                table = self.read_roster_table(driver)
+            except JavascriptException:
+                table = None
+            if table is not None:
+                if on_table:
+                    on_table(*table)
+                return self.logins_from_rows(table[1])
+        return self.extract_logins_per_element(driver)
+
+    def extract_logins_incremental(self, driver, on_table=None):
+        """Reads the table in chunks, scrolling or paging until no new rows render, for grids that only render the
+        rows in view. Rows are deduplicated as they come and passed to on_table(headers, new_rows) chunk by chunk.
+        Raises RosterIncomplete if fewer rows were read than the page's headcount."""
+        seen = set()
+        logins = set()
+        ended = False  # an empty cell ends the logins, as in the other paths
+        headcount = None
+        quiet = 0
+        reset = True
+        deadline = time.monotonic() + self.RENDER_TIMEOUT
+
+        while quiet < self.STABLE_POLLS:
+            chunk = driver.execute_script(ROSTER_CHUNK_SCRIPT, reset, self.CHUNK_SIZE, self.HEADCOUNT_SELECTOR,
+                                          self.NEXT_PAGE_SELECTOR, self.FIRST_PAGE_SELECTOR)
+            if chunk is None:
+                if reset:
+                    return set()  # no table on an idle page: nobody is scheduled
+                raise NoSuchElementException("Roster table not found")
+            reset = False
+            if chunk["headcount"] is not None:
+                headcount = chunk["headcount"]
 
-    def extract_logins(self, driver):
-        """Extracts the scheduled associate logins from the table."""
-        wait_long = WebDriverWait(driver, timeout=60)
-        wait_long.until(ec.visibility_of_element_located((By.CLASS_NAME, "display-attribute")))
+            new_rows = []
+            for row in chunk["rows"]:
+                key = tuple(row)
+                if key not in seen:
+                    seen.add(key)
+                    new_rows.append(row)
+            if new_rows and on_table:
+                on_table(chunk["headers"], new_rows)
+            for row in new_rows:
+                for cell in row:
+                    if ended or cell == "":
+                        ended = True
+                        break
+                    logins.add(cell)
+
+            if chunk["rows"] or chunk["more"] or not chunk["idle"]:
+                quiet = 0
+            else:
+                quiet += 1
+            if time.monotonic() > deadline:
+                raise TimeoutException("Roster table kept changing")
+            if not chunk["rows"] and quiet < self.STABLE_POLLS:
+                time.sleep(self.POLL_FREQUENCY)  # give the grid a moment to render after scrolling
+
+        if headcount is not None and len(seen) < headcount:
+            raise RosterIncomplete(f"Read {len(seen)} of {headcount} roster rows")
+        return logins
+
+    def extract_logins_per_element(self, driver):
+        """Extracts logins cell by cell. Slow (one round trip per cell) but doesn't rely on JavaScript."""
         elements = driver.find_elements(By.CSS_SELECTOR, ".roster-details-table-body tr td")
         logins = set()
         for element in elements:
@@ -134,3 +577,160 @@ class ScheduleFinder(ScheduleFinderInterface):
             else:
                 break
         return logins
+
+    def extract_roster(self, driver):
+        """Returns the roster as a list of dicts keyed by column header, one per table row."""
+        table = self.read_roster_table(driver)
+        if table is None:
+            return []
+        return list(self.rows_as_dicts(*table))
+
+    @classmethod
+    def rows_as_dicts(cls, headers, rows):
+        """Yields each table row as a dict keyed by column header."""
+        for row in rows:
+            yield {cls.column_name(headers, index): value for index, value in enumerate(row)}
+
+    def read_roster_table(self, driver):
+        """Reads the roster table's headers and cell text with a single execute_script call."""
+        table = driver.execute_script(ROSTER_TABLE_SCRIPT)
+        if not table:
+            return None
+        return table["headers"], table["rows"]
+
+    @staticmethod
+    def logins_from_rows(rows):
+        """Collects cell text in table order up to the first empty cell, matching the per-element path."""
+        logins = set()
+        for row in rows:
+            for cell in row:
+                if cell == "":
+                    return logins
+                logins.add(cell)
+        return logins
+
+    @staticmethod
+    def column_name(headers, index):
+        """Returns the header for a column, falling back to its position when the header is blank or missing."""
+        if index < len(headers) and headers[index]:
+            return headers[index]
+        return f"column_{index}"
+
+
+class SessionWatchdog:
+    """Keeps an eye on the browser left open between Generates.
+
+    Every interval seconds it probes the watched driver with one round trip and no navigation, which is enough to
+    notice a crashed browser or Midway's login form. Once the session hasn't been verified for refresh_interval
+    seconds, it reloads Midway instead, which keeps the session alive and saves the renewed cookies. Scrapes hold
+    lock, so a probe never runs in the middle of one. Without an interval nothing runs in the background and the
+    state is whatever the last scrape left."""
+
+    def __init__(self, schedule_finder, interval=None, refresh_interval=600):
+        self.schedule_finder = schedule_finder
+        self.interval = interval
+        self.refresh_interval = refresh_interval
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.driver = None
+        self.state = None
+        self.verified_at = 0
+
+    def watch(self, driver):
+        """Starts watching a driver whose session just worked, or stops watching with None."""
+        self.driver = driver
+        self.state = "ok" if driver else None
+        self.verified_at = time.monotonic()
+        if driver and self.interval and not self.thread:
+            self.thread = threading.Thread(target=self.run, name="session-watchdog", daemon=True)
+            self.thread.start()
+
+    def state_of(self, driver):
+        """Returns the last known state of driver: "ok", "logged_out" or "dead", or None if it isn't watched."""
+        if driver is None or driver is not self.driver:
+            return None
+        return self.state
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.check()
+
+    def check(self):
+        """Probes the watched driver once. Skipped while a scrape holds the lock."""
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            driver = self.driver
+            if driver is None or self.state != "ok":
+                return
+            state = self.schedule_finder.session_state(driver)
+            if state == "ok" and time.monotonic() - self.verified_at >= self.refresh_interval:
+                state = self.refresh(driver)
+            self.state = state
+        finally:
+            self.lock.release()
+
+    def refresh(self, driver):
+        """Reloads Midway to extend the session and saves its cookies. Returns the session state."""
+        try:
+            if not self.schedule_finder.session_is_valid(driver):
+                return "logged_out"
+        except (WebDriverException, ProtocolError):
+            return self.schedule_finder.session_state(driver)
+        self.schedule_finder.save_session(driver)
+        self.verified_at = time.monotonic()
+        return "ok"
+
+    def stop(self):
+        """Stops the background probes."""
+        self.stopped.set()
+
+
+class DriverPool:
+    """Headless drivers for concurrent roster fetches, one per worker thread, authenticated with shared cookies."""
+
+    def __init__(self, schedule_finder, cookies):
+        self.schedule_finder = schedule_finder
+        self.cookies = cookies
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.drivers = []
+
+    def acquire(self):
+        """Returns this thread's driver and whether it still needs the attribute panel set up."""
+        driver = getattr(self.local, "driver", None)
+        if driver:
+            return driver, False
+
+        driver = self.schedule_finder.setup_webdriver(persistent=False)
+        self.local.driver = driver  # registered first so discard() can quit it if setting the cookies fails
+        with self.lock:
+            self.drivers.append(driver)
+        if self.cookies:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": self.cookies})
+        return driver, True
+
+    def discard(self):
+        """Quits this thread's driver after a failed fetch so the next fetch starts on a fresh one."""
+        driver = getattr(self.local, "driver", None)
+        self.local.driver = None
+        if driver:
+            with self.lock:
+                self.drivers.remove(driver)
+            self.quit(driver)
+
+    def close(self):
+        """Quits every driver in the pool."""
+        with self.lock:
+            drivers, self.drivers = self.drivers, []
+        for driver in drivers:
+            self.quit(driver)
+
+    @staticmethod
+    def quit(driver):
+        """Quits a driver, ignoring errors from a browser that already crashed."""
+        try:
+            driver.quit()
+        except (WebDriverException, ProtocolError):
+            pass
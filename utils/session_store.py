@@ -0,0 +1,46 @@
+import os
+import json
+import tempfile
+
+# Fields accepted by the DevTools Network.setCookies command.
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+
+class SessionStore:
+    """Saved cookie jar for an authenticated browser session, kept in the user's config folder."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    def load(self):
+        """Returns the saved cookies, or an empty list if there are none or the file is unreadable."""
+        try:
+            with open(self.file_path, "r") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return []
+
+    def save(self, cookies):
+        """Saves cookies as returned by Network.getAllCookies, keeping only the fields needed to restore them."""
+        cookies = [self.restorable(cookie) for cookie in cookies]
+        # mkstemp creates the file readable by the user only, with a name no other process is writing to
+        fd, temp_file_path = tempfile.mkstemp(dir=os.path.dirname(self.file_path) or ".",
+                                              prefix=f"{os.path.basename(self.file_path)}.", suffix=".tmp")
+        with os.fdopen(fd, "w") as file:
+            json.dump(cookies, file)
+        os.replace(temp_file_path, self.file_path)
+
+    def clear(self):
+        """Deletes the saved cookies so the next launch logs in from scratch."""
+        try:
+            os.remove(self.file_path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def restorable(cookie):
+        """Strips a DevTools cookie down to the fields Network.setCookies accepts. Session cookies have no expiry."""
+        cookie = {key: cookie[key] for key in COOKIE_FIELDS if key in cookie}
+        if cookie.get("expires", -1) < 0:
+            cookie.pop("expires", None)
+        return cookie